@@ -0,0 +1,85 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of checking the constraints of a network.
+
+Constraints are checked serially, in worker processes, with a warm result
+cache and after one artifact was edited.  The network is the one of
+`bench_constraint_manager.py`.
+
+Usage: PYTHONPATH=src python benchmarks/bench_check_constraints.py
+"""
+
+import os
+import argparse
+import time
+from tempfile import TemporaryDirectory
+
+from bench_constraint_manager import create_network
+from cfgnet.constraints.constraint_cache import ConstraintCache
+from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.network.nodes import ArtifactNode
+
+
+def check(network, jobs: int, cache_path: str = None):
+    cache = None
+    if cache_path:
+        cache = ConstraintCache(cache_path)
+        cache.load()
+
+    start = time.perf_counter()
+    violations = ConstraintManager().check_network_constraints(
+        network, jobs=jobs, cache=cache
+    )
+    elapsed = time.perf_counter() - start
+
+    if cache:
+        cache.save()
+    return violations, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--values", type=int, default=100000, help="number of value nodes"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=4, help="number of worker processes"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        network = create_network(root_dir, args.values)
+        cache_path = os.path.join(root_dir, "constraints.json")
+
+        violations, serial = check(network, 1)
+        parallel_violations, parallel = check(network, args.jobs)
+        assert len(parallel_violations) == len(violations)
+        check(network, 1, cache_path)
+        _, cached = check(network, 1, cache_path)
+
+        artifact = next(iter(network.get_nodes(ArtifactNode)))
+        artifact.get_nodes()[0].name = "edited"
+        _, edited = check(network, 1, cache_path)
+
+        print(f"violations:     {len(violations)}")
+        print(f"serial:         {serial:.3f} s")
+        print(f"jobs={args.jobs}:         {parallel:.3f} s")
+        print(f"cached:         {cached:.3f} s")
+        print(f"one edited:     {edited:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
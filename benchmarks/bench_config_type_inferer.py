@@ -0,0 +1,108 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the config type inference.
+
+The corpus consists of the option names and values of all configuration
+files below a directory, by default the test files of this repository.
+The corpus is classified once per simulated commit, as in an analysis of
+a history in which most files do not change.
+
+Usage: PYTHONPATH=src python benchmarks/bench_config_type_inferer.py
+"""
+
+import os
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
+from cfgnet.network.nodes import OptionNode
+from cfgnet.plugins.plugin_manager import PluginManager
+
+
+def load_corpus(root_dir: str) -> List[Tuple[str, str]]:
+    plugins = PluginManager.get_plugins()
+    pairs = []
+    for dir_path, _, files in os.walk(root_dir):
+        for file in sorted(files):
+            abs_file_path = os.path.abspath(os.path.join(dir_path, file))
+            plugin = PluginManager.get_responsible_plugin(
+                plugins, abs_file_path
+            )
+            if plugin is None:
+                continue
+            try:
+                artifact = plugin.parse_file(
+                    abs_file_path=abs_file_path, rel_file_path=file, root=None
+                )
+            except Exception:  # pylint: disable=broad-except
+                continue
+            pairs.extend(
+                (value.parent.name, value.name)
+                for value in artifact.get_nodes()
+                if isinstance(value.parent, OptionNode)
+            )
+    return pairs
+
+
+def measure(run: Callable[[], None], commits: int) -> float:
+    start = time.perf_counter()
+    for _ in range(commits):
+        run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--root", default="tests", help="directory with configuration files"
+    )
+    parser.add_argument(
+        "--commits", type=int, default=200, help="number of commits"
+    )
+    args = parser.parse_args()
+
+    pairs = load_corpus(args.root)
+    print(f"pairs: {len(pairs)} ({len(set(pairs))} distinct)")
+
+    def single() -> None:
+        for option_name, value in pairs:
+            ConfigTypeInferer.get_config_type(option_name, value)
+
+    def batch() -> None:
+        ConfigTypeInferer.get_config_types(pairs)
+
+    cache_size = ConfigTypeInferer.cache_size
+    ConfigTypeInferer.set_cache_size(0)
+    uncached = measure(single, args.commits)
+    batched = measure(batch, args.commits)
+    ConfigTypeInferer.set_cache_size(cache_size)
+    cached = measure(single, args.commits)
+    info = ConfigTypeInferer.cache_info()
+
+    total = len(pairs) * args.commits
+    print(f"{'mode':<10} {'time [s]':>10} {'us/pair':>9}")
+    for mode, elapsed in (
+        ("uncached", uncached),
+        ("batch", batched),
+        ("cached", cached),
+    ):
+        print(f"{mode:<10} {elapsed:>10.3f} {elapsed / total * 1e6:>9.2f}")
+    print(f"cache: {info['hits']} hits, {info['misses']} misses")
+
+
+if __name__ == "__main__":
+    main()
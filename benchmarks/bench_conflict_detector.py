@@ -0,0 +1,82 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the conflict detection.
+
+Each option of an artifact is linked to the same option of the next
+artifact.  In the modified network, the values of half of the options of
+every other artifact change, so half of the links break and most modified
+options are the cause of two conflicts that have to be merged.
+
+Usage: PYTHONPATH=src python benchmarks/bench_conflict_detector.py
+"""
+
+import argparse
+import time
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.conflicts.conflict_detector import ConflictDetector
+from cfgnet.network.network import Network
+from common import ValueSpec, create_network, link_next_artifact
+
+OPTIONS_PER_ARTIFACT = 100
+
+
+def create_revision(root_dir: str, links: int, modified: bool) -> Network:
+    def values(i: int) -> Iterator[ValueSpec]:
+        for j in range(OPTIONS_PER_ARTIFACT):
+            name = f"value{j}"
+            if modified and i % 2 == 0 and j < OPTIONS_PER_ARTIFACT // 2:
+                name = f"changed{j}"
+            yield [(f"option{j}", f"{j}")], ConfigType.UNKNOWN, name
+
+    artifacts = links // OPTIONS_PER_ARTIFACT + 1
+    network = create_network(
+        root_dir, artifacts, values, enable_all_conflicts=True
+    )
+    link_next_artifact(network, equal_only=True)
+
+    return network
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--links", type=int, default=100000, help="number of links"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        ref_network = create_revision(root_dir, args.links, modified=False)
+        new_network = create_revision(root_dir, args.links, modified=True)
+
+        start = time.perf_counter()
+        conflicts = ConflictDetector.detect(
+            ref_network, new_network, enable_all_conflicts=True
+        )
+        detection = time.perf_counter() - start
+
+        missing_links = len(ref_network.links) - len(new_network.links)
+        print(f"links:         {len(ref_network.links)}")
+        print(f"missing links: {missing_links}")
+        print(f"conflicts:     {len(conflicts)}")
+        print(f"detection:     {detection:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the detection of constraint types.
+
+Artifacts of several concepts, some of which override constraints, contain
+options of different config types.  Every third value violates the
+constraint of its option.
+
+Usage: PYTHONPATH=src python benchmarks/bench_constraint_manager.py
+"""
+
+import argparse
+import time
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.network.nodes import ValueNode
+from common import ValueSpec, create_network
+
+OPTIONS_PER_ARTIFACT = 100
+CONCEPTS = ["poetry", "travis", "cypress", "maven"]
+# config type, valid value and invalid value
+OPTION_TYPES = [
+    (ConfigType.PORT, "8080", "70000"),
+    (ConfigType.NUMBER, "42", "4x2"),
+    (ConfigType.SIZE, "512MB", "512"),
+    (ConfigType.TIME, "10s", "ten"),
+    (ConfigType.PATH, "src/main.py", "*"),
+    (ConfigType.VERSION_NUMBER, "1.2.3", "latest"),
+    (ConfigType.BOOLEAN, "true", "maybe"),
+    (ConfigType.URL, "https://example.com", "example"),
+    (ConfigType.NAME, "server", "#?"),
+    (ConfigType.UNKNOWN, "value", "value"),
+]
+
+
+def values(i: int) -> Iterator[ValueSpec]:
+    for j in range(OPTIONS_PER_ARTIFACT):
+        config_type, valid, invalid = OPTION_TYPES[j % len(OPTION_TYPES)]
+        value = invalid if (i + j) % 3 == 0 else valid
+        yield [(f"option{j}", f"{j}")], config_type, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--values", type=int, default=100000, help="number of value nodes"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        artifacts = max(1, args.values // OPTIONS_PER_ARTIFACT)
+        network = create_network(
+            root_dir,
+            artifacts,
+            values,
+            concept=lambda i: CONCEPTS[i % len(CONCEPTS)],
+        )
+
+        start = time.perf_counter()
+        templates = ConstraintManager().get_option_constraint_type(network)
+        elapsed = time.perf_counter() - start
+
+        nodes = len(network.get_nodes(ValueNode))
+        print(f"value nodes: {nodes}")
+        print(f"templates:   {len(templates)}")
+        print(f"time:        {elapsed:.3f} s")
+        print(f"per node:    {elapsed / nodes * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
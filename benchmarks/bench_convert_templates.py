@@ -0,0 +1,88 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of converting changed constraint templates into conflicts.
+
+Each artifact has options whose values satisfy one constraint type in the
+reference network and, for every tenth option, another one in the new
+network.  The conversion is timed for growing numbers of templates.
+
+Usage: PYTHONPATH=src python benchmarks/bench_convert_templates.py
+"""
+
+import argparse
+import time
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.constraints.constraint_template import ConstraintTemplate
+from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
+
+OPTIONS_PER_ARTIFACT = 100
+CHANGED_EVERY = 10
+
+
+def create_templates(size: int):
+    old_templates = set()
+    new_templates = set()
+    for i in range(max(1, size // OPTIONS_PER_ARTIFACT)):
+        file = f"dir{i}/config{i}.properties"
+        artifact = ArtifactNode(
+            file_path=f"/bench/{file}",
+            rel_file_path=file,
+            concept_name="maven",
+        )
+        for j in range(OPTIONS_PER_ARTIFACT):
+            option = OptionNode(f"option{j}", f"{j}", ConfigType.PORT)
+            artifact.add_child(option)
+            value = ValueNode(name="8080")
+            option.add_child(value)
+            old_templates.add(
+                ConstraintTemplate(artifact, option, value, "port")
+            )
+            new_type = "number" if j % CHANGED_EVERY == 0 else "port"
+            new_templates.add(
+                ConstraintTemplate(artifact, option, value, new_type)
+            )
+    return old_templates, new_templates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default="1000,2000,4000,8000",
+        help="comma separated numbers of templates",
+    )
+    args = parser.parse_args()
+
+    print(f"{'templates':>10} {'conflicts':>10} {'time [s]':>10}")
+    for size in [int(size) for size in args.sizes.split(",")]:
+        old_templates, new_templates = create_templates(size)
+
+        start = time.perf_counter()
+        conflicts = ConstraintManager().convert_templates_to_conflicts(
+            old_templates, new_templates
+        )
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{len(old_templates):>10} {len(conflicts):>10} "
+            f"{elapsed:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
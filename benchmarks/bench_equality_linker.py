@@ -0,0 +1,86 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the equality linker on synthetic networks.
+
+Each artifact contains a fixed number of options with one value each.
+Values are drawn from a pool that grows with the network, so that every
+value occurs in a handful of artifacts.  With the hash index, the linking
+time per value node should stay roughly constant.
+
+Usage: PYTHONPATH=src python benchmarks/bench_equality_linker.py
+"""
+
+import argparse
+import random
+import time
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.linker_manager import LinkerManager
+from cfgnet.network.network import Network
+from cfgnet.network.nodes import ValueNode
+from common import ValueSpec, create_network
+
+OPTIONS_PER_ARTIFACT = 50
+VALUES_PER_NAME = 4
+CONFIG_TYPES = [ConfigType.PORT, ConfigType.PATH, ConfigType.VERSION_NUMBER]
+
+
+def create_linked_network(root_dir: str, value_nodes: int) -> Network:
+    rand = random.Random(0)
+    pool = max(1, value_nodes // VALUES_PER_NAME)
+
+    def values(_: int) -> Iterator[ValueSpec]:
+        for j in range(OPTIONS_PER_ARTIFACT):
+            config_type = CONFIG_TYPES[j % len(CONFIG_TYPES)]
+            name = f"value{rand.randrange(pool)}"
+            yield [(f"option{j}", f"{j}")], config_type, name
+
+    artifacts = max(1, value_nodes // OPTIONS_PER_ARTIFACT)
+    return create_network(root_dir, artifacts, values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[5000, 10000, 20000, 40000, 80000],
+        help="numbers of value nodes",
+    )
+    args = parser.parse_args()
+
+    print(f"{'value nodes':>12} {'links':>10} {'time [s]':>10} {'us/node':>9}")
+    with TemporaryDirectory() as root_dir:
+        for size in args.sizes:
+            network = create_linked_network(root_dir, size)
+            nodes = len(network.get_nodes(ValueNode))
+
+            start = time.perf_counter()
+            LinkerManager.apply_linkers(network)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{nodes:>12} {len(network.links):>10} {elapsed:>10.3f} "
+                f"{elapsed / nodes * 1e6:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of saving and loading a network.
+
+A synthetic network with links between equal values is saved as a single
+pickle file and into a network store.  The benchmark reports the time
+needed to save and load the whole network from both, as well as the time
+needed to load only the nodes or the nodes and links from the store.
+
+Usage: PYTHONPATH=src python benchmarks/bench_network_store.py
+"""
+
+import argparse
+import os
+import pickle
+import time
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.network.network_store import NetworkStore
+from cfgnet.network.nodes import Node
+from common import ValueSpec, create_network, link_next_artifact
+
+SECTIONS = 10
+OPTIONS_PER_SECTION = 10
+VALUE_NAMES = ["true", "false", "8080", "localhost", "1.0.0", "/usr/bin"]
+FILE_NAME = "services/service{i}/config/application.yml"
+
+
+def values(i: int) -> Iterator[ValueSpec]:
+    for j in range(SECTIONS):
+        for k in range(OPTIONS_PER_SECTION):
+            path = [(f"section{j}", str(j)), (f"option{k}", str(k))]
+            name = VALUE_NAMES[(i + j + k) % len(VALUE_NAMES)]
+            yield path, ConfigType.UNKNOWN, f"{name}{j}"
+
+
+def measure(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--artifacts", type=int, default=500, help="number of artifacts"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        network = create_network(
+            root_dir, args.artifacts, values, FILE_NAME, lambda i: "spring"
+        )
+        link_next_artifact(network)
+        pickle_file = os.path.join(root_dir, "network.pickle")
+        store = NetworkStore(os.path.join(root_dir, "network.sqlite"))
+
+        def save_pickle() -> None:
+            with open(pickle_file, "wb") as file:
+                pickle.dump(network, file)
+
+        def load_pickle() -> None:
+            with open(pickle_file, "rb") as file:
+                # registries are rebuilt on first use
+                assert pickle.load(file).nodes
+
+        pickle_save = measure(save_pickle)
+        pickle_load = measure(load_pickle)
+        store_save = measure(lambda: store.save(network))
+        store_load = measure(store.load)
+        nodes_load = measure(lambda: store.load(parts=[]))
+        links_load = measure(lambda: store.load(parts=["links"]))
+
+        print(f"nodes:              {len(network.get_nodes(Node))}")
+        print(f"links:              {len(network.links)}")
+        print(f"pickle size:        {os.path.getsize(pickle_file)} bytes")
+        print(f"store size:         {os.path.getsize(store.db_path)} bytes")
+        print(f"pickle save:        {pickle_save:.3f} s")
+        print(f"store save:         {store_save:.3f} s")
+        print(f"pickle load:        {pickle_load:.3f} s")
+        print(f"store load (all):   {store_load:.3f} s")
+        print(f"store load (nodes): {nodes_load:.3f} s")
+        print(f"store load (links): {links_load:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the memory used by the nodes of a network.
+
+A synthetic network with nested options is created while tracemalloc
+traces allocations.  The benchmark reports the traced bytes per node in
+memory and the size of the pickled network per node, as well as the time
+needed to pickle and load the network.
+
+Usage: PYTHONPATH=src python benchmarks/bench_node_memory.py
+"""
+
+import argparse
+import gc
+import pickle
+import time
+import tracemalloc
+from tempfile import TemporaryDirectory
+
+from typing import Iterator
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.network.nodes import Node
+from common import ValueSpec, create_network
+
+SECTIONS = 10
+OPTIONS_PER_SECTION = 10
+VALUE_NAMES = ["true", "false", "8080", "localhost", "1.0.0", "/usr/bin"]
+FILE_NAME = "services/service{i}/config/application.yml"
+
+
+def values(i: int) -> Iterator[ValueSpec]:
+    for j in range(SECTIONS):
+        for k in range(OPTIONS_PER_SECTION):
+            path = [(f"section{j}", str(j)), ("server", str(j))]
+            path.append((f"option{k}", str(k)))
+            name = VALUE_NAMES[(i + j + k) % len(VALUE_NAMES)]
+            yield path, ConfigType.UNKNOWN, name
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--artifacts", type=int, default=500, help="number of artifacts"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        gc.collect()
+        tracemalloc.start()
+        network = create_network(
+            root_dir, args.artifacts, values, FILE_NAME, lambda i: "spring"
+        )
+        gc.collect()
+        traced, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        nodes = len(network.get_nodes(Node))
+
+        start = time.perf_counter()
+        data = pickle.dumps(network, protocol=pickle.HIGHEST_PROTOCOL)
+        dump_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pickle.loads(data)
+        load_time = time.perf_counter() - start
+
+        print(f"nodes:              {nodes}")
+        print(f"memory per node:    {traced / nodes:.1f} bytes")
+        print(f"pickle per node:    {len(data) / nodes:.1f} bytes")
+        print(f"pickle time:        {dump_time:.3f} s")
+        print(f"load time:          {load_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Benchmark of the enumeration of tracked files.
+
+A synthetic repository with nested directories is committed once, then
+the git index backend (`git ls-files`) and the GitPython tree walk list its
+files, and the configuration files of the network are collected.
+
+Usage: PYTHONPATH=src python benchmarks/bench_tracked_files.py
+"""
+
+import argparse
+import os
+import time
+from tempfile import TemporaryDirectory
+
+from git import Repo
+
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.ignorefile import IgnoreFile
+from cfgnet.vcs.git import Git
+
+FILES_PER_DIR = 50
+CONFIG_FILES = ["pom.xml", "package.json", "Dockerfile", "application.yml"]
+
+
+def create_repository(root_dir: str, files: int) -> None:
+    repo = Repo.init(root_dir)
+    repo.git.config("user.name", "bench")
+    repo.git.config("user.email", "bench")
+
+    for i in range(files):
+        directory = os.path.join(
+            root_dir, f"module{i // 5000}", f"pkg{i // 500}", f"dir{i // 50}"
+        )
+        if i % FILES_PER_DIR == 0:
+            os.makedirs(directory, exist_ok=True)
+
+        if i % 1000 == 0:
+            file_name = CONFIG_FILES[(i // 1000) % len(CONFIG_FILES)]
+        else:
+            file_name = f"Source{i}.java"
+
+        with open(
+            os.path.join(directory, file_name), "w", encoding="utf-8"
+        ) as file:
+            file.write("")
+
+    repo.git.add("-A")
+    repo.git.commit("-q", "-m", "synthetic repository")
+
+
+def measure(name: str, func) -> None:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {len(result):>8} files {elapsed:>8.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--files", type=int, default=100000, help="number of tracked files"
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as root_dir:
+        create_repository(root_dir, args.files)
+        cfg = NetworkConfiguration(
+            project_root_abs=root_dir,
+            enable_static_blacklist=False,
+            enable_internal_links=False,
+            enable_all_conflicts=False,
+        )
+        IgnoreFile.configure(cfg.ignorefile_path())
+        git = Git(project_root=root_dir)
+
+        measure("git index (ls-files)", lambda: list(git.iter_index_files()))
+        measure("GitPython tree walk", lambda: list(git.iter_tree_files()))
+        measure(
+            "configuration files",
+            lambda: Network._get_config_files(git, cfg),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Synthetic networks shared by the benchmarks."""
+
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.linker.link import Link
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+# names and locations of the options from the artifact down to the option
+# of the value, the config type of that option and the name of the value
+ValueSpec = Tuple[Sequence[Tuple[str, str]], ConfigType, str]
+
+
+def create_network(
+    root_dir: str,
+    artifacts: int,
+    values: Callable[[int], Iterable[ValueSpec]],
+    file_name: str = "dir{i}/config{i}.properties",
+    concept: Callable[[int], str] = lambda i: "bench",
+    enable_all_conflicts: bool = False,
+) -> Network:
+    """
+    Create a network of synthetic artifacts.
+
+    :param root_dir: project root of the network
+    :param artifacts: number of artifacts
+    :param values: generator of the values of the i-th artifact
+    :param file_name: relative path of the i-th artifact, `{i}` is
+        replaced by the index
+    :param concept: concept of the i-th artifact
+    :param enable_all_conflicts: detect all conflict types
+    :return: the network
+    """
+    cfg = NetworkConfiguration(
+        project_root_abs=root_dir,
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=enable_all_conflicts,
+        enable_parse_cache=False,
+    )
+    root = ProjectNode(name="bench", root_dir=root_dir)
+    network = Network(project_name="bench", root=root, cfg=cfg)
+
+    for i in range(artifacts):
+        file = file_name.format(i=i)
+        artifact = ArtifactNode(
+            file_path=f"{root_dir}/{file}",
+            rel_file_path=file,
+            concept_name=concept(i),
+        )
+        # options shared by the values below them
+        parents: Dict[Tuple[Tuple[str, str], ...], OptionNode] = {}
+        for path, config_type, name in values(i):
+            parent = artifact
+            for depth, (option_name, location) in enumerate(path):
+                key = tuple(path[: depth + 1])
+                option = parents.get(key)
+                if option is None:
+                    option = OptionNode(
+                        option_name,
+                        location,
+                        config_type
+                        if depth == len(path) - 1
+                        else ConfigType.UNKNOWN,
+                    )
+                    parent.add_child(option)
+                    parents[key] = option
+                parent = option
+            parent.add_child(ValueNode(name=name))
+        root.add_child(artifact)
+
+    return network
+
+
+def link_next_artifact(network: Network, equal_only: bool = False) -> None:
+    """
+    Link each value to the value at the same position in the next artifact.
+
+    :param network: network whose artifacts have the same options
+    :param equal_only: only link values with equal names
+    """
+    artifacts: List[List[ValueNode]] = [
+        [
+            value
+            for value in artifact.get_nodes()
+            if value.parent.location != "file_path"
+        ]
+        for artifact in network.get_nodes(ArtifactNode)
+    ]
+    for values_a, values_b in zip(artifacts, artifacts[1:]):
+        for value_a, value_b in zip(values_a, values_b):
+            if not equal_only or value_a.name == value_b.name:
+                network.links.add(Link(value_a, value_b))
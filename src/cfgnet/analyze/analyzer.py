@@ -14,40 +14,115 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import sys
 import logging
+import shutil
 import time
 
-from typing import Optional, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from cfgnet.vcs.git import Git
 from cfgnet.vcs.git_history import GitHistory
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.network.ignorefile import IgnoreFile
 from cfgnet.network.network import Network, NetworkConfiguration
+from cfgnet.plugins.plugin_manager import PluginManager
 from cfgnet.analyze.csv_writer import CSVWriter
+from cfgnet.analyze.conflict_writer import ConflictWriter
+from cfgnet.analyze.checkpoint import Checkpoint, CheckpointState
+from cfgnet.analyze.delta_store import DeltaRow, DeltaStore
+from cfgnet.network.network_diff import NetworkDiff
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
+
+# network configuration, blob directory of a worker, the commits of a
+# range preceded by their reference commit and the index of that commit
+RangeJob = Tuple[NetworkConfiguration, str, List[str], int]
 
 
 class Analyzer:
-    def __init__(self, cfg: NetworkConfiguration):
+    def __init__(
+        self,
+        cfg: NetworkConfiguration,
+        checkout: bool = True,
+        workers: int = 1,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        max_commits: Optional[int] = None,
+        first_parent: bool = False,
+        resume: bool = False,
+        checkpoint_interval: int = 1000,
+        output_format: str = "csv",
+    ):
+        """
+        Initialize the analysis of a commit history.
+
+        :param cfg: network configuration
+        :param checkout: Check out each commit, otherwise configuration
+            files are read from the git object database and the working
+            tree is left untouched
+        :param workers: Number of processes analyzing ranges of the
+            history, more than one worker implies not to check out commits
+        :param since: Only analyze commits more recent than this date
+        :param until: Only analyze commits older than this date
+        :param max_commits: Only analyze this number of commits, starting
+            with the oldest one
+        :param first_parent: Only follow the first parent of merge commits
+        :param resume: Continue the analysis from the last checkpoint
+        :param checkpoint_interval: Save a checkpoint after this number of
+            commits, 0 disables checkpoints
+        :param output_format: Write conflicts as `csv` or as `jsonl` with
+            one JSON object per line
+        """
         self.cfg: NetworkConfiguration = cfg
-        self.conflicts_cvs_path: Optional[str] = None
+        self.checkout: bool = checkout
+        self.workers: int = workers
+        self.since: Optional[str] = since
+        self.until: Optional[str] = until
+        self.max_commits: Optional[int] = max_commits
+        self.first_parent: bool = first_parent
+        self.resume: bool = resume
+        self.checkpoint_interval: int = checkpoint_interval
+        self.output_format: str = output_format
+        # commits of the last analysis and those without configuration changes
+        self.visited_commits: int = 0
+        self.skipped_commits: int = 0
+        self.conflicts_path: Optional[str] = None
+        self.writer: ConflictWriter
         self.time_last_progress_print: float = 0
         self._setup_dirs()
 
     def _setup_dirs(self) -> None:
         """Set up storage for analysis results."""
-        data_dir = os.path.join(
-            self.cfg.project_root_abs, self.cfg.cfgnet_path_rel
-        )
-
-        analysis_dir = os.path.join(data_dir, "analysis")
+        analysis_dir = self.cfg.analysis_dir_path()
 
         if not os.path.exists(analysis_dir):
             os.makedirs(analysis_dir)
 
-        self.conflicts_csv_path = os.path.join(
-            analysis_dir, f"conflicts_{self.cfg.project_name()}.csv"
+        self.conflicts_path = os.path.join(
+            analysis_dir,
+            f"conflicts_{self.cfg.project_name()}.{self.output_format}",
+        )
+        self.writer = ConflictWriter(self.conflicts_path, self.output_format)
+        self.deltas = DeltaStore(self.cfg.delta_store_path())
+
+        self.checkpoint = Checkpoint(
+            os.path.join(
+                analysis_dir, f"checkpoint_{self.cfg.project_name()}.pickle"
+            )
         )
 
-        if os.path.exists(self.conflicts_csv_path):
-            os.remove(self.conflicts_csv_path)
+    def _open_outputs(self, state: Optional[CheckpointState]) -> None:
+        """Replace the results of a previous analysis or continue them."""
+        if state is None:
+            self.writer.open()
+            self.deltas.open()
+        else:
+            self.writer.open(state.output_offset, state.conflict_ids)
+            self.deltas.open(state.delta_offset)
+
+    def _close_outputs(self) -> None:
+        self.writer.close()
+        self.deltas.close()
 
     def _print_progress(self, num_commit: int, final: bool = False) -> None:
         """Print the progress of th analysis."""
@@ -64,32 +139,175 @@ class Analyzer:
         if final:
             print()
 
+    def _get_history(self, repo: Git, checkout: bool) -> GitHistory:
+        return GitHistory(
+            repo,
+            checkout=checkout,
+            since=self.since,
+            until=self.until,
+            max_commits=self.max_commits,
+            first_parent=self.first_parent,
+        )
+
+    def _log_empty_history(self) -> None:
+        """Report that the options of the analysis selected no commits."""
+        self.visited_commits = 0
+        self.skipped_commits = 0
+        logging.warning(
+            "No commits found between %s and %s, nothing to analyze.",
+            self.since or "the first commit",
+            self.until or "the last commit",
+        )
+
+    def _resume_options(self) -> Dict[str, Any]:
+        return {
+            "since": self.since,
+            "until": self.until,
+            "max_commits": self.max_commits,
+            "first_parent": self.first_parent,
+            "output_format": self.output_format,
+        }
+
+    def _load_checkpoint(self) -> Optional[CheckpointState]:
+        """Load the checkpoint to resume from, if resuming."""
+        if not self.resume:
+            # a checkpoint of a previous analysis is outdated now
+            self.checkpoint.remove()
+            return None
+
+        try:
+            state = self.checkpoint.load()
+        except InvalidNetworkStateException as error:
+            logging.error("%s. Please run analyze without --resume.", error)
+            sys.exit(1)
+
+        if state is None:
+            logging.warning("No checkpoint found, analyzing all commits.")
+            return None
+
+        if state.options != self._resume_options():
+            logging.error(
+                "The checkpoint was created with the options %s. "
+                "Please resume with the same options.",
+                state.options,
+            )
+            sys.exit(1)
+
+        if not os.path.exists(self.conflicts_path):  # type: ignore
+            logging.error(
+                "Conflicts of the checkpoint are missing in %s. "
+                "Please run analyze without --resume.",
+                self.conflicts_path,
+            )
+            sys.exit(1)
+
+        logging.info("Resuming analysis after commit %s.", state.commit)
+        return state
+
+    def _save_checkpoint(self, state: CheckpointState) -> None:
+        state.options = self._resume_options()
+        state.conflict_ids = self.writer.conflict_ids
+        state.output_offset = self.writer.tell()
+        state.delta_offset = self.deltas.count()
+        self.checkpoint.save(state)
+
     def analyze_commit_history(self) -> None:
         """Analyze the commit history."""
+        if self.workers > 1:
+            self._analyze_in_workers()
+            return
+
         repo = Git(project_root=self.cfg.project_root_abs)
-        branch_pre_analysis = repo.get_current_branch_name()
-        commit_hash_pre_analysis = repo.get_current_commit_hash()
+        state = self._load_checkpoint()
+        if state is None:
+            branch_pre_analysis = repo.get_current_branch_name()
+            commit_hash_pre_analysis = repo.get_current_commit_hash()
+        else:
+            # HEAD may still be detached if the analysis was killed, older
+            # checkpoints of workers lack the branch but left HEAD alone
+            branch_pre_analysis = (
+                state.branch_pre_analysis or repo.get_current_branch_name()
+            )
+            commit_hash_pre_analysis = state.commit_hash_pre_analysis
+
+        history = self._get_history(repo, checkout=self.checkout)
+        if state is None and not history.has_next_commit():
+            self._log_empty_history()
+            return
 
-        conflicts: Set = set()
-        history = GitHistory(repo)
-        commit = history.restore_initial_commit()
+        self.skipped_commits = 0
+        if state is None:
+            commit = history.restore_initial_commit()
+        else:
+            commit = history.restore_commit(state.commit)
+            self.skipped_commits = state.skipped_commits
+        self._open_outputs(state)
+
+        blob_reader = None
+        if not self.checkout:
+            blob_reader = BlobReader(repo, self.cfg.blob_dir_path())
 
         try:
-            ref_network = Network.init_network(cfg=self.cfg)
+            if state is not None and state.network is not None:
+                ref_network = state.network
+                ref_network.cfg = self.cfg
+            else:
+                ref_network = Network.init_network(
+                    cfg=self.cfg, blob_reader=blob_reader, commit=commit.hexsha
+                )
+            if state is None:
+                self.deltas.append(
+                    get_delta_rows(repo, 0, commit.hexsha, None, ref_network)
+                )
             while history.has_next_commit():
+                previous_commit = commit
+                previous_network = ref_network
                 commit = history.next_commit()
 
-                detected_conflicts, ref_network = ref_network.validate(
-                    commit.hexsha
+                detected_conflicts, ref_network = validate_commit(
+                    repo,
+                    ref_network,
+                    previous_commit.hexsha,
+                    commit.hexsha,
+                    blob_reader,
                 )
 
-                conflicts.update(detected_conflicts)
+                if detected_conflicts is None:
+                    self.skipped_commits += 1
+                else:
+                    self.writer.write(detected_conflicts)
+                    self.deltas.append(
+                        get_delta_rows(
+                            repo,
+                            history.commit_index,
+                            commit.hexsha,
+                            previous_network,
+                            ref_network,
+                        )
+                    )
 
                 self._print_progress(num_commit=history.commit_index + 1)
 
                 if commit.hexsha == commit_hash_pre_analysis:
                     break
 
+                if (
+                    self.checkpoint_interval
+                    and history.commit_index % self.checkpoint_interval == 0
+                ):
+                    self._save_checkpoint(
+                        CheckpointState(
+                            commit=commit.hexsha,
+                            commit_index=history.commit_index,
+                            skipped_commits=self.skipped_commits,
+                            network=ref_network,
+                            branch_pre_analysis=branch_pre_analysis,
+                            commit_hash_pre_analysis=commit_hash_pre_analysis,
+                        )
+                    )
+
+            self.checkpoint.remove()
+
         except Exception as error:
             logging.error(
                 "An exception occurred during analysis at commit %s.",
@@ -99,23 +317,315 @@ class Analyzer:
             raise
 
         finally:
-            if branch_pre_analysis:
+            if blob_reader is not None:
+                # the working tree has not been touched
+                blob_reader.close()
+            elif branch_pre_analysis:
                 # HEAD was a branch, so go back to that branch
                 repo.checkout(branch_pre_analysis)
             else:
                 # HEAD was detached, so got back to the commit
                 repo.checkout(commit_hash_pre_analysis)
 
-            CSVWriter.write_conflicts_to_csv(
-                csv_path=self.conflicts_csv_path, conflicts=conflicts
-            )
+            self._close_outputs()
 
             self._print_progress(
                 num_commit=history.commit_index + 1, final=True
             )
 
+            self.visited_commits = history.commit_index + 1
+
             logging.debug("Latest commit analyzed: %s", commit.hexsha)
-            logging.debug(
-                "Total analyzed commits %s", str(history.commit_index + 1)
+            logging.info(
+                "Visited %s commits, skipped %s commits without changes of "
+                "configuration files",
+                str(self.visited_commits),
+                str(self.skipped_commits),
+            )
+            logging.info(
+                "Total detected conflicts: %s",
+                str(len(self.writer.conflict_ids)),
             )
-            logging.info("Total detected conflicts: %s", str(len(conflicts)))
+
+    def _analyze_in_workers(self) -> None:
+        """
+        Analyze contiguous ranges of the commit history in worker processes.
+
+        Each worker reads the commits of its range from the git object
+        database and also creates the network of the commit before its
+        range, which is the reference network of its first commit.  The
+        conflicts of the ranges are written in commit order, so the result
+        equals the result of analyzing all commits in one process.
+
+        Ranges contain at most `checkpoint_interval` commits and a
+        checkpoint is saved whenever a range is finished.
+        """
+        repo = Git(project_root=self.cfg.project_root_abs)
+        state = self._load_checkpoint()
+        if state is None:
+            branch_pre_analysis = repo.get_current_branch_name()
+            commit_hash_pre_analysis = repo.get_current_commit_hash()
+        else:
+            branch_pre_analysis = state.branch_pre_analysis
+            commit_hash_pre_analysis = state.commit_hash_pre_analysis
+
+        # ranges are split by the number of commits, so only their hashes
+        # are kept in memory
+        history = self._get_history(repo, checkout=False)
+        commits = list(history.iter_commit_hashes())
+        if state is None and not commits:
+            self._log_empty_history()
+            return
+
+        if commit_hash_pre_analysis in commits:
+            commits = commits[: commits.index(commit_hash_pre_analysis) + 1]
+
+        self.skipped_commits = 0
+        # index of the first commit, which is only used as reference
+        first = 0
+        if state is not None:
+            if state.commit not in commits:
+                raise IndexError(
+                    f"Commit {state.commit} is not in the history"
+                )
+            first = commits.index(state.commit)
+            self.skipped_commits = state.skipped_commits
+        commits = commits[first:]
+
+        num_ranges = self.workers
+        if self.checkpoint_interval:
+            num_ranges = max(
+                num_ranges, -(-(len(commits) - 1) // self.checkpoint_interval)
+            )
+
+        ranges = split_commits(len(commits), num_ranges)
+        if not ranges and first == 0 and commits:
+            # a history of one commit has no commit to validate, but the
+            # changes of its initial commit are recorded
+            ranges = [(1, 1)]
+
+        jobs: List[RangeJob] = [
+            (
+                self.cfg,
+                os.path.join(self.cfg.blob_dir_path(), f"worker{index}"),
+                commits[start - 1 : end],
+                first + start - 1,
+            )
+            for index, (start, end) in enumerate(ranges)
+        ]
+
+        num_commit = first + min(len(commits), 1)
+        self._open_outputs(state)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(jobs), self.workers) or 1
+            ) as executor:
+                for job, (rows, delta_rows, skipped) in zip(
+                    jobs, executor.map(analyze_commit_range, jobs)
+                ):
+                    self.writer.write_rows(rows)
+                    self.deltas.append(delta_rows)
+                    self.skipped_commits += skipped
+
+                    num_commit += len(job[2]) - 1
+                    self._print_progress(num_commit=num_commit)
+
+                    if not self.checkpoint_interval:
+                        continue
+                    self._save_checkpoint(
+                        CheckpointState(
+                            commit=job[2][-1],
+                            commit_index=num_commit - 1,
+                            skipped_commits=self.skipped_commits,
+                            branch_pre_analysis=branch_pre_analysis,
+                            commit_hash_pre_analysis=commit_hash_pre_analysis,
+                        )
+                    )
+
+            self.checkpoint.remove()
+        finally:
+            shutil.rmtree(self.cfg.blob_dir_path(), ignore_errors=True)
+
+            self._close_outputs()
+
+            self._print_progress(num_commit=num_commit, final=True)
+
+            self.visited_commits = num_commit
+
+            logging.debug("Analyzed %s ranges", str(len(jobs)))
+            logging.info(
+                "Visited %s commits, skipped %s commits without changes of "
+                "configuration files",
+                str(self.visited_commits),
+                str(self.skipped_commits),
+            )
+            logging.info(
+                "Total detected conflicts: %s",
+                str(len(self.writer.conflict_ids)),
+            )
+
+
+def split_commits(num_commits: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split the commits to be validated into contiguous ranges.
+
+    The first commit is not validated, it only serves as reference of the
+    second commit.
+
+    :param num_commits: Number of commits of the history
+    :param workers: Maximum number of ranges
+    :return: Start and end index of each range
+    """
+    validated = num_commits - 1
+    if validated <= 0:
+        return []
+
+    workers = min(workers, validated)
+    size, rest = divmod(validated, workers)
+
+    ranges = []
+    start = 1
+    for index in range(workers):
+        end = start + size + (1 if index < rest else 0)
+        ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def add_conflicts(
+    conflicts: Dict[str, Dict[str, str]], detected_conflicts: Iterable[Any]
+) -> None:
+    """
+    Add the csv rows of conflicts detected in a commit.
+
+    Conflicts that already occurred in a previous commit are kept.
+
+    :param conflicts: csv rows by conflict IDs
+    :param detected_conflicts: conflicts detected in a commit
+    """
+    for conflict in sorted(detected_conflicts, key=lambda x: x.id):
+        if conflict.id not in conflicts:
+            conflicts[conflict.id] = CSVWriter.get_row(conflict)
+
+
+def touches_config_files(cfg: NetworkConfiguration, files: List[str]) -> bool:
+    """
+    Check if a plugin is responsible for one of the files.
+
+    :param cfg: network configuration
+    :param files: relative paths of changed files
+    :return: True if a changed file is not ignored and has a plugin
+    """
+    plugins = PluginManager.get_plugins()
+    for file in IgnoreFile.prune(files):
+        abs_file_path = os.path.join(cfg.project_root_abs, file)
+        if PluginManager.get_responsible_plugin(plugins, abs_file_path):
+            return True
+
+    return False
+
+
+def validate_commit(
+    repo: Git,
+    ref_network: Network,
+    previous_commit: str,
+    commit: str,
+    blob_reader: Optional[BlobReader],
+) -> Tuple[Optional[Set], Network]:
+    """
+    Validate a commit against the network of the previous commit.
+
+    Commits that do not change a configuration file are skipped, the
+    network of the previous commit is carried forward unchanged.
+
+    :param repo: git repository of the project
+    :param ref_network: network of the previous commit
+    :param previous_commit: hash of the previous commit
+    :param commit: hash of the commit to validate
+    :param blob_reader: Read files of the commit instead of the working tree
+    :return: detected conflicts or None if the commit was skipped, and the
+        network of the commit
+    """
+    changed_files = repo.get_changed_files_between(previous_commit, commit)
+    if not touches_config_files(ref_network.cfg, changed_files):
+        ref_network.commit_hash = commit
+        return None, ref_network
+
+    return ref_network.validate(commit, blob_reader=blob_reader)
+
+
+def get_delta_rows(
+    repo: Git,
+    commit_index: int,
+    commit: str,
+    ref_network: Optional[Network],
+    network: Network,
+) -> List[DeltaRow]:
+    """
+    Create the rows of the structural changes of a commit.
+
+    :param repo: git repository of the project
+    :param commit_index: index of the commit in the analyzed history
+    :param commit: hash of the commit
+    :param ref_network: network of the previous commit, None for the
+        first commit
+    :param network: network of the commit
+    :return: rows for the delta store
+    """
+    delta = NetworkDiff.diff(ref_network, network, artifact_options=True)
+    if delta.is_empty():
+        return []
+
+    committed_at = repo.repo.commit(commit).committed_date
+    return DeltaStore.get_rows(commit_index, commit, committed_at, delta)
+
+
+def analyze_commit_range(
+    job: RangeJob,
+) -> Tuple[List[Tuple[str, Dict[str, str]]], List[DeltaRow], int]:
+    """
+    Detect the conflicts of a range of commits.
+
+    Used as worker function of the process pool in `Analyzer`.
+
+    :param job: commits of a range and how to analyze them
+    :return: csv rows of the conflicts by conflict IDs in commit order,
+        rows of the structural changes and the number of skipped commits
+    """
+    cfg, blob_dir, commits, first_index = job
+
+    repo = Git(project_root=cfg.project_root_abs)
+    blob_reader = BlobReader(repo, blob_dir)
+
+    conflicts: Dict[str, Dict[str, str]] = {}
+    delta_rows: List[DeltaRow] = []
+    skipped_commits = 0
+    try:
+        ref_network = Network.init_network(
+            cfg=cfg, blob_reader=blob_reader, commit=commits[0]
+        )
+        if first_index == 0:
+            delta_rows.extend(
+                get_delta_rows(repo, 0, commits[0], None, ref_network)
+            )
+        for index, (previous_commit, commit) in enumerate(
+            zip(commits, commits[1:]), start=first_index + 1
+        ):
+            previous_network = ref_network
+            detected_conflicts, ref_network = validate_commit(
+                repo, ref_network, previous_commit, commit, blob_reader
+            )
+            if detected_conflicts is None:
+                skipped_commits += 1
+            else:
+                add_conflicts(conflicts, detected_conflicts)
+                delta_rows.extend(
+                    get_delta_rows(
+                        repo, index, commit, previous_network, ref_network
+                    )
+                )
+    finally:
+        blob_reader.close()
+
+    return list(conflicts.items()), delta_rows, skipped_commits
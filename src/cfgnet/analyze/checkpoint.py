@@ -0,0 +1,123 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import logging
+import pickle
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
+from cfgnet.network.network import Network
+
+
+@dataclass()
+class CheckpointState:
+    """State of an analysis after a commit."""
+
+    # last analyzed commit and its index in the history
+    commit: str
+    commit_index: int
+    skipped_commits: int
+    # network of the last analyzed commit, None if it has to be created again
+    network: Optional[Network] = None
+    # IDs of the written conflicts and the size of the output file
+    conflict_ids: Set[str] = field(default_factory=set)
+    output_offset: int = 0
+    # number of rows in the delta store
+    delta_offset: int = 0
+    # options an analysis has to be resumed with
+    options: Dict[str, Any] = field(default_factory=dict)
+    # HEAD before the analysis, restored when the analysis is finished
+    branch_pre_analysis: Optional[str] = None
+    commit_hash_pre_analysis: Optional[str] = None
+
+
+class Checkpoint:
+    """
+    Checkpoint of a running analysis.
+
+    A checkpoint is written to a temporary file that replaces the previous
+    checkpoint only once it is complete, so a crash while writing leaves
+    the previous checkpoint intact.
+    """
+
+    # bump when the pickled layout of the state changes
+    version: int = 3
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def save(self, state: CheckpointState) -> None:
+        """
+        Replace the checkpoint atomically.
+
+        :param state: state of the analysis
+        """
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as checkpoint_file:
+                pickle.dump(
+                    (Checkpoint.version, state),
+                    checkpoint_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            Checkpoint._remove(tmp_path)
+            raise
+
+        logging.debug("Saved checkpoint at commit %s", state.commit)
+
+    def load(self) -> Optional[CheckpointState]:
+        """
+        Load the checkpoint.
+
+        :return: state of the analysis or None if there is no checkpoint
+        """
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                version, state = pickle.load(checkpoint_file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            raise InvalidNetworkStateException(
+                f"Checkpoint {self.path} is corrupt"
+            ) from None
+
+        if version != Checkpoint.version:
+            raise InvalidNetworkStateException(
+                f"Checkpoint {self.path} has version {version}, "
+                f"expected version {Checkpoint.version}"
+            )
+
+        return state
+
+    def remove(self) -> None:
+        """Remove the checkpoint."""
+        Checkpoint._remove(self.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,156 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import csv
+import json
+import time
+
+from typing import IO, Any, Dict, Iterable, Optional, Set, Tuple
+from cfgnet.analyze.csv_writer import CSVWriter
+
+
+class ConflictWriter:
+    """
+    Stream the conflicts of an analysis into a file.
+
+    Conflicts are written as soon as a commit is validated.  Writes are
+    buffered and flushed to the file at most every `flush_interval`
+    seconds, so the file can be tailed during long analyses.  Only the IDs
+    of written conflicts are kept in memory to skip conflicts that already
+    occurred in a previous commit.
+    """
+
+    formats = ("csv", "jsonl")
+
+    def __init__(
+        self, path: str, output_format: str = "csv", flush_interval: float = 1
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param path: path of the output file
+        :param output_format: `csv` or `jsonl` for one JSON object per line
+        :param flush_interval: Maximum number of seconds between flushes
+        """
+        if output_format not in ConflictWriter.formats:
+            raise ValueError(f"Unknown output format {output_format}")
+
+        self.path: str = path
+        self.output_format: str = output_format
+        self.flush_interval: float = flush_interval
+        self.conflict_ids: Set[str] = set()
+        self.time_last_flush: float = 0
+        self._file: Optional[IO[str]] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+
+    def open(
+        self,
+        offset: Optional[int] = None,
+        conflict_ids: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Open the output file.
+
+        :param offset: Continue a previous output after this number of
+            bytes, otherwise the file is replaced
+        :param conflict_ids: IDs of the conflicts written before the offset
+        """
+        if offset is None:
+            # pylint: disable=consider-using-with
+            self._file = open(self.path, "w+", encoding="utf-8", newline="")
+        else:
+            # pylint: disable=consider-using-with
+            self._file = open(self.path, "r+", encoding="utf-8", newline="")
+            # drop conflicts written after the offset
+            self._file.truncate(offset)
+            self._file.seek(offset)
+
+        self.conflict_ids = set(conflict_ids or ())
+
+        if self.output_format == "csv":
+            self._csv_writer = csv.DictWriter(
+                self._file, fieldnames=CSVWriter.field_names
+            )
+            if offset is None:
+                self._csv_writer.writeheader()
+
+        self.flush()
+
+    def write(self, conflicts: Iterable[Any]) -> int:
+        """
+        Write the conflicts detected in a commit.
+
+        :param conflicts: conflicts detected in a commit
+        :return: Number of written conflicts
+        """
+        rows = (
+            (conflict.id, CSVWriter.get_row(conflict))
+            for conflict in sorted(conflicts, key=lambda x: x.id)
+            if conflict.id not in self.conflict_ids
+        )
+        return self.write_rows(rows)
+
+    def write_rows(self, rows: Iterable[Tuple[str, Dict[str, str]]]) -> int:
+        """
+        Write rows of conflicts.
+
+        Conflicts that have already been written are skipped.
+
+        :param rows: Rows created by `CSVWriter.get_row` by conflict IDs
+        :return: Number of written conflicts
+        """
+        if self._file is None:
+            raise ValueError("Conflict writer is not open")
+
+        written = 0
+        for conflict_id, row in rows:
+            if conflict_id in self.conflict_ids:
+                continue
+            self.conflict_ids.add(conflict_id)
+            if self._csv_writer is not None:
+                self._csv_writer.writerow(row)
+            else:
+                self._file.write(json.dumps(row) + "\n")
+            written += 1
+
+        if time.time() - self.time_last_flush >= self.flush_interval:
+            self.flush()
+
+        return written
+
+    def flush(self) -> None:
+        """Flush buffered conflicts to the file."""
+        if self._file is not None:
+            self._file.flush()
+        self.time_last_flush = time.time()
+
+    def tell(self) -> int:
+        """
+        Flush the file and get its size.
+
+        :return: Number of bytes written to the file
+        """
+        if self._file is None:
+            raise ValueError("Conflict writer is not open")
+
+        self.flush()
+        return self._file.tell()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._csv_writer = None
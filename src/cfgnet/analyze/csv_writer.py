@@ -14,7 +14,7 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import csv
 
-from typing import Set, Union
+from typing import Dict, Iterable, Set, Union
 
 from cfgnet.conflicts.conflict import (
     MissingArtifactConflict,
@@ -24,6 +24,14 @@ from cfgnet.conflicts.conflict import (
 
 
 class CSVWriter:
+    field_names = [
+        "occurred_at",
+        "conflict_type",
+        "conflict_id",
+        "link",
+        "config_types",
+    ]
+
     @staticmethod
     def write_conflicts_to_csv(
         csv_path,
@@ -40,30 +48,52 @@ class CSVWriter:
 
         :param conflicts: Conflicts to be written to a csv file
         """
-        field_names = [
-            "occurred_at",
-            "conflict_type",
-            "conflict_id",
-            "link",
-            "config_types",
-        ]
+        CSVWriter.write_rows(
+            csv_path, (CSVWriter.get_row(conflict) for conflict in conflicts)
+        )
+
+    @staticmethod
+    def write_rows(csv_path, rows: Iterable[Dict[str, str]]) -> None:
+        """
+        Write rows of conflicts into a csv file.
 
+        :param rows: Rows created by `get_row`
+        """
         with open(csv_path, "a+", encoding="utf-8") as conflict_file:
-            writer = csv.DictWriter(conflict_file, fieldnames=field_names)
+            writer = csv.DictWriter(
+                conflict_file, fieldnames=CSVWriter.field_names
+            )
             writer.writeheader()
 
-            for conflict in conflicts:
-                node_a = conflict.link.node_a
-                node_b = conflict.link.node_b
+            for row in rows:
+                writer.writerow(row)
 
-                config_type = f"{node_a.config_type}<->{node_b.config_type}"
+    @staticmethod
+    def get_row(
+        conflict: Union[
+            ModifiedOptionConflict,
+            MissingArtifactConflict,
+            MissingOptionConflict,
+        ]
+    ) -> Dict[str, str]:
+        """
+        Create the csv row of a conflict.
+
+        Rows only contain strings, so they can be passed between processes
+        without the networks the conflict refers to.
+
+        :param conflict: Conflict to be written to a csv file
+        :return: Values of the row by field names
+        """
+        node_a = conflict.link.node_a
+        node_b = conflict.link.node_b
 
-                data = {
-                    "occurred_at": conflict.occurred_at,
-                    "conflict_type": conflict.__class__.__name__,
-                    "conflict_id": conflict.id,
-                    "link": conflict.link,
-                    "config_types": config_type,
-                }
+        config_type = f"{node_a.config_type}<->{node_b.config_type}"
 
-                writer.writerow(data)
+        return {
+            "occurred_at": conflict.occurred_at,
+            "conflict_type": conflict.__class__.__name__,
+            "conflict_id": conflict.id,
+            "link": str(conflict.link),
+            "config_types": config_type,
+        }
@@ -0,0 +1,251 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import sqlite3
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+from cfgnet.network.network_diff import NetworkDelta
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deltas (
+    commit_index INTEGER NOT NULL,
+    commit_hash TEXT NOT NULL,
+    committed_at INTEGER NOT NULL,
+    change TEXT NOT NULL,
+    artifact TEXT NOT NULL,
+    option TEXT NOT NULL,
+    location TEXT NOT NULL,
+    old_values TEXT NOT NULL,
+    new_values TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deltas_option ON deltas (option, commit_index);
+CREATE INDEX IF NOT EXISTS deltas_artifact
+    ON deltas (artifact, commit_index);
+"""
+
+DeltaRow = Tuple[int, str, int, str, str, str, str, str, str]
+
+
+@dataclass()
+class DeltaRecord:
+    """Change of an artifact or option in a commit."""
+
+    commit_index: int
+    commit_hash: str
+    # unix timestamp of the commit
+    committed_at: int
+    # added, removed or modified
+    change: str
+    artifact: str
+    # empty for changes of whole artifacts
+    option: str
+    location: str
+    old_values: List[str]
+    new_values: List[str]
+
+    def __str__(self) -> str:
+        if not self.option:
+            return f"{self.change} {self.artifact}"
+        values = ", ".join(self.new_values)
+        if self.change == "removed":
+            values = ", ".join(self.old_values)
+        elif self.change == "modified":
+            values = f"{', '.join(self.old_values)} -> {values}"
+        return f"{self.change} {self.artifact}: {self.option} = {values}"
+
+
+class DeltaStore:
+    """
+    Append-only store of the structural changes of analyzed commits.
+
+    Each changed artifact or option of a commit is a row of a SQLite table
+    that is indexed by option and by artifact, so the changes of an option
+    can be queried without analyzing the history again.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path: str = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.db_path)
+
+    def open(self, offset: Optional[int] = None) -> None:
+        """
+        Open the store for appending.
+
+        :param offset: Continue after this number of rows, otherwise the
+            changes of a previous analysis are removed
+        """
+        if offset is None and self.exists():
+            os.remove(self.db_path)
+
+        self._connection = sqlite3.connect(self.db_path)
+        # a transaction per commit must not wait for a sync to disk, after
+        # a crash the analysis resumes from the offset of its checkpoint
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            if offset is not None:
+                # drop changes appended after the offset
+                self._connection.execute(
+                    "DELETE FROM deltas WHERE rowid > ?", (offset,)
+                )
+
+    def append(self, rows: Iterable[DeltaRow]) -> None:
+        """
+        Append changes.
+
+        :param rows: Rows created by `get_rows`
+        """
+        if self._connection is None:
+            raise ValueError("Delta store is not open")
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO deltas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def count(self) -> int:
+        """Return the number of stored rows."""
+        if self._connection is None:
+            raise ValueError("Delta store is not open")
+
+        return self._connection.execute(
+            "SELECT COALESCE(MAX(rowid), 0) FROM deltas"
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+
+    def query(
+        self,
+        option: Optional[str] = None,
+        artifact: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[DeltaRecord]:
+        """
+        Query the changes of an option or an artifact, newest first.
+
+        Options are stored by their option paths, which join nested keys,
+        e.g. of YAML files, with `::`.  If no change matches an option
+        with dots, dots are taken as separators of nested keys, so
+        `spring.datasource.url` also finds `spring::datasource::url`.
+
+        :param option: option path, may contain `*` as wildcard
+        :param artifact: relative path of an artifact, may contain `*`
+        :param limit: Maximum number of changes
+        :return: Changes matching all given filters
+        """
+        records = self._select(option, artifact, limit)
+        if not records and option and "." in option:
+            records = self._select(option.replace(".", "::"), artifact, limit)
+        return records
+
+    def _select(
+        self,
+        option: Optional[str],
+        artifact: Optional[str],
+        limit: Optional[int],
+    ) -> List[DeltaRecord]:
+        conditions = []
+        params: List = []
+        for column, pattern in (("option", option), ("artifact", artifact)):
+            if pattern is None:
+                continue
+            operator = "GLOB" if "*" in pattern else "="
+            conditions.append(f"{column} {operator} ?")
+            params.append(pattern)
+
+        query = "SELECT * FROM deltas"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY commit_index DESC, rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        connection = sqlite3.connect(self.db_path)
+        try:
+            rows = connection.execute(query, params).fetchall()
+        finally:
+            connection.close()
+
+        return [
+            DeltaRecord(
+                *row[:7],
+                old_values=json.loads(row[7]),
+                new_values=json.loads(row[8]),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_rows(
+        commit_index: int,
+        commit_hash: str,
+        committed_at: int,
+        delta: NetworkDelta,
+    ) -> List[DeltaRow]:
+        """
+        Create the rows of the changes of a commit.
+
+        Rows only contain strings and numbers, so they can be passed
+        between processes without the networks.
+
+        :param commit_index: index of the commit in the analyzed history
+        :param commit_hash: hash of the commit
+        :param committed_at: unix timestamp of the commit
+        :param delta: changes of the commit
+        :return: rows to be appended
+        """
+        commit = (commit_index, commit_hash, committed_at)
+        rows: List[DeltaRow] = []
+
+        for change, artifacts in (
+            ("added", delta.added_artifacts),
+            ("removed", delta.removed_artifacts),
+        ):
+            rows.extend(
+                (*commit, change, artifact, "", "", "[]", "[]")
+                for artifact in artifacts
+            )
+
+        for change, options in (
+            ("added", delta.added_options),
+            ("removed", delta.removed_options),
+            ("modified", delta.modified_options),
+        ):
+            rows.extend(
+                (
+                    *commit,
+                    change,
+                    x.artifact,
+                    x.option,
+                    x.location,
+                    json.dumps(x.old_values),
+                    json.dumps(x.new_values),
+                )
+                for x in options
+            )
+
+        return rows
@@ -13,8 +13,34 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from cfgnet.config_types.config_types import ConfigType
 
+# name of a check, its regex and how the regex is applied
+Check = Tuple[str, "re.Pattern[str]", str]
+
+
+def _combine_checks(checks: Tuple[Check, ...]) -> "re.Pattern[str]":
+    """
+    Combine checks into a regex that reports all succeeding checks at once.
+
+    Each check becomes an optional lookahead with a named group, so one
+    `match` at the start of a string runs all checks and the groups that
+    are set name the checks that succeed.
+
+    :param checks: name, regex and `match`, `search` or `fullmatch`
+    :return: combined regex
+    """
+    parts = []
+    for name, regex, mode in checks:
+        prefix = "(?s:.*?)" if mode == "search" else ""
+        suffix = r"\Z" if mode == "fullmatch" else ""
+        parts.append(
+            f"(?:(?={prefix}(?P<{name}>{regex.pattern}){suffix}))?"
+        )
+    return re.compile("".join(parts))
+
 
 # pylint: disable=too-many-public-methods
 class ConfigTypeInferer:
@@ -31,6 +57,10 @@ class ConfigTypeInferer:
     2. Second, the option name or value are checked against specific types
     for which exist only one regular expression.
     3. Lastly, the option name or value checked against general types.
+
+    Option names and values are checked with one combined regex each, and
+    results are cached, since the same options occur in many files and
+    commits.
     """
 
     regex_password_option = re.compile(r"password|pwd|pass")
@@ -82,120 +112,181 @@ class ConfigTypeInferer:
     regex_command = re.compile(r"command|entrypoint|cmd|script|bin|install")
     regex_license = re.compile(r"license")
 
+    option_checks: Tuple[Check, ...] = (
+        ("port", regex_port_option, "match"),
+        ("username", regex_username_option, "match"),
+        ("password", regex_password_option, "match"),
+        ("size", regex_size_option, "search"),
+        ("time", regex_time_option, "search"),
+        ("path", regex_filepath_option, "search"),
+        ("version", regex_version_number_option, "search"),
+        ("ip", regex_ip_address_option, "search"),
+        ("id", regex_id, "search"),
+        ("mode", regex_mode, "search"),
+        ("count", regex_count, "search"),
+        ("name", regex_name, "search"),
+        ("pattern", regex_pattern, "search"),
+        ("environment", regex_environment, "search"),
+        ("image", regex_image, "search"),
+        ("command", regex_command, "search"),
+        ("license", regex_license, "search"),
+    )
+    value_checks: Tuple[Check, ...] = (
+        ("port", regex_port_value, "fullmatch"),
+        ("username", regex_username_value, "fullmatch"),
+        ("size", regex_size_value, "fullmatch"),
+        ("time", regex_time_value, "fullmatch"),
+        ("password", regex_password_value, "fullmatch"),
+        ("path", regex_filepath_value, "fullmatch"),
+        ("boolean", regex_boolean, "fullmatch"),
+        ("version", regex_version_number_value, "fullmatch"),
+        ("ip", regex_ip_address_value, "fullmatch"),
+        ("filename", regex_filename, "fullmatch"),
+        ("email", regex_email, "fullmatch"),
+        ("domain", regex_domain_main, "fullmatch"),
+        ("speed", regex_speed, "fullmatch"),
+        ("url", regex_url, "fullmatch"),
+        ("number", regex_number, "fullmatch"),
+    )
+    regex_option_checks = _combine_checks(option_checks)
+    regex_value_checks = _combine_checks(value_checks)
+
+    # rules in order of precedence: config type, option check, value check
+    # and whether both checks have to succeed or only one of them
+    rules: Tuple[Tuple[ConfigType, Optional[str], Optional[str], bool], ...]
+    rules = (
+        # option name and value
+        (ConfigType.PORT, "port", "port", True),
+        (ConfigType.USERNAME, "username", "username", True),
+        (ConfigType.SIZE, "size", "size", True),
+        (ConfigType.TIME, "time", "time", True),
+        (ConfigType.PASSWORD, "password", "password", True),
+        (ConfigType.PATH, "path", "path", False),
+        (ConfigType.BOOLEAN, None, "boolean", False),
+        (ConfigType.VERSION_NUMBER, "version", "version", False),
+        (ConfigType.IP_ADDRESS, "ip", "ip", False),
+        # specific types
+        (ConfigType.PATH, None, "filename", False),
+        (ConfigType.EMAIL, None, "email", False),
+        (ConfigType.DOMAIN_NAME, None, "domain", False),
+        (ConfigType.SPEED, None, "speed", False),
+        (ConfigType.URL, None, "url", False),
+        (ConfigType.ID, "id", None, False),
+        (ConfigType.MODE, "mode", None, False),
+        (ConfigType.COUNT, "count", None, False),
+        (ConfigType.NAME, "name", None, False),
+        (ConfigType.PATTERN, "pattern", None, False),
+        (ConfigType.ENVIRONMENT, "environment", None, False),
+        (ConfigType.IMAGE, "image", None, False),
+        (ConfigType.COMMAND, "command", None, False),
+        (ConfigType.LICENSE, "license", None, False),
+        # general types
+        (ConfigType.NUMBER, None, "number", False),
+        (ConfigType.SIZE, None, "size", False),
+    )
+
+    cache_size: int = 65536
+    _cache: Optional[Callable[[str, str], ConfigType]] = None
+
     @staticmethod
     def is_boolean(value: str) -> bool:
         return bool(re.match(ConfigTypeInferer.regex_boolean, value))
 
-    # pylint: disable=too-many-return-statements
     @staticmethod
-    def get_config_type(  # noqa: C901
-        option_name: str, value: str
-    ) -> ConfigType:
+    def get_config_type(option_name: str, value: str) -> ConfigType:
         """Check the option value and return its config type."""
-        # Check option name and value against types for which an option name and value regex exists.
-        if bool(
-            re.match(ConfigTypeInferer.regex_port_option, option_name)
-        ) and bool(re.fullmatch(ConfigTypeInferer.regex_port_value, value)):
-            return ConfigType.PORT
-
-        if bool(
-            re.match(ConfigTypeInferer.regex_username_option, option_name)
-        ) and bool(
-            re.fullmatch(ConfigTypeInferer.regex_username_value, value)
-        ):
-            return ConfigType.USERNAME
-
-        if bool(
-            re.search(ConfigTypeInferer.regex_size_option, option_name)
-        ) and bool(re.fullmatch(ConfigTypeInferer.regex_size_value, value)):
-            return ConfigType.SIZE
-
-        if bool(
-            re.search(ConfigTypeInferer.regex_time_option, option_name)
-        ) and bool(re.fullmatch(ConfigTypeInferer.regex_time_value, value)):
-            return ConfigType.TIME
-
-        if bool(
-            re.match(ConfigTypeInferer.regex_password_option, option_name)
-        ) and bool(
-            re.fullmatch(ConfigTypeInferer.regex_password_value, value)
-        ):
-            return ConfigType.PASSWORD
-
-        if bool(
-            re.search(ConfigTypeInferer.regex_filepath_option, option_name)
-        ) or bool(re.fullmatch(ConfigTypeInferer.regex_filepath_value, value)):
-            return ConfigType.PATH
-        
-        if bool(re.fullmatch(ConfigTypeInferer.regex_boolean, value)):
-            return ConfigType.BOOLEAN
-
-        if bool(
-            re.search(
-                ConfigTypeInferer.regex_version_number_option, option_name
-            )
-        ) or bool(
-            re.fullmatch(ConfigTypeInferer.regex_version_number_value, value)
-        ):
-            return ConfigType.VERSION_NUMBER
-
-        if bool(
-            re.search(ConfigTypeInferer.regex_ip_address_option, option_name)
-        ) or bool(
-            re.fullmatch(ConfigTypeInferer.regex_ip_address_value, value)
-        ):
-            return ConfigType.IP_ADDRESS
+        if ConfigTypeInferer._cache is None:
+            ConfigTypeInferer.set_cache_size(ConfigTypeInferer.cache_size)
+        return ConfigTypeInferer._cache(option_name, value)  # type: ignore
 
-        # Check option name and value against specific types.
-        if bool(re.fullmatch(ConfigTypeInferer.regex_filename, value)):
-            return ConfigType.PATH
-
-        if bool(re.fullmatch(ConfigTypeInferer.regex_email, value)):
-            return ConfigType.EMAIL
-
-        if bool(re.fullmatch(ConfigTypeInferer.regex_domain_main, value)):
-            return ConfigType.DOMAIN_NAME
-
-        if bool(re.fullmatch(ConfigTypeInferer.regex_speed, value)):
-            return ConfigType.SPEED
-
-        if bool(re.fullmatch(ConfigTypeInferer.regex_url, value)):
-            return ConfigType.URL
-
-        if bool(re.search(ConfigTypeInferer.regex_id, option_name)):
-            return ConfigType.ID
-
-        if bool(re.search(ConfigTypeInferer.regex_mode, option_name)):
-            return ConfigType.MODE
-
-        if bool(re.search(ConfigTypeInferer.regex_count, option_name)):
-            return ConfigType.COUNT
-
-        if bool(re.search(ConfigTypeInferer.regex_name, option_name)):
-            return ConfigType.NAME
-
-        if bool(re.search(ConfigTypeInferer.regex_pattern, option_name)):
-            return ConfigType.PATTERN
-
-        if bool(re.search(ConfigTypeInferer.regex_environment, option_name)):
-            return ConfigType.ENVIRONMENT
-
-        if bool(re.search(ConfigTypeInferer.regex_image, option_name)):
-            return ConfigType.IMAGE
+    @staticmethod
+    def get_config_types(pairs: Iterable[Tuple[str, str]]) -> List[ConfigType]:
+        """
+        Return the config types of many option values at once.
+
+        Each distinct option name and value is only checked once.
+
+        :param pairs: option names and values
+        :return: config types in the order of the pairs
+        """
+        option_matches: Dict[str, Set[str]] = {}
+        value_matches: Dict[str, Set[str]] = {}
+        config_types = []
+        for option_name, value in pairs:
+            matches_option = option_matches.get(option_name)
+            if matches_option is None:
+                matches_option = ConfigTypeInferer._match(
+                    ConfigTypeInferer.regex_option_checks, option_name
+                )
+                option_matches[option_name] = matches_option
+            matches_value = value_matches.get(value)
+            if matches_value is None:
+                matches_value = ConfigTypeInferer._match(
+                    ConfigTypeInferer.regex_value_checks, value
+                )
+                value_matches[value] = matches_value
+            config_types.append(
+                ConfigTypeInferer._apply_rules(matches_option, matches_value)
+            )
+        return config_types
 
-        if bool(re.search(ConfigTypeInferer.regex_command, option_name)):
-            return ConfigType.COMMAND
+    @staticmethod
+    def set_cache_size(size: int) -> None:
+        """
+        Replace the cache of config types.
+
+        :param size: maximum number of cached option values, 0 disables
+            the cache
+        """
+        ConfigTypeInferer.cache_size = size
+        ConfigTypeInferer._cache = lru_cache(maxsize=size)(
+            ConfigTypeInferer._infer
+        )
 
-        if bool(re.search(ConfigTypeInferer.regex_license, option_name)):
-            return ConfigType.LICENSE
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """Return hits, misses and size of the cache of config types."""
+        if ConfigTypeInferer._cache is None:
+            ConfigTypeInferer.set_cache_size(ConfigTypeInferer.cache_size)
+        info = ConfigTypeInferer._cache.cache_info()  # type: ignore
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "entries": info.currsize,
+            "max_entries": ConfigTypeInferer.cache_size,
+        }
 
-        # Check option name and value against general types.
-        if bool(re.fullmatch(ConfigTypeInferer.regex_number, value)):
-            return ConfigType.NUMBER
+    @staticmethod
+    def _infer(option_name: str, value: str) -> ConfigType:
+        return ConfigTypeInferer._apply_rules(
+            ConfigTypeInferer._match(
+                ConfigTypeInferer.regex_option_checks, option_name
+            ),
+            ConfigTypeInferer._match(
+                ConfigTypeInferer.regex_value_checks, value
+            ),
+        )
 
-        
+    @staticmethod
+    def _match(regex: "re.Pattern[str]", string: str) -> Set[str]:
+        """Return the names of the succeeding checks of a combined regex."""
+        match = regex.match(string)
+        return {
+            name
+            for name, group in match.groupdict().items()  # type: ignore
+            if group is not None
+        }
 
-        if bool(re.fullmatch(ConfigTypeInferer.regex_size_value, value)):
-            return ConfigType.SIZE
+    @staticmethod
+    def _apply_rules(
+        matches_option: Set[str], matches_value: Set[str]
+    ) -> ConfigType:
+        for config_type, option_check, value_check, both in (
+            ConfigTypeInferer.rules
+        ):
+            in_option = option_check in matches_option
+            in_value = value_check in matches_value
+            if (in_option and in_value) if both else (in_option or in_value):
+                return config_type
 
         return ConfigType.UNKNOWN
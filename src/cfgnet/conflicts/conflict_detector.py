@@ -15,19 +15,40 @@
 
 import logging
 
-from typing import Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, Optional, Set, Tuple, TYPE_CHECKING
 from cfgnet.conflicts.conflict import (
     MissingArtifactConflict,
     MissingOptionConflict,
     ModifiedOptionConflict,
 )
-from cfgnet.network.nodes import OptionNode
+from cfgnet.network.nodes import ArtifactNode, OptionNode
 from cfgnet.linker.link import Link
 
 if TYPE_CHECKING:
     from cfgnet.network.network import Network
 
 
+class _NodeLookup:
+    """Cache the nodes of a network that were found for nodes of links."""
+
+    def __init__(self, network: "Network") -> None:
+        self.network: "Network" = network
+        self.artifacts: Dict[str, Optional[ArtifactNode]] = {}
+        # options with the same ID are told apart by their location
+        self.options: Dict[Tuple[str, str], Optional[OptionNode]] = {}
+
+    def artifact(self, node: ArtifactNode) -> Optional[ArtifactNode]:
+        if node.id not in self.artifacts:
+            self.artifacts[node.id] = self.network.find_artifact_node(node)
+        return self.artifacts[node.id]
+
+    def option(self, node: OptionNode) -> Optional[OptionNode]:
+        key = (node.id, node.location)
+        if key not in self.options:
+            self.options[key] = self.network.find_option_node(node)
+        return self.options[key]
+
+
 class ConflictDetector:
     """Static class responsible for conflict detection."""
 
@@ -47,57 +68,67 @@ class ConflictDetector:
         :param enable_all_conflicts: Enable the detection of all conflicts
         :return: Set of detected conflicts
         """
-        conflicts: Set = set()
+        conflicts: Dict[str, Any] = {}
+        lookup = _NodeLookup(new_network)
 
         missing_links = ref_network.links.difference(new_network.links)
 
         for link in missing_links:
+            artifact_a = lookup.artifact(link.artifact_a)
+            artifact_b = lookup.artifact(link.artifact_b)
+
             if enable_all_conflicts:
                 if missing_artifact_conflict := ConflictDetector._detect_missing_artifact(
-                    link, new_network
+                    link, artifact_a, artifact_b
                 ):
-                    conflicts.add(missing_artifact_conflict)
+                    conflicts.setdefault(
+                        missing_artifact_conflict.id, missing_artifact_conflict
+                    )
                     continue
 
+            if artifact_a is None or artifact_b is None:
+                continue
+
+            option_a = lookup.option(link.option_stack_a[-1])
+            option_b = lookup.option(link.option_stack_b[-1])
+
+            if enable_all_conflicts:
                 if missing_option_conflict := ConflictDetector._detect_missing_options(
-                    link, new_network
+                    link, option_a, option_b
                 ):
-                    conflicts.add(missing_option_conflict)
+                    conflicts.setdefault(
+                        missing_option_conflict.id, missing_option_conflict
+                    )
                     continue
 
             if modified_option_conflict := ConflictDetector._detect_modified_options(
-                link, new_network
+                link, new_network, option_a, option_b
             ):
                 # If a conflict with the same cause already exists,
                 # update that conflict with the new conflicts dependent option.
-                existing_conflicts = [
-                    conflict
-                    for conflict in conflicts
-                    if conflict == modified_option_conflict
-                ]
-                if len(existing_conflicts) > 0:
-                    existing_conflict = existing_conflicts[0]
+                existing_conflict = conflicts.get(modified_option_conflict.id)
+                if existing_conflict is not None:
                     existing_conflict.update_dependents(
                         modified_option_conflict
                     )
                 else:
-                    conflicts.add(modified_option_conflict)
-                continue
+                    conflicts[
+                        modified_option_conflict.id
+                    ] = modified_option_conflict
 
         if commit_hash:
-            for conflict in conflicts:
+            for conflict in conflicts.values():
                 conflict.occurred_at = commit_hash
 
-        return conflicts
+        return set(conflicts.values())
 
     @staticmethod
     def _detect_missing_artifact(
-        link: Link, new_network: "Network"
+        link: Link,
+        artifact_a: Optional[ArtifactNode],
+        artifact_b: Optional[ArtifactNode],
     ) -> Optional[MissingArtifactConflict]:
         """Detect a missing artifact conflict."""
-        artifact_a = new_network.find_artifact_node(link.artifact_a)
-        artifact_b = new_network.find_artifact_node(link.artifact_b)
-
         missing_artifacts = []
 
         if artifact_a is None:
@@ -113,18 +144,11 @@ class ConflictDetector:
 
     @staticmethod
     def _detect_missing_options(
-        link: Link, new_network: "Network"
+        link: Link,
+        option_a: Optional[OptionNode],
+        option_b: Optional[OptionNode],
     ) -> Optional[MissingOptionConflict]:
         """Detect a missing option conflict."""
-        artifact_a = new_network.find_artifact_node(link.artifact_a)
-        artifact_b = new_network.find_artifact_node(link.artifact_b)
-
-        if artifact_a is None or artifact_b is None:
-            return None
-
-        option_a = new_network.find_option_node(link.option_stack_a[-1])
-        option_b = new_network.find_option_node(link.option_stack_b[-1])
-
         missing_options = []
 
         node = None
@@ -157,18 +181,12 @@ class ConflictDetector:
     # pylint: disable=too-many-return-statements
     @staticmethod
     def _detect_modified_options(
-        link: Link, new_network: "Network"
+        link: Link,
+        new_network: "Network",
+        option_a: Optional[OptionNode],
+        option_b: Optional[OptionNode],
     ) -> Optional[ModifiedOptionConflict]:
         """Detect either a modified option or a multi value conflict."""
-        artifact_a = new_network.find_artifact_node(link.artifact_a)
-        artifact_b = new_network.find_artifact_node(link.artifact_b)
-
-        if artifact_a is None or artifact_b is None:
-            return None
-
-        option_a = new_network.find_option_node(link.option_stack_a[-1])
-        option_b = new_network.find_option_node(link.option_stack_b[-1])
-
         if option_a is None or option_b is None:
             return None
 
@@ -14,13 +14,35 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import abc
-import logging
-import os
+import copy
 import re
 
-from typing import List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# decimal numbers within values of fraction constraints
+FRACTION_PATTERN = re.compile(r"[\d]+[.][\d]+")
+
 
 class Constraint(abc.ABC):
+    """
+    Immutable validator of option values.
+
+    The syntax regex, the type check and the range check are compiled
+    when a constraint is created, so validating a value only runs the
+    compiled checks.  Constraints with other parameters, e.g. those of a
+    concept dictionary, are created with `with_values`.
+    """
+
+    # parameters that can be set with `with_values`
+    parameters: Tuple[str, ...] = (
+        "option_name",
+        "value_type",
+        "value_syntax",
+        "value_range",
+        "value_set",
+        "can_be_list",
+        "constraint_type",
+    )
 
     def __init__(self,option_name: Optional[str] = None, value_type: Optional[str] = None,
                 value_syntax: Optional[str] = None,
@@ -34,101 +56,135 @@ class Constraint(abc.ABC):
         self.value_set: Optional[List[str]] = value_set
         self.can_be_list: bool = can_be_list
         self.constraint_type = constraint_type
-        if can_be_list:
-            self._convert_syntax_pattern_to_list()
-
-    def overwrite_value(self, parameter: str, value: Any):
-        if(parameter == "option_name"):
-            self.option_name = value
-        if(parameter == "value_type"):
-            self.value_type = value
-        if(parameter == "value_syntax"):
-            self.value_syntax = value
-        if(parameter == "value_range"):
-            self.value_range = value
-        if(parameter == "value_set"):
-            self.value_set = value
-        if(parameter == "can_be_list"):
-            self.can_be_list = value
-        if(parameter == "constraint_type"):
-            self.constraint_type = value
-        if(parameter == "can_be_list"):
-            if value:
-                self._convert_syntax_pattern_to_list()
-        
+        self._compile()
 
-    def _validate_type(self, value) -> bool:
-        #TODO
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        super().__setattr__(name, value)
+
+    def with_values(self, values: Dict[str, Any]) -> "Constraint":
+        """
+        Create a copy of the constraint with other parameters.
+
+        :param values: parameters to be replaced, unknown parameters are
+            ignored
+        :return: new constraint
+        """
+        constraint = copy.copy(self)
+        object.__setattr__(constraint, "_frozen", False)
+        for parameter, value in values.items():
+            if parameter in self.parameters:
+                setattr(constraint, parameter, value)
+        constraint._compile()
+        return constraint
+
+    def validate_many(self, values: Iterable[Any]) -> List[bool]:
+        """
+        Validate a column of values.
+
+        Each distinct value is only validated once.
+
+        :param values: values to be validated
+        :return: whether each value satisfies the constraint
+        """
+        results: Dict[Any, bool] = {}
+        valid = []
+        for value in values:
+            result = results.get(value)
+            if result is None:
+                result = results[value] = self.validate_value(value)
+            valid.append(result)
+        return valid
+
+    def _compile(self) -> None:
+        self._syntax_regex = (
+            re.compile(self.value_syntax)
+            if self.value_syntax is not None
+            else None
+        )
+        self._type_check = self._compile_type_check()
+        self._range_check = self._compile_range_check()
+        self._value_set = (
+            frozenset(self.value_set) if self.value_set is not None else None
+        )
+        self._frozen = True
+
+    def _compile_type_check(self) -> Optional[Callable[[Any], bool]]:
         if self.value_type == "int":
-            try:
-                if isinstance(int(value), int):
-                    return True
-                else:
-                    return False
-            except:
-                return False
+            return Constraint._converts(int)
         if self.value_type == "string":
-            return isinstance(value, str)
+            return lambda value: isinstance(value, str)
         if self.value_type == "fraction":
-            try:
-                if isinstance(float(value), float):
-                    return True
-                else:
+            return Constraint._converts(float)
+        return None
+
+    def _compile_range_check(self) -> Optional[Callable[[Any], bool]]:
+        if self.value_range is None or self.value_range == [None, None]:
+            return None
+        lower, upper = self.value_range[0], self.value_range[1]
+
+        if self.value_type == "int":
+            lower = lower if isinstance(lower, int) else None
+            upper = upper if isinstance(upper, int) else None
+
+            def check_int(value: Any) -> bool:
+                try:
+                    number = int(value)
+                except (TypeError, ValueError):
                     return False
-            except:
+                if lower is not None and number < lower:
+                    return False
+                return upper is None or number <= upper
+
+            return check_int
+
+        if self.value_type == "fraction":
+            if lower is None and upper is None:
+                return None
+
+            def check_fraction(value: Any) -> bool:
+                for part in FRACTION_PATTERN.findall(str(value)):
+                    number = float(part)
+                    if lower is not None and number < lower:
+                        return False
+                    if upper is not None and number > upper:
+                        return False
+                return True
+
+            return check_fraction
+
+        return None
+
+    @staticmethod
+    def _converts(convert: Callable[[Any], Any]) -> Callable[[Any], bool]:
+        def check(value: Any) -> bool:
+            try:
+                convert(value)
+            except (TypeError, ValueError):
                 return False
-        return True
+            return True
+
+        return check
+
+    def _validate_type(self, value) -> bool:
+        return self._type_check is None or self._type_check(value)
 
     def _validate_syntax(self, value) -> bool:
-        if(self.value_syntax == None):
+        if self._syntax_regex is None:
             return True
-        syntax_test = re.compile(self.value_syntax)
-        if syntax_test.match(value):
+        if self._syntax_regex.match(value):
             return True
         return False
-    
+
     def _validate_range(self, value) -> bool:
-        if(self.value_range == None or self.value_range == [None, None]):
-                return True
-        result = True
-        if self.value_type == "int":
-            try:
-                value = int(value)
-            except:
-                return False
-            #numerical_value_parts = re.findall(r"-{0,1}\d+", str(value))            
-            #for num in numerical_value_parts:
-            if(not isinstance(self.value_range[1], int) and isinstance(self.value_range[0], int)):
-                return (int(value) >= self.value_range[0])
-            if(not isinstance(self.value_range[0], int) and isinstance(self.value_range[1], int)):
-                return (int(value) <= self.value_range[1])
-            if(isinstance(self.value_range[0], int) and isinstance(self.value_range[1], int)):
-                return (int(value) >= self.value_range[0] and
-                                     int(value) <= self.value_range[1])
-            else:
-                result = True
-        #TODO fractions
-        if self.value_type == "fraction":
-            numerical_value_parts = re.findall(r"[\d]+[.][\d]+", str(value))            
-            for num in numerical_value_parts:            
-                if(self.value_range[1] == None):
-                    result = result and (float(num) >= self.value_range[0])
-                if(self.value_range[0] == None):
-                    result = result and (float(num) <= self.value_range[1])
-                else:
-                    result = result and (float(num) >= self.value_range[0] and
-                                         float(num) <= self.value_range[1])
-        return result
-    
+        return self._range_check is None or self._range_check(value)
+
     def _validate_set(self, value) -> bool:
-        if(self.value_set == None):
-            return True 
-        return (value in self.value_set)
-    
-    def _convert_syntax_pattern_to_list(self) -> None:        
-        list_pattern = "^\[(\"|'){0,1}(" + self.value_syntax[1:-1] + ")(\"|'){0,1}(,[ ]{0,1}(\"|'){0,1}" + self.value_syntax[1:-1] + "(\"|'){0,1})*\]$"
-        return list_pattern
-    
+        if self._value_set is None:
+            return True
+        return value in self._value_set
+
     @abc.abstractmethod
     def validate_value(self, value: Any) -> bool:
         """
@@ -171,13 +227,24 @@ class DictConstraint(Constraint):
     pass
 
 class UserDefConstraint(Constraint):
+    parameters = (
+        "value_type",
+        "value_syntax",
+        "value_range",
+        "value_set",
+        "sufix",
+        "prefix",
+        "stem",
+        "constraint_type",
+    )
+
     def __init__(self):
-        super().__init__(
-            constraint_type = "special"
-            )
         self.prefix = None,
         self.stem = None,
         self.sufix = None,     
+        super().__init__(
+            constraint_type = "special"
+            )
     
     def validate_value(self, value: Any) -> bool:
         result = True
@@ -190,24 +257,6 @@ class UserDefConstraint(Constraint):
         if self.value_set != None:
             result = result and self._validate_set(value)
         return result
-    
-    def overwrite_value(self, parameter: str, value: Any):
-        if(parameter == "value_type"):
-            self.value_type = value
-        if(parameter == "value_syntax"):
-            self.value_syntax = value
-        if(parameter == "value_range"):
-            self.value_range = value
-        if(parameter == "value_set"):
-            self.value_set = value
-        if(parameter == "sufix"):
-            self.sufix = value
-        if(parameter == "prefix"):
-            self.prefix = value
-        if(parameter == "stem"):
-            self.stem = value
-        if(parameter == "constraint_type"):
-            self.constraint_type = value
 
     def is_responsible(self, option_name: str) -> bool:
         result = False
@@ -287,12 +336,12 @@ class IdConstraint(NumericalConstraint):
 
 class NameConstraint(StringConstraint):
     def __init__(self, length = None):
+        self.length = length
         super().__init__(
             value_type = "string",
             value_syntax = r"^([a-zA-Z0-9#,;()._|/+{}$ -]+)$",
             constraint_type = "name"
             )
-        self.length = length
     
     #maximum length of name
     def _validate_special_constraints(self, value: Any):
@@ -305,12 +354,12 @@ class NameConstraint(StringConstraint):
 #pep508 naming
 class PEPNameConstraint(StringConstraint):
     def __init__(self, length = None):
+        self.length = length
         super().__init__(
             value_type = "string",
             value_syntax = r"^([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9._\-]*[a-zA-Z0-9])$",
             constraint_type = "pepname"
             )
-        self.length = length
     
     #maximum length of name
     def _validate_special_constraints(self, value: Any):
@@ -322,12 +371,12 @@ class PEPNameConstraint(StringConstraint):
 
 class MessageConstraint(StringConstraint):
     def __init__(self, length = None):
+        self.length = length
         super().__init__(
             value_type = "string",
             value_syntax = r"^([a-zA-Z0-9][a-zA-Z0-9. _!?-]*[a-zA-Z0-9!?.])$",
             constraint_type = "message"
             )
-        self.length = length
     
     #maximum length of name
     def _validate_special_constraints(self, value: Any):
@@ -339,12 +388,12 @@ class MessageConstraint(StringConstraint):
 
 class UsernameConstraint(StringConstraint):
     def __init__(self, length = None):
+        self.length = length
         super().__init__(
             value_type = "string",
             value_syntax = r"^[a-zA-Z][a-zA-Z0-9]*$",
             constraint_type = "username"
             )
-        self.length = length
     
     #maximum length of name
     def _validate_special_constraints(self, value: Any):
@@ -357,12 +406,12 @@ class UsernameConstraint(StringConstraint):
 
 class PasswordConstraint(StringConstraint):
     def __init__(self, length = None):
+        self.length = length
         super().__init__(
             value_type = "string",
             value_syntax = r".*",
             constraint_type = "password"
             )
-        self.length = length
     
     #maximum length of name
     def _validate_special_constraints(self, value: Any):
@@ -412,13 +461,13 @@ class DomainNameConstraint(StringConstraint):
 class PathConstraint(StringConstraint):
     #TODO include partial and directory path
     def __init__(self, file_format = None):
+        self.file_format = file_format
         super().__init__(
             value_type = "string",
             value_syntax = r"^(([A-Z]:){0,1}[/]{0,1}([a-zA-Z0-9._${}~!&'()+,;=@ -])+|[/]|[.][.][/])+$",
             #value_syntax = r".*",
             constraint_type = "path"
             )
-        self.file_format = file_format
 
     def _validate_special_constraints(self, value) -> bool:
         if self.file_format == None:
@@ -0,0 +1,140 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import logging
+import hashlib
+
+from typing import Dict, List, Optional, Sequence
+from cfgnet.constraints.constraint_detector import ValueRow, Violation
+from cfgnet.constraints.constraint_registry import ConstraintRegistry
+
+
+class ConstraintCache:
+    """
+    Persistent cache of the constraint violations of artifacts.
+
+    Entries are content-addressed: the key is a hash of the concept and
+    the value rows of an artifact, i.e. of everything its constraints are
+    checked against.  All entries are discarded when the constraints or
+    the concept dictionaries change.  Only the entries used by the last
+    run are written, so the cache does not outgrow the project.
+    """
+
+    # bump when the layout of the cache file changes
+    version: int = 1
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: Dict[str, List[Violation]] = {}
+        self._used: Dict[str, List[Violation]] = {}
+
+    @staticmethod
+    def key(concept: str, rows: Sequence[ValueRow]) -> str:
+        """
+        Create the cache key of an artifact.
+
+        :param concept: concept of the artifact
+        :param rows: value rows of the artifact
+        :return: hex digest identifying the cache entry
+        """
+        key_parts = [concept]
+        for config_type, option_name, value in rows:
+            key_parts += (config_type.name, option_name, value)
+        content = "\0".join(key_parts)
+        return hashlib.sha1(content.encode()).hexdigest()
+
+    def load(self) -> None:
+        """Load the entries of the cache file if it is still valid."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logging.debug("Discard corrupt constraint cache %s", self.path)
+            return
+
+        if not isinstance(data, dict) or data.get("version") != [
+            ConstraintCache.version,
+            ConstraintRegistry.get_dict_version(),
+        ]:
+            return
+
+        self._entries = {
+            key: [(index, constraint_type) for index, constraint_type in rows]
+            for key, rows in data.get("entries", {}).items()
+        }
+
+    def get(self, key: str) -> Optional[List[Violation]]:
+        """
+        Return the cached violations of an artifact.
+
+        :param key: cache key of the artifact
+        :return: violations or None if there is no entry
+        """
+        violations = self._entries.get(key)
+        if violations is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._used[key] = violations
+        return violations
+
+    def put(self, key: str, violations: List[Violation]) -> None:
+        """
+        Store the violations of an artifact.
+
+        :param key: cache key of the artifact
+        :param violations: violations found in the artifact
+        """
+        self._entries[key] = violations
+        self._used[key] = violations
+
+    def clear(self) -> None:
+        """Remove the cache file and all entries."""
+        self._entries = {}
+        self._used = {}
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def save(self) -> None:
+        """Replace the cache file with the entries used by this run."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        data = {
+            "version": [
+                ConstraintCache.version,
+                ConstraintRegistry.get_dict_version(),
+            ],
+            "entries": self._used,
+        }
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file)
+            os.replace(tmp_path, self.path)
+        except OSError as error:
+            logging.debug("Could not write constraint cache: %s", error)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
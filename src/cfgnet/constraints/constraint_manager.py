@@ -1,6 +1,16 @@
-from typing import List, Set, Optional
+import logging
 
-from cfgnet.constraints.constraint_detector import ConstraintDetector
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Set, Optional, Tuple
+
+from cfgnet.constraints.constraint_cache import ConstraintCache
+from cfgnet.constraints.constraint_template import ConstraintTemplate
+from cfgnet.constraints.constraint_detector import (
+    ConstraintDetector,
+    ValueRow,
+    Violation,
+    find_violations,
+)
 from cfgnet.network.nodes import ArtifactNode
 from cfgnet.plugins.plugin_manager import PluginManager
 from cfgnet.constraints.constraint import *
@@ -21,6 +31,71 @@ class ConstraintManager():
     def check_constraints(self, artifact_node):
         cd = ConstraintDetector()
         return cd.check_constraints(artifact_node)
+
+    def check_network_constraints(
+        self,
+        network,
+        jobs: int = 1,
+        cache: Optional[ConstraintCache] = None,
+    ) -> List[ConstraintViolationConflict]:
+        """
+        Check the constraints of all artifacts of a network.
+
+        Artifacts whose violations are cached are not checked again, the
+        remaining artifacts are checked in worker processes.
+
+        :param network: network to be checked
+        :param jobs: number of worker processes, 1 checks in this process
+        :param cache: cache of the violations of artifacts
+        :return: violations in the order of the artifacts
+        """
+        artifacts = list(network.get_nodes(ArtifactNode))
+        value_nodes = [artifact.get_nodes() for artifact in artifacts]
+        check_jobs: List[Tuple[str, List[ValueRow]]] = [
+            (
+                artifact.concept_name,
+                ConstraintDetector.get_value_rows(artifact, nodes),
+            )
+            for artifact, nodes in zip(artifacts, value_nodes)
+        ]
+
+        keys: List[str] = []
+        results: List[Optional[List[Violation]]] = []
+        for concept, rows in check_jobs:
+            if cache is None:
+                keys.append("")
+                results.append(None)
+                continue
+            key = ConstraintCache.key(concept, rows)
+            keys.append(key)
+            results.append(cache.get(key))
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        checked = self._find_violations([check_jobs[i] for i in missing], jobs)
+        for i, violations in zip(missing, checked):
+            results[i] = violations
+            if cache is not None:
+                cache.put(keys[i], violations)
+
+        conflicts: List[ConstraintViolationConflict] = []
+        for i, artifact in enumerate(artifacts):
+            conflicts += ConstraintDetector.create_conflicts(
+                artifact, value_nodes[i], results[i] or []
+            )
+        return conflicts
+
+    @staticmethod
+    def _find_violations(
+        check_jobs: List[Tuple[str, List[ValueRow]]], jobs: int
+    ) -> List[List[Violation]]:
+        if jobs <= 1 or len(check_jobs) <= 1:
+            return [find_violations(job) for job in check_jobs]
+
+        chunksize = max(1, len(check_jobs) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(
+                executor.map(find_violations, check_jobs, chunksize=chunksize)
+            )
     
     def compare_constraints(self, old_constraints: set, new_constraints:set):
         conflicts = old_constraints.difference(new_constraints)
@@ -33,29 +108,63 @@ class ConstraintManager():
         #if nodelist exist, get the pairs for each artifact
         return_set: Set = set()
         for artifact_node in artifact_node_list:
-            cd = ConstraintDetector()
-            result_set = cd.find_constraint_types(artifact_node)
+            result_set = self.get_artifact_constraint_types(artifact_node)
             for result in result_set:
                 return_set.add(result)
         return return_set
+
+    def get_artifact_constraint_types(self, artifact_node: ArtifactNode):
+        cd = ConstraintDetector()
+        return cd.find_constraint_types(artifact_node)
     
-    def convert_templates_to_conflicts(self, old_templates: set, new_templates: set):
-        difference = old_templates.difference(new_templates)
+    def convert_templates_to_conflicts(
+        self,
+        old_templates: Set[ConstraintTemplate],
+        new_templates: Set[ConstraintTemplate],
+    ) -> Set[ConstraintViolationConflict]:
+        """
+        Create conflicts for templates whose constraint type changed.
+
+        Each template of the reference network that is not part of the new
+        network is joined with a new template of the same option.
+
+        :param old_templates: templates of the reference network
+        :param new_templates: templates of the new network
+        :return: conflicts of the changed templates
+        """
+        # the first new template of an option is used, as it was when all
+        # new templates were scanned for every changed template
+        new_by_option: Dict[Tuple[str, str], ConstraintTemplate] = {}
+        for elem in new_templates:
+            new_by_option.setdefault(self._get_template_key(elem), elem)
+
         conflict_set = set()
-        for diff in difference:
-            artifact = diff.artifact
-            old_value = diff.value
+        for diff in old_templates.difference(new_templates):
             old_constraint = str(diff.value.config_type).split(".")[-1]
-            value_created = False
-            for elem in new_templates:
-                if (str(diff.artifact.file_path) + str (diff.option.display_option_id)) == (str(elem.artifact.file_path) + str (elem.option.display_option_id)):
-                    option = elem.option
-                    new_value = elem.value
-                    new_constraint = elem.constraint_type
-                    conflict_set.add(ConstraintViolationConflict(artifact, option, new_value, new_constraint, True, old_value, old_constraint))
-                    value_created = True
-                    break
-            if not value_created:
-                logging.error(f"Error while creating ConstraintViolationConflict for {diff}")
-            
-        return conflict_set
\ No newline at end of file
+            elem = new_by_option.get(self._get_template_key(diff))
+            if elem is None:
+                logging.error(
+                    "Error while creating ConstraintViolationConflict for %s",
+                    diff,
+                )
+                continue
+            conflict_set.add(
+                ConstraintViolationConflict(
+                    diff.artifact,
+                    elem.option,
+                    elem.value,
+                    elem.constraint_type,
+                    True,
+                    diff.value,
+                    old_constraint,
+                )
+            )
+
+        return conflict_set
+
+    @staticmethod
+    def _get_template_key(template: ConstraintTemplate) -> Tuple[str, str]:
+        return (
+            str(template.artifact.file_path),
+            str(template.option.display_option_id),
+        )
@@ -0,0 +1,303 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import re
+import json
+import hashlib
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint import (
+    BooleanConstraint,
+    ClassConstraint,
+    Constraint,
+    CountConstraint,
+    DomainNameConstraint,
+    EmailConstraint,
+    FractionConstraint,
+    IpAddressConstraint,
+    LanguageConstraint,
+    MessageConstraint,
+    MimeConstraint,
+    NameConstraint,
+    NumberConstraint,
+    PasswordConstraint,
+    PathConstraint,
+    PatternConstraint,
+    PEPNameConstraint,
+    PermissionConstraint,
+    PortConstraint,
+    SizeConstraint,
+    SpeedConstraint,
+    TimeConstraint,
+    UrlConstraint,
+    UserDefConstraint,
+    UsernameConstraint,
+    VersionNumberConstraint,
+)
+
+CONSTRAINT_DICTS_DIR = os.path.join(
+    os.path.dirname(__file__), "constraint_dicts"
+)
+
+# parameters a concept dictionary may overwrite
+CONSTRAINT_PARAMETERS = {
+    "option_name",
+    "value_type",
+    "value_syntax",
+    "value_range",
+    "value_set",
+    "can_be_list",
+    "constraint_type",
+}
+SPECIAL_TYPE_PARAMETERS = {
+    "value_type",
+    "value_syntax",
+    "value_range",
+    "value_set",
+    "prefix",
+    "stem",
+    "sufix",
+    "constraint_type",
+}
+
+
+class ConstraintRegistry:
+    """
+    Static registry of the constraints of all config types and concepts.
+
+    The concept dictionaries are loaded and validated once per process.
+    A constraint is created once for each config type and concept, with
+    the values of the concept dictionary applied, and shared by all value
+    nodes of that type and concept.
+    """
+
+    # bump when the validation of constraints changes
+    version: int = 1
+
+    constraint_classes: Dict[ConfigType, Type[Constraint]] = {
+        ConfigType.TIME: TimeConstraint,
+        ConfigType.PORT: PortConstraint,
+        ConfigType.VERSION_NUMBER: VersionNumberConstraint,
+        ConfigType.FRACTION: FractionConstraint,
+        ConfigType.SPEED: SpeedConstraint,
+        ConfigType.PERMISSION: PermissionConstraint,
+        ConfigType.COUNT: CountConstraint,
+        ConfigType.SIZE: SizeConstraint,
+        ConfigType.IP_ADDRESS: IpAddressConstraint,
+        ConfigType.NAME: NameConstraint,
+        ConfigType.USERNAME: UsernameConstraint,
+        ConfigType.PASSWORD: PasswordConstraint,
+        ConfigType.URL: UrlConstraint,
+        ConfigType.EMAIL: EmailConstraint,
+        ConfigType.DOMAIN_NAME: DomainNameConstraint,
+        ConfigType.PATH: PathConstraint,
+        ConfigType.PATTERN: PatternConstraint,
+        ConfigType.LANGUAGE: LanguageConstraint,
+        ConfigType.MIME: MimeConstraint,
+        ConfigType.CLASS: ClassConstraint,
+        ConfigType.BOOLEAN: BooleanConstraint,
+        ConfigType.NUMBER: NumberConstraint,
+        ConfigType.MESSAGE: MessageConstraint,
+        ConfigType.PEPNAME: PEPNameConstraint,
+    }
+
+    _concept_dicts: Optional[Dict[str, Dict[str, Any]]] = None
+    _constraints: Dict[Tuple[ConfigType, str], Optional[Constraint]] = {}
+    _special_constraints: Dict[str, List[UserDefConstraint]] = {}
+    _dict_version: Optional[str] = None
+
+    @staticmethod
+    def get_constraint(
+        config_type: ConfigType, concept: Optional[str] = None
+    ) -> Optional[Constraint]:
+        """
+        Return the constraint of a config type.
+
+        :param config_type: config type of an option
+        :param concept: concept of the artifact of the option
+        :return: shared constraint or None if there is no constraint
+        """
+        key = (config_type, concept or "")
+        try:
+            return ConstraintRegistry._constraints[key]
+        except KeyError:
+            pass
+
+        constraint_class = ConstraintRegistry.constraint_classes.get(
+            config_type
+        )
+        constraint = None
+        if constraint_class is not None:
+            constraint = ConstraintRegistry._with_concept_values(
+                constraint_class(),
+                ConstraintRegistry.get_concept_dict(concept),
+            )
+
+        ConstraintRegistry._constraints[key] = constraint
+        return constraint
+
+    @staticmethod
+    def get_special_constraints(
+        concept: Optional[str],
+    ) -> List[UserDefConstraint]:
+        """
+        Return the user defined constraints of a concept.
+
+        :param concept: concept of an artifact
+        :return: constraints of the special types of the concept dictionary
+        """
+        key = concept or ""
+        special_constraints = ConstraintRegistry._special_constraints.get(key)
+        if special_constraints is not None:
+            return special_constraints
+
+        special_constraints = []
+        concept_dict = ConstraintRegistry.get_concept_dict(concept)
+        if concept_dict is not None:
+            for special_type in concept_dict.get("special_type", {}).values():
+                special_constraint = UserDefConstraint().with_values(
+                    special_type
+                )
+                special_constraints.append(
+                    ConstraintRegistry._with_concept_values(
+                        special_constraint, concept_dict
+                    )
+                )
+
+        ConstraintRegistry._special_constraints[key] = special_constraints
+        return special_constraints
+
+    @staticmethod
+    def get_concept_dict(concept: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Return the dictionary that overwrites the constraints of a concept.
+
+        :param concept: concept of an artifact
+        :return: concept dictionary or None if there is none
+        """
+        if not concept:
+            return None
+        return ConstraintRegistry._get_concept_dicts().get(concept)
+
+    @staticmethod
+    def get_dict_version() -> str:
+        """
+        Return the version of the constraints and concept dictionaries.
+
+        The version changes whenever a concept dictionary or the version
+        of the registry changes, so results of constraint checks can be
+        reused as long as the version is the same.
+
+        :return: hex digest of the registry version and all dictionaries
+        """
+        if ConstraintRegistry._dict_version is None:
+            content = json.dumps(
+                [
+                    ConstraintRegistry.version,
+                    ConstraintRegistry._get_concept_dicts(),
+                ],
+                sort_keys=True,
+            )
+            ConstraintRegistry._dict_version = hashlib.sha1(
+                content.encode()
+            ).hexdigest()
+        return ConstraintRegistry._dict_version
+
+    @staticmethod
+    def load_concept_dicts(dict_dir: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load and validate the concept dictionaries of a directory.
+
+        :param dict_dir: directory containing JSON files
+        :return: concept dictionaries by concept names
+        :raises ValueError: if a dictionary is invalid
+        """
+        concept_dicts = {}
+        for file_name in sorted(os.listdir(dict_dir)):
+            if not file_name.endswith(".json"):
+                continue
+            file_path = os.path.join(dict_dir, file_name)
+            with open(file_path, "r", encoding="utf-8") as dict_file:
+                concept_dict = json.load(dict_file)
+            try:
+                ConstraintRegistry._validate_concept_dict(concept_dict)
+            except ValueError as error:
+                raise ValueError(f"{file_path}: {error}") from None
+            concept_dicts[concept_dict["concept"]] = concept_dict
+        return concept_dicts
+
+    @staticmethod
+    def reset() -> None:
+        """Discard all loaded dictionaries and created constraints."""
+        ConstraintRegistry._concept_dicts = None
+        ConstraintRegistry._constraints = {}
+        ConstraintRegistry._special_constraints = {}
+        ConstraintRegistry._dict_version = None
+
+    @staticmethod
+    def _get_concept_dicts() -> Dict[str, Dict[str, Any]]:
+        if ConstraintRegistry._concept_dicts is None:
+            ConstraintRegistry._concept_dicts = (
+                ConstraintRegistry.load_concept_dicts(CONSTRAINT_DICTS_DIR)
+            )
+        return ConstraintRegistry._concept_dicts
+
+    @staticmethod
+    def _validate_concept_dict(concept_dict: Any) -> None:
+        if not isinstance(concept_dict, dict) or not isinstance(
+            concept_dict.get("concept"), str
+        ):
+            raise ValueError("missing concept")
+
+        sections = (
+            ("constraint_types", CONSTRAINT_PARAMETERS),
+            ("special_type", SPECIAL_TYPE_PARAMETERS),
+        )
+        for section, parameters in sections:
+            entries = concept_dict.get(section, {})
+            if not isinstance(entries, dict):
+                raise ValueError(f"{section} is not an object")
+            for name, values in entries.items():
+                if not isinstance(values, dict):
+                    raise ValueError(f"{section}.{name} is not an object")
+                unknown = set(values) - parameters
+                if unknown:
+                    raise ValueError(
+                        f"{section}.{name} has unknown parameters "
+                        f"{', '.join(sorted(unknown))}"
+                    )
+                try:
+                    re.compile(values.get("value_syntax") or "")
+                except re.error as error:
+                    raise ValueError(
+                        f"{section}.{name} has an invalid value_syntax: "
+                        f"{error}"
+                    ) from None
+
+    @staticmethod
+    def _with_concept_values(
+        constraint: Any, concept_dict: Optional[Dict[str, Any]]
+    ) -> Any:
+        """Apply the values of a concept dictionary to a constraint."""
+        if concept_dict is None:
+            return constraint
+        values = concept_dict.get("constraint_types", {}).get(
+            constraint.constraint_type
+        )
+        if not values:
+            return constraint
+        return constraint.with_values(values)
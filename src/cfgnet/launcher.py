@@ -3,19 +3,27 @@ import sys
 import time
 import logging
 import json
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 import click
 
-from cfgnet.network.nodes import ArtifactNode
 from cfgnet.utility import logger
 from cfgnet.network.network import Network
 from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.network_diff import NetworkDiff
+from cfgnet.network.parse_cache import ParseCache
 from cfgnet.launcher_configuration import LauncherConfiguration
 from cfgnet.analyze.analyzer import Analyzer
+from cfgnet.analyze.conflict_writer import ConflictWriter
+from cfgnet.analyze.delta_store import DeltaStore
 from cfgnet.linker.linker_manager import LinkerManager
 from cfgnet.plugins.plugin_manager import PluginManager
 from cfgnet.errors.error_detector import ErrorDetector
+from cfgnet.constraints.constraint_cache import ConstraintCache
 from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.vcs.git import Git
+from cfgnet.utility.profiler import Profiler
 
 
 add_project_root_argument = click.argument(
@@ -41,6 +49,58 @@ add_disable_linker_option = click.option(
     "To enable multiple linkers, pass the option for each of them, i.e.  "
     "`--disable-linker foo --disable-linker bar`.",
 )
+add_jobs_option = click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to parse configuration files.",
+)
+
+
+def _enable_profiler(ctx: click.Context, param, enabled: bool) -> None:
+    """Enable the profiler and report its results when a command ends."""
+    if not enabled:
+        return
+
+    def report() -> None:
+        Profiler.disable()
+        # arguments are parsed once the callback of the option ran
+        project_root = ctx.params.get("project_root") or os.getcwd()
+        data_dir = os.path.join(
+            os.path.abspath(project_root), NetworkConfiguration.cfgnet_path_rel
+        )
+        profile_path = Profiler.write(data_dir)
+        print(Profiler.summary())
+        logging.info("Wrote profile to %s", profile_path)
+
+    # `--cprofile` implies `--profile`, the profiler is enabled only once
+    if "profile" not in ctx.meta:
+        ctx.meta["profile"] = True
+        Profiler.enable()
+        ctx.call_on_close(report)
+    if param.name == "cprofile":
+        Profiler.cprofile = True
+
+
+def add_profile_option(command):
+    """Add the `--profile` and `--cprofile` options to a command."""
+    command = click.option(
+        "--cprofile",
+        is_flag=True,
+        expose_value=False,
+        callback=_enable_profiler,
+        help="Like --profile and dump a cProfile of each phase into "
+        ".cfgnet/profile/.",
+    )(command)
+    return click.option(
+        "--profile",
+        is_flag=True,
+        expose_value=False,
+        callback=_enable_profiler,
+        help="Record time and memory of each phase in "
+        ".cfgnet/profile.json and print a summary.",
+    )(command)
 
 
 @click.group()
@@ -60,6 +120,8 @@ def main(verbose: bool):
 @add_project_root_argument
 @add_enable_linker_option
 @add_disable_linker_option
+@add_jobs_option
+@add_profile_option
 def init(
     enable_static_blacklist: bool,
     enable_internal_links: bool,
@@ -68,6 +130,7 @@ def init(
     enable_linker: List[str],
     disable_linker: List[str],
     config_files: List,
+    jobs: int,
 ):
     """Initialize configuration network."""
     project_name = os.path.basename(project_root)
@@ -80,6 +143,7 @@ def init(
         enable_internal_links=enable_internal_links,
         enabled_linkers=list(set(enable_linker) - set(disable_linker)),
         enable_all_conflicts=enable_all_conflicts,
+        jobs=jobs,
     )
     LinkerManager.set_enabled_linkers(network_configuration.enabled_linkers)
     logger.configure_repo_logger(network_configuration.logfile_path())
@@ -94,20 +158,28 @@ def init(
     logging.info("Done in [%s s]", str(completion_time))
 
 @main.command()
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only parse configuration files changed since the reference network.",
+)
 @add_project_root_argument
-def validate(project_root: str):
+@add_profile_option
+def validate(project_root: str, incremental: bool):
     """Validate a reference network against a new network."""
     project_name = os.path.basename(project_root)
     logging.info("Validate configuration network for %s.", project_name)
 
     start = time.time()
 
-    ref_network = Network.load_network(project_root=project_root)
+    ref_network = Network.load_network(
+        project_root=project_root, parts=["links", "option_constraints"]
+    )
     logger.configure_repo_logger(ref_network.cfg.logfile_path())
 
     # TODO Network should configure LinkerManager with list of enabled linkers
 
-    conflicts, new_network = ref_network.validate()
+    conflicts, new_network = ref_network.validate(incremental=incremental)
     constraint_difference = new_network.option_constraints.difference(ref_network.option_constraints)
     new_network.conflicts = conflicts
     new_network.save()
@@ -133,24 +205,38 @@ def validate(project_root: str):
     sys.exit(1)
       
 @main.command()
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used to check constraints.",
+)
 @add_project_root_argument
-def checkconstraints(project_root: str):
+@add_profile_option
+def checkconstraints(project_root: str, jobs: int):
     """Validating constraints of a network."""
     project_name = os.path.basename(project_root)
     logging.info("Validate constraints configuration network for %s.", project_name)
 
     start = time.time()
 
-    network = Network.load_network(project_root=project_root)
+    network = Network.load_network(
+        project_root=project_root, parts=["constraint_violations"]
+    )
     logger.configure_repo_logger(network.cfg.logfile_path())
 
     cm = ConstraintManager()
-    node_list = network.get_nodes(ArtifactNode)
-    found_violations = []
-    for node in node_list:
-        result = cm.check_constraints(node)
-        if result != None:
-            found_violations += result
+    cache = ConstraintCache(network.cfg.constraint_cache_path())
+    cache.load()
+    with Profiler.phase("constraint_checking"):
+        found_violations = cm.check_network_constraints(
+            network, jobs=jobs, cache=cache
+        )
+    cache.save()
+    logging.debug(
+        "Constraint cache: %s hits, %s misses", cache.hits, cache.misses
+    )
     network.constraint_violations = found_violations
     network.save()
     if len(found_violations) > 0:
@@ -166,9 +252,12 @@ def checkconstraints(project_root: str):
 
 @main.command
 @add_project_root_argument
+@add_profile_option
 def correctconstraints(project_root: str):
     start = time.time()
-    network = Network.load_network(project_root=project_root)
+    network = Network.load_network(
+        project_root=project_root, parts=["constraint_violations"]
+    )
     for counter in range(len(network.constraint_violations)):
         obj = network.constraint_violations[counter]
         var = input(f"Please input new Value for {obj.option.display_option_id} in Artifact {obj.artifact.rel_file_path} (expected {obj.option.config_type}-type): ")
@@ -212,13 +301,16 @@ def correctconstraints(project_root: str):
     
 @main.command()
 @add_project_root_argument
+@add_profile_option
 def validateconstraints(project_root: str):
     project_name = os.path.basename(project_root)
     logging.info("Validate configuration network for %s.", project_name)
 
     start = time.time()
     cm = ConstraintManager()
-    ref_network = Network.load_network(project_root=project_root)
+    ref_network = Network.load_network(
+        project_root=project_root, parts=["option_constraints"]
+    )
     logger.configure_repo_logger(ref_network.cfg.logfile_path())
     new_network = Network.init_network(ref_network.cfg)
     detected_conflicts = ref_network.option_constraints.difference(new_network.option_constraints)
@@ -241,6 +333,7 @@ def validateconstraints(project_root: str):
 @main.command()
 @click.option("-r", "--replace-old-values", is_flag=True)
 @add_project_root_argument
+@add_profile_option
 def solve(
     replace_old_values: bool,
     project_root: str    
@@ -251,7 +344,10 @@ def solve(
 
     start = time.time()
 
-    ref_network = Network.load_network(project_root=project_root)
+    ref_network = Network.load_network(
+        project_root=project_root,
+        parts=["conflicts", "constraint_conflicts"],
+    )
     logger.configure_repo_logger(ref_network.cfg.logfile_path())
     cm = ConstraintManager()
     # 1) Correct Dependency Errors
@@ -304,9 +400,54 @@ def solve(
 @click.option("-i", "--enable-internal-links", is_flag=True)
 @click.option("-c", "--enable-all-conflicts", is_flag=True)
 @click.option("-f", "--config-files", multiple=True)
+@click.option(
+    "--no-checkout",
+    is_flag=True,
+    help="Read configuration files of each commit from the git object "
+    "database instead of checking out the commit.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes analyzing contiguous ranges of the commit "
+    "history.  More than one worker implies --no-checkout.",
+)
+@click.option("--since", help="Only analyze commits more recent than a date.")
+@click.option("--until", help="Only analyze commits older than a date.")
+@click.option(
+    "--max-commits",
+    type=click.IntRange(min=1),
+    help="Only analyze this number of commits, starting with the oldest.",
+)
+@click.option(
+    "--first-parent",
+    is_flag=True,
+    help="Only follow the first parent of merge commits.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted analysis from its last checkpoint.",
+)
+@click.option(
+    "--checkpoint-interval",
+    type=click.IntRange(min=0),
+    default=1000,
+    help="Save a checkpoint after this number of commits, 0 disables "
+    "checkpoints.",
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(ConflictWriter.formats),
+    default="csv",
+    help="Write detected conflicts as CSV or as JSON lines.",
+)
 @add_project_root_argument
 @add_enable_linker_option
 @add_disable_linker_option
+@add_jobs_option
+@add_profile_option
 def analyze(
     enable_static_blacklist: bool,
     enable_internal_links: bool,
@@ -315,6 +456,16 @@ def analyze(
     enable_linker: List[str],
     disable_linker: List[str],
     config_files: List,
+    jobs: int,
+    no_checkout: bool,
+    workers: int,
+    since: Optional[str],
+    until: Optional[str],
+    max_commits: Optional[int],
+    first_parent: bool,
+    resume: bool,
+    checkpoint_interval: int,
+    output_format: str,
 ):
     """Run self-evaluating analysis of commit history."""
     project_name = os.path.basename(project_root)
@@ -328,6 +479,7 @@ def analyze(
         enable_internal_links=enable_internal_links,
         enabled_linkers=list(set(enable_linker) - set(disable_linker)),
         enable_all_conflicts=enable_all_conflicts,
+        jobs=jobs,
     )
     LinkerManager.set_enabled_linkers(network_configuration.enabled_linkers)
     logger.configure_repo_logger(network_configuration.logfile_path())
@@ -337,7 +489,18 @@ def analyze(
 
     start = time.time()
 
-    analyzer = Analyzer(cfg=network_configuration)
+    analyzer = Analyzer(
+        cfg=network_configuration,
+        checkout=not no_checkout,
+        workers=workers,
+        since=since,
+        until=until,
+        max_commits=max_commits,
+        first_parent=first_parent,
+        resume=resume,
+        checkpoint_interval=checkpoint_interval,
+        output_format=output_format,
+    )
 
     analyzer.analyze_commit_history()
 
@@ -348,12 +511,175 @@ def analyze(
     )
 
 
+@main.command()
+@click.argument("path")
+@add_profile_option
+def route(path: str):
+    """Show which plugin is responsible for a file."""
+    abs_file_path = os.path.abspath(path)
+    router = PluginManager.get_router(PluginManager.get_plugins())
+    claims = router.explain(abs_file_path)
+
+    if not claims:
+        print(f"{path}: no responsible plugin")
+        sys.exit(1)
+
+    plugin, rule = claims[0]
+    print(f"{path}: {plugin.concept_name} ({type(plugin).__name__}, {rule})")
+    for plugin, rule in claims[1:]:
+        print(
+            f"  shadowed: {plugin.concept_name} "
+            f"({type(plugin).__name__}, {rule})"
+        )
+
+
+@main.command()
+@click.option(
+    "--output-format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Print the changes as text or as JSON.",
+)
+@click.argument("rev_a")
+@click.argument("rev_b")
+@add_project_root_argument
+@add_profile_option
+def diff(output_format: str, rev_a: str, rev_b: str, project_root: str):
+    """Show configuration changes between two revisions."""
+    cfg = NetworkConfiguration(
+        project_root_abs=os.path.abspath(project_root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    repo = Git(project_root=cfg.project_root_abs)
+
+    try:
+        commit_a = repo.get_commit_hash(rev_a)
+        commit_b = repo.get_commit_hash(rev_b)
+    except ValueError as error:
+        logging.error(error)
+        sys.exit(1)
+
+    # networks are created from the object database, the working tree is
+    # left untouched
+    blob_reader = BlobReader(repo, cfg.blob_dir_path())
+    try:
+        network_a = Network.init_network(cfg, blob_reader, commit_a)
+        network_b = Network.init_network(cfg, blob_reader, commit_b)
+    finally:
+        blob_reader.close()
+
+    delta = NetworkDiff.diff(network_a, network_b)
+
+    if output_format == "json":
+        print(json.dumps(delta.to_dict(), indent=2))
+    elif not delta.is_empty():
+        print(delta)
+
+
+@main.command()
+@click.option("-a", "--artifact", help="Only show changes of an artifact.")
+@click.option(
+    "-n",
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Only show this number of the latest changes.",
+)
+@click.argument("option")
+@add_project_root_argument
+@add_profile_option
+def history(
+    artifact: Optional[str],
+    limit: Optional[int],
+    option: str,
+    project_root: str,
+):
+    """
+    Show when an option changed according to the last analysis.
+
+    OPTION is an option path as shown by `diff`, nested keys are joined
+    with `::`, e.g. `spring::datasource::url`.  Dots may be used instead,
+    e.g. `spring.datasource.url`, and `*` matches any characters.
+    """
+    cfg = NetworkConfiguration(
+        project_root_abs=os.path.abspath(project_root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    store = DeltaStore(cfg.delta_store_path())
+    if not store.exists():
+        logging.error(
+            'No analysis for project "%s". Please call "analyze" first.',
+            project_root,
+        )
+        sys.exit(1)
+
+    for record in store.query(option=option, artifact=artifact, limit=limit):
+        committed_at = datetime.fromtimestamp(record.committed_at)
+        print(
+            f"{record.commit_hash[:10]} {committed_at:%Y-%m-%d %H:%M} "
+            f"{record}"
+        )
+
+
+@main.group()
+def cache():
+    """Inspect the caches of parsed files and constraint violations."""
+
+
+def _get_cache_configuration(project_root: str) -> NetworkConfiguration:
+    return NetworkConfiguration(
+        project_root_abs=os.path.abspath(project_root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+
+
+def _get_parse_cache(project_root: str) -> ParseCache:
+    network_configuration = _get_cache_configuration(project_root)
+    return ParseCache(
+        cache_dir=network_configuration.cache_dir_path(),
+        max_size=network_configuration.parse_cache_size,
+    )
+
+
+@cache.command("stats")
+@add_project_root_argument
+@add_profile_option
+def cache_stats(project_root: str):
+    """Show statistics of the parse cache."""
+    stats = _get_parse_cache(project_root).stats()
+
+    print(f"Entries: {stats['entries']}")
+    print(f"Size: {stats['size']} bytes")
+    print(f"Size limit: {stats['max_size']} bytes")
+
+
+@cache.command("clear")
+@add_project_root_argument
+@add_profile_option
+def cache_clear(project_root: str):
+    """Remove all entries from the parse cache and the constraint cache."""
+    _get_parse_cache(project_root).clear()
+    network_configuration = _get_cache_configuration(project_root)
+    ConstraintCache(network_configuration.constraint_cache_path()).clear()
+
+    logging.info(
+        "Cleared parse cache and constraint cache of %s.",
+        os.path.basename(project_root),
+    )
+
+
 @main.command()
 @click.option("-o", "--output", required=True)  # TODO type
 @click.option("-f", "--format", "export_format", required=True)  # TODO type
 @click.option("-u", "--include-unlinked", is_flag=True)  # TODO type
 @click.option("-v", "--visualize-dot", is_flag=True)  # TODO type
 @add_project_root_argument
+@add_profile_option
 def export(
     output: str,
     export_format: str,
@@ -367,7 +693,7 @@ def export(
     LauncherConfiguration.export_include_unlinked = include_unlinked
     LauncherConfiguration.export_visualize_dot = visualize_dot
 
-    network = Network.load_network(project_root)
+    network = Network.load_network(project_root, parts=["links"])
     logger.configure_repo_logger(network.cfg.logfile_path())
 
     if LauncherConfiguration.export_visualize_dot:
@@ -393,10 +719,13 @@ def export(
 @click.option("-f", "--config-files", multiple=True)
 @click.option("-o", "--output", required=True)
 @add_project_root_argument
+@add_jobs_option
+@add_profile_option
 def extract(
     project_root: str,
     config_files: List,
     output: str,
+    jobs: int,
 ):
     """Extract key-value pairs."""
     project_name = os.path.basename(project_root)
@@ -408,6 +737,7 @@ def extract(
         enable_static_blacklist=False,
         enable_internal_links=False,
         enable_all_conflicts=False,
+        jobs=jobs,
     )
 
     start = time.time()
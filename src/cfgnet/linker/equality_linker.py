@@ -12,39 +12,61 @@
 #
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
-from typing import List
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
+from cfgnet.config_types.config_types import ConfigType
 from cfgnet.network.nodes import ValueNode
 from cfgnet.linker.linker import Linker
 from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
 
+# value nodes of the same name and config type, partitioned by artifact
+Partitions = Dict[str, List[ValueNode]]
+
 
 class EqualityLinker(Linker):
-    """Equality-based Linker."""
+    """
+    Equality-based Linker.
+
+    Links are established between value nodes with equal names and config
+    types.  Candidates are looked up in a hash index keyed by value name and
+    config type, so that linking takes linear time in the number of value
+    nodes plus the number of created links.
+    """
 
     name: str = "equality"
 
-    def create_links(self) -> None:
-        self.target_nodes = self._find_target_nodes()
+    def __init__(self):
+        super().__init__()
+        self.index: Dict[Tuple[str, ConfigType], Partitions] = {}
 
-        for node in self.target_nodes:
+    def create_links(self, nodes: Optional[List[ValueNode]] = None) -> None:
+        self.target_nodes = self._find_target_nodes()
+        self.index = self._create_index(self.target_nodes)
+
+        source_nodes = self.target_nodes
+        if nodes is not None:
+            # links are only possible between nodes of equal name, so it is
+            # sufficient to revisit nodes sharing a name with the given nodes
+            names = {node.name for node in nodes}
+            source_nodes = [
+                node for node in self.target_nodes if node.name in names
+            ]
+
+        for node in source_nodes:
             if not node.name:
-                return
+                continue
 
             # discard words from static blacklist
             if self.network:
                 if self.network.cfg.enable_static_blacklist:
                     if node.name in self.static_blacklist.values:
-                        return
-
-            # find all matches with the given linker criterion
-            matches = self._find_matches(node)
+                        continue
 
-            # add link for all matches
-            for match in matches:
-                # check config types before creating a link
-                if self._check_config_types(node, match):
-                    self._add_link(node, match)
+            # find all matches with the given linker criterion, the index
+            # only yields matches that have the same config type
+            for match in self._find_matches(node):
+                self._add_link(node, match)
 
     def _find_target_nodes(self):
         return [
@@ -53,41 +75,45 @@ class EqualityLinker(Linker):
             if not ConfigTypeInferer.is_boolean(node.name)
         ]
 
+    @staticmethod
+    def _create_index(
+        nodes: List[ValueNode],
+    ) -> Dict[Tuple[str, ConfigType], Partitions]:
+        """
+        Group value nodes by name and config type and then by artifact.
+
+        :param nodes: value nodes to be indexed
+        :return: Dict mapping name and config type to artifact partitions
+        """
+        index: Dict[Tuple[str, ConfigType], Partitions] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for node in nodes:
+            index[(node.name, node.config_type)][
+                EqualityLinker._get_artifact_name(node)
+            ].append(node)
+
+        return index
+
     def _find_matches(self, node: ValueNode) -> List[ValueNode]:
-        target_nodes = self._filter_target_nodes(node)
+        partitions = self.index.get((node.name, node.config_type), {})
+        artifact_name = EqualityLinker._get_artifact_name(node)
 
         return [
             value_node
-            for value_node in target_nodes
-            if value_node.name == node.name and node is not value_node
+            for partition_name, partition in partitions.items()
+            if self._is_linkable(artifact_name, partition_name)
+            for value_node in partition
+            if node is not value_node
         ]
 
-    def _filter_target_nodes(self, node) -> List[ValueNode]:
-        """Filter target nodes to avoid links within the same file."""
+    def _is_linkable(self, artifact_name: str, partition_name: str) -> bool:
+        """Filter target partitions to avoid links within the same file."""
         if self.enable_internal_links:
-            return self.target_nodes
-
-        artifact_name = node.id.split("::::")[1]
-
-        return list(
-            filter(
-                lambda x: artifact_name not in x.id.split("::::")[1],
-                self.target_nodes,
-            )
-        )
-
-    def _check_config_types(
-        self, node_a: ValueNode, node_b: ValueNode
-    ) -> bool:
-        """
-        Check config types of given nodes before creating a link.
-
-        :param node_a: First node to be linked to the second
-        :param node_b: Second node to be linked to the first
-        :return: True if both nodes have the same config type or if at least
-         one node has no config type specified, else False
-        """
-        if node_a.config_type == node_b.config_type:
             return True
 
-        return False
+        return artifact_name not in partition_name
+
+    @staticmethod
+    def _get_artifact_name(node: ValueNode) -> str:
+        return node.id.split("::::")[1]
@@ -13,10 +13,11 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Iterable, TYPE_CHECKING
+from typing import List, Iterable, Optional, TYPE_CHECKING
 
 from cfgnet.linker.linker import Linker
 from cfgnet.linker.equality_linker import EqualityLinker
+from cfgnet.network.nodes import ValueNode
 
 if TYPE_CHECKING:
     from cfgnet.network.network import Network
@@ -29,16 +30,19 @@ class LinkerManager:
     enabled_linkers: List[Linker] = []
 
     @staticmethod
-    def apply_linkers(network: "Network") -> None:
+    def apply_linkers(
+        network: "Network", nodes: Optional[List[ValueNode]] = None
+    ) -> None:
         """
         Apply all existing linker to create links in the configuration network.
 
-        :param: Configuration network
+        :param network: Configuration network
+        :param nodes: Only create links of these nodes, by default all nodes
         """
         for linker in LinkerManager.all_linkers:
             linker.network = network
             linker.enable_internal_links = network.cfg.enable_internal_links
-            linker.create_links()
+            linker.create_links(nodes)
 
     @staticmethod
     def get_linker_names() -> List[str]:
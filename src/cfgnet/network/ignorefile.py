@@ -14,10 +14,92 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import platform
-import pathlib
 import logging
 import os
-from typing import Iterable, Set
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set
+
+
+class IgnoreRule:
+    """Single pattern of an ignorefile translated to a regular expression."""
+
+    def __init__(self, pattern: str) -> None:
+        """
+        Parse a pattern following the semantics of `.gitignore`.
+
+        :param pattern: line of the ignorefile without comments
+        """
+        self.negated: bool = False
+        if pattern.startswith("!"):
+            self.negated = True
+            pattern = pattern[1:]
+
+        self.directory_only: bool = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # patterns containing a slash are relative to the project root,
+        # all other patterns match a name at any level
+        self.anchored: bool = "/" in pattern
+        pattern = pattern.lstrip("/")
+
+        regex = IgnoreRule.translate(pattern)
+        if not self.anchored:
+            regex = "(?:.*/)?" + regex
+        self.regex: str = regex
+
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """
+        Translate a glob pattern into a regular expression.
+
+        `*` and `?` do not match `/`, while `**` matches across directories
+        if it forms a complete path component.
+
+        :param pattern: glob pattern relative to the project root
+        :return: regular expression matching the complete path
+        """
+        regex = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if pattern.startswith("**", i):
+                at_start = i == 0 or pattern[i - 1] == "/"
+                at_end = i + 2 == len(pattern)
+                if at_start and pattern.startswith("**/", i):
+                    regex.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if at_start and at_end:
+                    regex.append(".*")
+                    i += 2
+                    continue
+                regex.append("[^/]*")
+                i += 2
+            elif char == "*":
+                regex.append("[^/]*")
+                i += 1
+            elif char == "?":
+                regex.append("[^/]")
+                i += 1
+            elif char == "[":
+                end = pattern.find("]", i + 2)
+                if end == -1:
+                    regex.append(re.escape(char))
+                    i += 1
+                    continue
+                chars = pattern[i + 1 : end].replace("\\", "\\\\")
+                if chars.startswith("!"):
+                    chars = "^" + chars[1:]
+                regex.append(f"(?!/)[{chars}]")
+                i = end + 1
+            elif char == "\\" and i + 1 < len(pattern):
+                regex.append(re.escape(pattern[i + 1]))
+                i += 2
+            else:
+                regex.append(re.escape(char))
+                i += 1
+
+        return "".join(regex)
 
 
 class IgnoreFile:
@@ -27,43 +109,163 @@ class IgnoreFile:
     To ignore certain (types of) files or directories for network creation, a
     `.gitignore`-like *ignorefile* can be created at `.cfgnet/ignore`.
 
-    Each line of this *ignorefile* contains a glob-style pattern.  Any files
-    that match one or more of these patterns will be ignored by the tool.
+    Each line of this *ignorefile* contains a pattern with the semantics of
+    `.gitignore`: patterns containing a slash are anchored at the project
+    root, `**` matches any number of directories, a trailing slash only
+    matches directories and a leading `!` re-includes previously ignored
+    files.  Files within an ignored directory cannot be re-included.
+
+    All patterns are compiled into one regular expression for directories
+    and one for files.  The alternatives are ordered from the last to the
+    first pattern, so the first matching alternative is the pattern that
+    decides about a path.
     """
 
     ignored_globs: Set[str] = set()
+    rules: List[IgnoreRule] = []
+    directory_matcher: Optional[Pattern] = None
+    file_matcher: Optional[Pattern] = None
     system = platform.system()
 
     @staticmethod
     def configure(ignorefile_path: str):
         IgnoreFile.ignored_globs = set()
+        patterns: List[str] = []
         if os.path.exists(ignorefile_path):
             logging.debug("Ignorefile found at %s", ignorefile_path)
             try:
                 with open(
                     ignorefile_path, "r", encoding="utf-8"
                 ) as ignorefile:
-                    IgnoreFile.ignored_globs.update(
-                        ignorefile.read().splitlines()
-                    )
+                    patterns = ignorefile.read().splitlines()
             except OSError as error:
                 logging.error(
                     "Couldn't read ignorefile '%s': %s", ignorefile_path, error
                 )
 
+        IgnoreFile.compile(patterns)
+
+    @staticmethod
+    def compile(patterns: Iterable[str]) -> None:
+        """
+        Compile ignorefile patterns into the matchers.
+
+        :param patterns: lines of the ignorefile
+        """
+        IgnoreFile.rules = []
+        for pattern in patterns:
+            pattern = IgnoreFile._strip_trailing_spaces(pattern)
+            if not pattern or pattern.startswith("#"):
+                continue
+            IgnoreFile.ignored_globs.add(pattern)
+            IgnoreFile.rules.append(IgnoreRule(pattern))
+
+        IgnoreFile.directory_matcher = IgnoreFile._compile_rules(
+            IgnoreFile.rules
+        )
+        IgnoreFile.file_matcher = IgnoreFile._compile_rules(
+            [rule for rule in IgnoreFile.rules if not rule.directory_only]
+        )
+
     @staticmethod
     def ignored(file: str) -> bool:
         """Return true iff the file is to be ignored."""
-        for glob in IgnoreFile.ignored_globs:
-            path = pathlib.PurePath(file)
-            # iterate through parents to also match directories
-            while str(path) != ".":
-                if path.match(glob):
-                    return True
-                path = path.parent
+        if not IgnoreFile.rules:
+            return False
 
-        return False
+        path = IgnoreFile._normalize(file)
+        directories = path.split("/")[:-1]
+        for i in range(1, len(directories) + 1):
+            if IgnoreFile._matches(
+                IgnoreFile.directory_matcher, "/".join(directories[:i])
+            ):
+                return True
+
+        return IgnoreFile._matches(IgnoreFile.file_matcher, path)
 
     @staticmethod
     def filter(files: Iterable[str]) -> Set[str]:
-        return set(file for file in files if not IgnoreFile.ignored(file))
+        return set(IgnoreFile.prune(files))
+
+    @staticmethod
+    def prune(files: Iterable[str]) -> Iterator[str]:
+        """
+        Stream files that are not ignored.
+
+        Each directory is matched only once.  Once a directory is ignored,
+        all files below it are skipped by a prefix comparison.
+
+        :param files: relative paths of files
+        :return: relative paths of files that are not ignored
+        """
+        if not IgnoreFile.rules:
+            yield from files
+            return
+
+        directories: Dict[str, bool] = {}
+        ignored_prefix: Optional[str] = None
+
+        for file in files:
+            path = IgnoreFile._normalize(file)
+            if ignored_prefix and path.startswith(ignored_prefix):
+                continue
+
+            ignored_directory = None
+            directory = ""
+            for name in path.split("/")[:-1]:
+                directory = f"{directory}/{name}" if directory else name
+                ignored = directories.get(directory)
+                if ignored is None:
+                    ignored = IgnoreFile._matches(
+                        IgnoreFile.directory_matcher, directory
+                    )
+                    directories[directory] = ignored
+                if ignored:
+                    ignored_directory = directory
+                    break
+
+            if ignored_directory is not None:
+                ignored_prefix = ignored_directory + "/"
+                continue
+
+            if not IgnoreFile._matches(IgnoreFile.file_matcher, path):
+                yield file
+
+    @staticmethod
+    def _compile_rules(rules: List[IgnoreRule]) -> Optional[Pattern]:
+        if not rules:
+            return None
+
+        return re.compile(
+            "|".join(
+                f"(?P<r{index}_{int(rule.negated)}>{rule.regex})"
+                for index, rule in reversed(list(enumerate(rules)))
+            ),
+            re.DOTALL,
+        )
+
+    @staticmethod
+    def _matches(matcher: Optional[Pattern], path: str) -> bool:
+        """Return true if the deciding pattern ignores the path."""
+        if matcher is None:
+            return False
+
+        match = matcher.fullmatch(path)
+        if match is None:
+            return False
+
+        return not match.lastgroup.endswith("_1")
+
+    @staticmethod
+    def _normalize(file: str) -> str:
+        if IgnoreFile.system == "Windows":
+            file = file.replace("\\", "/")
+        return file
+
+    @staticmethod
+    def _strip_trailing_spaces(pattern: str) -> str:
+        """Remove trailing spaces unless they are escaped."""
+        stripped = pattern.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(pattern):
+            stripped += " "
+        return stripped
@@ -19,15 +19,31 @@ import os
 import sys
 import logging
 import hashlib
+import itertools
 import pickle
 
-from typing import List, Set, Any, Optional, Callable, Tuple, Dict
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from cfgnet.vcs.git import Git
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.plugins.plugin import Plugin
 from cfgnet.plugins.plugin_manager import PluginManager
 from cfgnet.linker.linker_manager import LinkerManager
 from cfgnet.conflicts.conflict_detector import ConflictDetector
 from cfgnet.network.ignorefile import IgnoreFile
+from cfgnet.network.parse_cache import ParseCache
 from cfgnet.network.nodes import (
     Node,
     ProjectNode,
@@ -36,10 +52,17 @@ from cfgnet.network.nodes import (
     ValueNode,
 )
 from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.network_store import NetworkStore
+from cfgnet.config_types.config_types import ConfigType
 from cfgnet.exporter.exporter import DotExporter, JSONExporter
 from cfgnet.errors.error import Error
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
 from cfgnet.conflicts.conflict import Conflict, ModifiedOptionConflict
 from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.utility.profiler import Profiler
+
+# responsible plugin, absolute and relative file path of an artifact
+ParseJob = Tuple[Plugin, str, str]
 
 
 class Network:
@@ -59,15 +82,114 @@ class Network:
         self.constraint_violations: List = list()
 
         self.links: Set = set()
+        # commit the network has been created from
+        self.commit_hash: Optional[str] = None
+        # git blob hashes of the parsed files by relative paths
+        self.artifact_hashes: Dict[str, str] = {}
+        # parts of the network that have not been loaded from its store
+        self.unloaded_parts: Set[str] = set()
 
-        self.nodes = defaultdict(list)
-        self.nodes[self.root.id].append(self.root)
+        self._init_registries()
+        self.register_node(self.root)
 
         if not os.path.isdir(self.cfg.data_dir_path()):
             os.makedirs(self.cfg.data_dir_path())
 
         IgnoreFile.configure(cfg.ignorefile_path())
 
+    def __getstate__(self) -> Dict:
+        # node registries are rebuilt from the tree when loading
+        state = self.__dict__.copy()
+        for registry in Network.registries:
+            state.pop(registry, None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        for registry in Network.registries:
+            state.pop(registry, None)
+        self.__dict__.update(state)
+
+    def __getattr__(self, name: str) -> Any:
+        # node registries of an unpickled network are rebuilt on first use,
+        # when the state of all its nodes has been restored
+        if name not in Network.registries or "root" not in self.__dict__:
+            raise AttributeError(name)
+
+        self._init_registries()
+        self.traverse(self.root, self.register_node)
+        return self.__dict__[name]
+
+    # attributes holding node registries, which are not pickled
+    registries = (
+        "nodes",
+        "typed_nodes",
+        "values_by_config_type",
+        "values_by_concept",
+    )
+
+    def _init_registries(self) -> None:
+        # nodes by ID, several nodes can share an ID
+        self.nodes: DefaultDict[str, List[Node]] = defaultdict(list)
+        # nodes by their exact type and value nodes by config type and by
+        # concept, each mapping the object identity to the node
+        self.typed_nodes: Dict[type, Dict[int, Node]] = {
+            node_type: {}
+            for node_type in (ProjectNode, ArtifactNode, OptionNode, ValueNode)
+        }
+        self.values_by_config_type: DefaultDict[
+            ConfigType, Dict[int, ValueNode]
+        ] = defaultdict(dict)
+        self.values_by_concept: DefaultDict[
+            str, Dict[int, ValueNode]
+        ] = defaultdict(dict)
+
+    def register_node(self, node: Node) -> None:
+        """
+        Add a node to the registries of the network.
+
+        Called by `Node.add_child` for nodes attached to the network.
+
+        :param node: node to be registered
+        """
+        self.nodes[node.id].append(node)
+        self.typed_nodes.setdefault(type(node), {})[id(node)] = node
+
+        if isinstance(node, ValueNode):
+            self.values_by_config_type[node.config_type][id(node)] = node
+            concept = Network._get_concept_name(node)
+            if concept is not None:
+                self.values_by_concept[concept][id(node)] = node
+
+    def unregister_node(self, node: Node) -> None:
+        """
+        Remove a node from the registries of the network.
+
+        Called by `Node.remove_child` for nodes removed from the network.
+
+        :param node: node to be removed
+        """
+        nodes = [x for x in self.nodes.get(node.id, []) if x is not node]
+        if nodes:
+            self.nodes[node.id] = nodes
+        else:
+            self.nodes.pop(node.id, None)
+
+        self.typed_nodes.get(type(node), {}).pop(id(node), None)
+
+        if isinstance(node, ValueNode):
+            for values in self.values_by_config_type.values():
+                values.pop(id(node), None)
+            concept = Network._get_concept_name(node)
+            if concept is not None:
+                self.values_by_concept[concept].pop(id(node), None)
+
+    @staticmethod
+    def _get_concept_name(node: Node) -> Optional[str]:
+        current: Optional[Node] = node
+        while current is not None and not isinstance(current, ArtifactNode):
+            current = current.parent
+        return current.concept_name if current is not None else None
+
     def find_artifact_node(self, node: Node) -> Optional[ArtifactNode]:
         """
         Find instance of the given node with the same ID.
@@ -142,27 +264,72 @@ class Network:
 
         return None
 
-    def get_nodes(self, node_type: Any) -> List[Any]:
+    def get_nodes(self, node_type: Any) -> Collection[Any]:
         """
         Return nodes from the network according to the entered node type.
 
+        For the node types of the network, a view of the registry is
+        returned, which must not be iterated while nodes are added or
+        removed.
+
         :param node_type: Type of node that should be returned
-        :return: List of nodes
+        :return: Collection of nodes
         """
+        if node_type in self.typed_nodes:
+            return self.typed_nodes[node_type].values()
+
         return [
             node
-            for nodes in self.nodes.values()
-            for node in nodes
+            for nodes in self.typed_nodes.values()
+            for node in nodes.values()
             if isinstance(node, node_type)
         ]
 
-    def validate(self, commit_hash=None) -> Tuple[Set, Network]:
+    def get_values_by_config_type(
+        self, config_type: ConfigType
+    ) -> Collection[ValueNode]:
+        """
+        Return value nodes of a config type.
+
+        :param config_type: config type of the value nodes
+        :return: View of the value nodes
+        """
+        return self.values_by_config_type.get(config_type, {}).values()
+
+    def get_values_by_concept(self, concept_name: str) -> Collection[ValueNode]:
+        """
+        Return value nodes of artifacts of a concept.
+
+        :param concept_name: name of the concept, e.g. `docker`
+        :return: View of the value nodes
+        """
+        return self.values_by_concept.get(concept_name, {}).values()
+
+    def validate(
+        self,
+        commit_hash=None,
+        incremental: bool = False,
+        blob_reader: Optional[BlobReader] = None,
+    ) -> Tuple[Set, Network]:
         """
         Detect conflicts with respect to the reference network.
 
+        :param commit_hash: Commit in which the conflicts were detected
+        :param incremental: Only parse files whose content changed since the
+            reference network was created instead of all files
+        :param blob_reader: Create the new network from the files of
+            `commit_hash` read by this reader instead of the working tree
         :return: Set of detected dependency conflicts and the newly created network
         """
-        new_network = Network.init_network(cfg=self.cfg)
+        new_network = None
+        if blob_reader is not None:
+            new_network = Network.init_network(
+                cfg=self.cfg, blob_reader=blob_reader, commit=commit_hash
+            )
+        elif incremental:
+            new_network = self.update_network()
+        if new_network is None:
+            new_network = Network.init_network(cfg=self.cfg)
 
         conflicts = ConflictDetector.detect(
             ref_network=self,
@@ -175,17 +342,14 @@ class Network:
     
 
     def save(self) -> None:
-        """Save configuration network of a project into a pickle file."""
+        """Save configuration network of a project into its store."""
         if not os.path.isdir(self.cfg.network_dir_path()):
             os.mkdir(self.cfg.network_dir_path())
 
-        file_name = hashlib.md5(self.project_root.encode()).hexdigest()
-        network_file = os.path.join(
-            self.cfg.network_dir_path(), file_name + ".pickle"
-        )
-
-        with open(network_file, "wb") as pickle_file:
-            pickle.dump(self, pickle_file)
+        with Profiler.phase("save"):
+            NetworkStore(Network._get_network_file(self.project_root)).save(
+                self
+            )
 
     def traverse(self, current: Node, callback: Callable) -> None:
         """
@@ -261,75 +425,428 @@ class Network:
         return artifact_options
 
     @staticmethod
-    def load_network(project_root: str) -> Network:
+    def load_network(
+        project_root: str, parts: Optional[Iterable[str]] = None
+    ) -> Network:
         """
-        Load configuration network of a project from a pickle file.
+        Load configuration network of a project from its store.
+
+        Networks saved as pickle file by former versions are migrated.
 
         :param project_root: Project root of the software repository
+        :param parts: Parts of the network to be loaded in addition to its
+            nodes, by default all parts (see `NetworkStore.parts`)
         :return: Configuration network
         """
-        file_name = hashlib.md5(project_root.encode()).hexdigest()
-        network_dir = os.path.join(project_root, ".cfgnet", "network")
+        network_file = Network._get_network_file(project_root)
+        pickle_file = os.path.splitext(network_file)[0] + ".pickle"
 
-        network_file = os.path.join(network_dir, file_name + ".pickle")
+        store = NetworkStore(network_file)
+        if not store.exists() and os.path.exists(pickle_file):
+            logging.info(
+                "Migrate network %s to %s.", pickle_file, network_file
+            )
+            NetworkStore.migrate(pickle_file, network_file)
 
-        if not os.path.exists(network_file):
+        if not store.exists():
             logging.error(
                 'No existing reference network for project "%s". Please call "init" first.',
                 project_root,
             )
             sys.exit(1)
 
-        with open(network_file, "rb") as pickle_file:
-            return pickle.load(pickle_file)
+        try:
+            return store.load(parts)
+        except InvalidNetworkStateException as error:
+            logging.error('%s. Please call "init" again.', error)
+            sys.exit(1)
+
+    @staticmethod
+    def _get_network_file(project_root: str) -> str:
+        file_name = hashlib.md5(project_root.encode()).hexdigest()
+        network_dir = os.path.join(project_root, ".cfgnet", "network")
+
+        return os.path.join(network_dir, file_name + ".sqlite")
 
     @staticmethod
-    def init_network(cfg: NetworkConfiguration) -> Network:
+    def init_network(
+        cfg: NetworkConfiguration,
+        blob_reader: Optional[BlobReader] = None,
+        commit: Optional[str] = None,
+    ) -> Network:
         """
         Initialize a configuration network.
 
         :param cfg: network configuration
+        :param blob_reader: Read the files of `commit` with this reader
+            instead of parsing the working tree
+        :param commit: Commit to create the network from, requires a reader
         :return: configuration network
         """
         repo = Git(project_root=cfg.project_root_abs)
-        tracked_files: Set[str] = set(repo.get_tracked_files())
-
-        if cfg.config_files:
-            tracked_files.update(cfg.config_files)
 
         project_name = cfg.project_name()
         root = ProjectNode(name=project_name, root_dir=cfg.project_root_abs)
         network = Network(project_name=project_name, root=root, cfg=cfg)
 
-        tracked_files = IgnoreFile.filter(tracked_files)
+        if blob_reader is None or commit is None:
+            network.commit_hash = Network._get_commit_hash(repo)
+            config_files = Network._get_config_files(repo, cfg)
+            network._add_artifacts(config_files)
+        else:
+            network.commit_hash = commit
+            blobs = blob_reader.get_files(commit)
+            config_files = Network._get_config_files(repo, cfg, blobs)
+            paths = blob_reader.materialize(
+                {file: blobs[file] for file in config_files if file in blobs}
+            )
+            network._add_artifacts(config_files, paths)
+
+        with Profiler.phase("linking"):
+            LinkerManager.apply_linkers(network)
+        # TODO fill option_constaints
+        cm = ConstraintManager()
+        with Profiler.phase("constraint_types"):
+            constraint_types = cm.get_option_constraint_type(network)
+        if constraint_types:
+            network.option_constraints = constraint_types
+        return network
+
+    def update_network(self) -> Optional[Network]:
+        """
+        Create an updated copy of the network for the current working tree.
+
+        Files whose content differs from the content they were parsed
+        from are parsed again, all other artifacts are copied.  The blob
+        hash of each file is compared rather than a diff against the commit
+        of the network, because artifacts may have been parsed from files
+        with uncommitted changes.  Links are only created for the value
+        nodes of re-parsed artifacts, while links of unchanged artifacts
+        are kept.
+
+        :return: updated network or None if the changes cannot be determined
+        """
+        artifact_hashes = getattr(self, "artifact_hashes", None)
+        if artifact_hashes is None:
+            return None
+
+        repo = Git(project_root=self.cfg.project_root_abs)
+
+        network = self.copy()
+        network.commit_hash = Network._get_commit_hash(repo)
+
+        IgnoreFile.configure(self.cfg.ignorefile_path())
+        config_files = Network._get_config_files(repo, self.cfg)
+
+        root_dir = self.cfg.project_root_abs
+        changed_files = {
+            file
+            for file in config_files
+            if artifact_hashes.get(file)
+            != Git.get_blob_hash(os.path.join(root_dir, file))
+        }
+
+        artifacts = {
+            artifact.rel_file_path: artifact
+            for artifact in network.get_nodes(ArtifactNode)
+        }
+        network._remove_artifacts(
+            artifact
+            for file, artifact in artifacts.items()
+            if file in changed_files or file not in config_files
+        )
+
+        new_artifacts = network._add_artifacts(
+            file
+            for file in config_files
+            if file in changed_files or file not in artifacts
+        )
+        network.root.children.sort(key=lambda artifact: artifact.name)
+
+        value_nodes = [
+            node
+            for artifact in new_artifacts
+            for node in artifact.get_nodes(node_type=ValueNode)
+        ]
+        with Profiler.phase("linking"):
+            LinkerManager.apply_linkers(network, value_nodes)
+
+        cm = ConstraintManager()
+        with Profiler.phase("constraint_types"):
+            for artifact in new_artifacts:
+                network.option_constraints.update(
+                    cm.get_artifact_constraint_types(artifact)
+                )
+
+        return network
+
+    def copy(self) -> Network:
+        """
+        Create a deep copy of the network without its detected conflicts.
+
+        :return: copy of the network
+        """
+        conflict_state = (
+            self.conflicts,
+            self.constraint_conflicts,
+            self.constraint_violations,
+        )
+        self.conflicts = set()
+        self.constraint_conflicts = set()
+        self.constraint_violations = []
+        try:
+            network = pickle.loads(
+                pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            network.unloaded_parts = set()
+            return network
+        finally:
+            (
+                self.conflicts,
+                self.constraint_conflicts,
+                self.constraint_violations,
+            ) = conflict_state
+
+    def _add_artifacts(
+        self, files: Iterable[str], paths: Optional[Dict[str, str]] = None
+    ) -> List[ArtifactNode]:
+        """
+        Parse files and attach their artifacts to the project node.
+
+        :param files: relative paths of files to be parsed
+        :param paths: paths to read files from instead of the project root,
+            e.g. files of a commit written by a `BlobReader`
+        :return: added artifact nodes
+        """
         plugins = PluginManager.get_plugins()
+        paths = paths or {}
 
-        for file in sorted(tracked_files):
-            abs_file_path = os.path.join(cfg.project_root_abs, file)
+        parse_jobs: List[ParseJob] = []
+        blob_hashes: List[Optional[str]] = []
+        for file in sorted(files):
+            abs_file_path = os.path.join(self.cfg.project_root_abs, file)
 
             plugin = PluginManager.get_responsible_plugin(
                 plugins, abs_file_path
             )
             if plugin:
-                try:
-                    plugin.parse_file(
-                        abs_file_path=abs_file_path,
-                        rel_file_path=file,
-                        root=root,
-                    )
-                except UnicodeDecodeError as error:
-                    logging.warning(
-                        "%s: %s (%s)",
-                        plugin.__class__.__name__,
-                        error.reason,
-                        file,
-                    )
-
-        LinkerManager.apply_linkers(network)
-        # TODO fill option_constaints
-        cm = ConstraintManager()
-        constraint_types = cm.get_option_constraint_type(network)
-        if constraint_types:
-            network.option_constraints = constraint_types
-        return network
-    
\ No newline at end of file
+                file_path = paths.get(file, abs_file_path)
+                parse_jobs.append((plugin, file_path, file))
+                blob_hashes.append(Git.get_blob_hash(file_path))
+
+        # artifacts are attached in sorted order, regardless of the number
+        # of jobs, so that node IDs and links do not depend on scheduling
+        with Profiler.phase("plugin_parsing"):
+            loaded = Network._load_artifacts(
+                parse_jobs, blob_hashes, self.cfg
+            )
+
+        artifacts = []
+        for job, blob_hash, artifact in zip(parse_jobs, blob_hashes, loaded):
+            if Profiler.enabled:
+                Network._record_artifact(job, artifact)
+            if artifact is not None:
+                # files read from other paths and cached artifacts refer to
+                # the file in the project
+                artifact.file_path = os.path.join(
+                    self.cfg.project_root_abs, artifact.rel_file_path
+                )
+                self.root.add_child(artifact)
+                artifacts.append(artifact)
+                if blob_hash:
+                    self.artifact_hashes[artifact.rel_file_path] = blob_hash
+
+        return artifacts
+
+    @staticmethod
+    def _record_artifact(
+        job: ParseJob, artifact: Optional[ArtifactNode]
+    ) -> None:
+        """Record the size and nodes of a parsed file for the profiler."""
+        plugin, file_path, _ = job
+        try:
+            bytes_read = os.path.getsize(file_path)
+        except OSError:
+            bytes_read = 0
+        nodes = len(artifact.get_nodes(node_type=Node)) if artifact else 0
+        Profiler.record_artifact(plugin.concept_name, bytes_read, nodes)
+
+    def _remove_artifacts(self, artifacts: Iterable[ArtifactNode]) -> None:
+        """
+        Remove artifacts together with their nodes, links and constraints.
+
+        :param artifacts: artifact nodes to be removed
+        """
+        removed_nodes: Set[int] = set()
+        removed_artifacts: Set[int] = set()
+
+        for artifact in list(artifacts):
+            self.artifact_hashes.pop(artifact.rel_file_path, None)
+            removed_artifacts.add(id(artifact))
+            removed_nodes.update(
+                id(node) for node in artifact.get_nodes(node_type=Node)
+            )
+            self.root.remove_child(artifact)
+
+        self.links = {
+            link
+            for link in self.links
+            if id(link.node_a) not in removed_nodes
+            and id(link.node_b) not in removed_nodes
+        }
+        self.option_constraints = {
+            template
+            for template in self.option_constraints
+            if id(template.artifact) not in removed_artifacts
+        }
+
+    @staticmethod
+    def _get_config_files(
+        repo: Git,
+        cfg: NetworkConfiguration,
+        blobs: Optional[Dict[str, str]] = None,
+    ) -> Set[str]:
+        """
+        Return tracked and additional files that a plugin can parse.
+
+        Tracked files are streamed from git.  Ignored directories are
+        pruned while streaming, remaining files are discarded right away if
+        no plugin is responsible for them.
+
+        :param repo: git repository of the project
+        :param cfg: network configuration
+        :param blobs: files of a commit to be used instead of tracked files
+        :return: relative paths of the files
+        """
+        plugins = PluginManager.get_plugins()
+
+        tracked_files = repo.iter_tracked_files() if blobs is None else blobs
+        files = itertools.chain(
+            Profiler.iterate("git_enumeration", tracked_files),
+            cfg.config_files or [],
+        )
+
+        config_files: Set[str] = set()
+        # the remaining time is spent routing files to plugins
+        with Profiler.phase("file_routing"):
+            for file in Profiler.iterate(
+                "ignore_filter", IgnoreFile.prune(files)
+            ):
+                abs_file_path = os.path.join(cfg.project_root_abs, file)
+                plugin = PluginManager.get_responsible_plugin(
+                    plugins, abs_file_path
+                )
+                if plugin is None:
+                    continue
+                # files deleted from the working tree remain in the index
+                if (blobs and file in blobs) or os.path.isfile(
+                    abs_file_path
+                ):
+                    config_files.add(file)
+
+        return config_files
+
+    @staticmethod
+    def _get_commit_hash(repo: Git) -> Optional[str]:
+        """Return the current commit or None if there is no commit yet."""
+        try:
+            return repo.get_current_commit_hash()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _load_artifacts(
+        parse_jobs: List[ParseJob],
+        blob_hashes: List[Optional[str]],
+        cfg: NetworkConfiguration,
+    ) -> List[Optional[ArtifactNode]]:
+        """
+        Load artifacts from the parse cache and parse all remaining files.
+
+        :param parse_jobs: plugin, absolute and relative path of each file
+        :param blob_hashes: git blob hash of each file, None if unreadable
+        :param cfg: network configuration
+        :return: artifact nodes in the order of the parse jobs
+        """
+        if not cfg.enable_parse_cache:
+            return Network._parse_artifacts(parse_jobs, cfg.jobs)
+
+        cache = ParseCache(cfg.cache_dir_path(), cfg.parse_cache_size)
+
+        keys: List[Optional[str]] = []
+        artifacts: List[Optional[ArtifactNode]] = []
+        for (plugin, _, rel_file_path), blob_hash in zip(
+            parse_jobs, blob_hashes
+        ):
+            key = None
+            if blob_hash:
+                key = cache.key(plugin, blob_hash, rel_file_path)
+            keys.append(key)
+            artifacts.append(cache.get(key) if key else None)
+
+        missing = [i for i, art in enumerate(artifacts) if art is None]
+        parsed = Network._parse_artifacts(
+            [parse_jobs[i] for i in missing], cfg.jobs
+        )
+
+        # store artifacts before they are attached to the project node
+        for i, artifact in zip(missing, parsed):
+            artifacts[i] = artifact
+            key = keys[i]
+            if artifact is not None and key is not None:
+                cache.put(key, artifact)
+
+        if cache.writes:
+            cache.evict()
+
+        logging.debug(
+            "Parse cache: %s hits, %s misses", cache.hits, cache.misses
+        )
+
+        return artifacts
+
+    @staticmethod
+    def _parse_artifacts(
+        parse_jobs: List[ParseJob], jobs: int
+    ) -> List[Optional[ArtifactNode]]:
+        """
+        Parse artifacts into detached sub-networks.
+
+        :param parse_jobs: plugin, absolute and relative path of each file
+        :param jobs: number of worker processes, 1 parses in this process
+        :return: artifact nodes in the order of the parse jobs
+        """
+        if jobs <= 1 or len(parse_jobs) <= 1:
+            return [parse_artifact(job) for job in parse_jobs]
+
+        chunksize = max(1, len(parse_jobs) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(
+                executor.map(parse_artifact, parse_jobs, chunksize=chunksize)
+            )
+
+
+def parse_artifact(job: ParseJob) -> Optional[ArtifactNode]:
+    """
+    Parse a file into an artifact node that is not attached to a project.
+
+    Used as worker function of the process pool in `Network.init_network`.
+
+    :param job: responsible plugin, absolute and relative path of the file
+    :return: detached artifact node or None if the file could not be decoded
+    """
+    plugin, abs_file_path, rel_file_path = job
+    try:
+        return plugin.parse_file(
+            abs_file_path=abs_file_path,
+            rel_file_path=rel_file_path,
+            root=None,
+        )
+    except UnicodeDecodeError as error:
+        logging.warning(
+            "%s: %s (%s)",
+            plugin.__class__.__name__,
+            error.reason,
+            rel_file_path,
+        )
+        return None
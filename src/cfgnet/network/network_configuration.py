@@ -16,6 +16,12 @@ class NetworkConfiguration:
     # List of names of enabled linkers
     enabled_linkers: List[str] = field(default_factory=list)
     config_files: List[str] = field(default_factory=list)
+    # Number of worker processes used to parse configuration artifacts
+    jobs: int = 1
+    # Reuse parsed artifacts of unchanged files across runs
+    enable_parse_cache: bool = True
+    # Size limit of the parse cache in bytes
+    parse_cache_size: int = 512 * 1024 * 1024
 
     def data_dir_path(self):
         return os.path.join(self.project_root_abs, self.cfgnet_path_rel)
@@ -26,6 +32,23 @@ class NetworkConfiguration:
     def export_dir_path(self):
         return os.path.join(self.data_dir_path(), "export")
 
+    def cache_dir_path(self):
+        return os.path.join(self.data_dir_path(), "cache")
+
+    def constraint_cache_path(self):
+        return os.path.join(self.data_dir_path(), "constraints.json")
+
+    def blob_dir_path(self):
+        return os.path.join(self.data_dir_path(), "blobs")
+
+    def analysis_dir_path(self):
+        return os.path.join(self.data_dir_path(), "analysis")
+
+    def delta_store_path(self):
+        return os.path.join(
+            self.analysis_dir_path(), f"deltas_{self.project_name()}.sqlite"
+        )
+
     def ignorefile_path(self):
         return os.path.join(self.data_dir_path(), "ignore")
 
@@ -0,0 +1,276 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
+
+if TYPE_CHECKING:
+    from cfgnet.network.network import Network
+
+
+@dataclass()
+class OptionDelta:
+    """Change of an option that holds values."""
+
+    # relative path of the artifact
+    artifact: str
+    option: str
+    location: str
+    old_values: List[str] = field(default_factory=list)
+    new_values: List[str] = field(default_factory=list)
+
+
+@dataclass()
+class NetworkDelta:
+    """Structural changes between two networks."""
+
+    added_artifacts: List[str] = field(default_factory=list)
+    removed_artifacts: List[str] = field(default_factory=list)
+    added_options: List[OptionDelta] = field(default_factory=list)
+    removed_options: List[OptionDelta] = field(default_factory=list)
+    modified_options: List[OptionDelta] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not any(
+            (
+                self.added_artifacts,
+                self.removed_artifacts,
+                self.added_options,
+                self.removed_options,
+                self.modified_options,
+            )
+        )
+
+    def changed_artifacts(self) -> List[str]:
+        """Return the relative paths of all artifacts with changes."""
+        artifacts = set(self.added_artifacts).union(self.removed_artifacts)
+        for options in (
+            self.added_options,
+            self.removed_options,
+            self.modified_options,
+        ):
+            artifacts.update(option.artifact for option in options)
+        return sorted(artifacts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        lines = [f"+ {artifact}" for artifact in self.added_artifacts]
+        lines.extend(f"- {artifact}" for artifact in self.removed_artifacts)
+        lines.extend(
+            f"+ {x.artifact}: {x.option} = {', '.join(x.new_values)}"
+            for x in self.added_options
+        )
+        lines.extend(
+            f"- {x.artifact}: {x.option} = {', '.join(x.old_values)}"
+            for x in self.removed_options
+        )
+        lines.extend(
+            f"~ {x.artifact}: {x.option} = {', '.join(x.old_values)} -> "
+            f"{', '.join(x.new_values)}"
+            for x in self.modified_options
+        )
+        return "\n".join(lines)
+
+
+class NetworkDiff:
+    """Static class computing the structural diff of two networks."""
+
+    @staticmethod
+    def diff(
+        network_a: Optional["Network"],
+        network_b: "Network",
+        artifact_options: bool = False,
+    ) -> NetworkDelta:
+        """
+        Compare two networks artifact by artifact.
+
+        Artifacts are matched by their relative paths, options by their
+        IDs.  If an artifact contains several options with the same ID,
+        these options are matched by their locations.  Only options that
+        hold values are compared, changes of nested options show up as
+        changes of the options below them.
+
+        :param network_a: old network, None for an empty network
+        :param network_b: new network
+        :param artifact_options: Also list the options of added and removed
+            artifacts as added and removed options
+        :return: Changes from `network_a` to `network_b`
+        """
+        artifacts_a = NetworkDiff._get_artifacts(network_a)
+        artifacts_b = NetworkDiff._get_artifacts(network_b)
+
+        delta = NetworkDelta(
+            added_artifacts=sorted(set(artifacts_b) - set(artifacts_a)),
+            removed_artifacts=sorted(set(artifacts_a) - set(artifacts_b)),
+        )
+
+        files = set(artifacts_a) & set(artifacts_b)
+        if artifact_options:
+            files = set(artifacts_a) | set(artifacts_b)
+
+        for file in sorted(files):
+            NetworkDiff.diff_artifacts(
+                artifacts_a.get(file), artifacts_b.get(file), delta
+            )
+
+        return delta
+
+    @staticmethod
+    def diff_artifacts(
+        artifact_a: Optional[ArtifactNode],
+        artifact_b: Optional[ArtifactNode],
+        delta: NetworkDelta,
+    ) -> None:
+        """
+        Add the changes of options between two artifacts to a delta.
+
+        :param artifact_a: old artifact, None if the artifact was added
+        :param artifact_b: new artifact with the same path, None if the
+            artifact was removed
+        :param delta: delta to which the changes are added
+        """
+        options_a = NetworkDiff._get_options(artifact_a)
+        options_b = NetworkDiff._get_options(artifact_b)
+        file = (artifact_b or artifact_a).rel_file_path  # type: ignore
+
+        option_ids = list(options_a)
+        option_ids.extend(x for x in options_b if x not in options_a)
+
+        for option_id in option_ids:
+            matches, removed, added = NetworkDiff._match_options(
+                options_a.get(option_id, []), options_b.get(option_id, [])
+            )
+
+            for option_a, option_b in matches:
+                old_values = NetworkDiff._get_values(option_a)
+                new_values = NetworkDiff._get_values(option_b)
+                if old_values != new_values:
+                    delta.modified_options.append(
+                        OptionDelta(
+                            artifact=file,
+                            option=option_b.display_option_id,
+                            location=str(option_b.location),
+                            old_values=old_values,
+                            new_values=new_values,
+                        )
+                    )
+
+            for option in removed:
+                delta.removed_options.append(
+                    OptionDelta(
+                        artifact=file,
+                        option=option.display_option_id,
+                        location=str(option.location),
+                        old_values=NetworkDiff._get_values(option),
+                    )
+                )
+
+            for option in added:
+                delta.added_options.append(
+                    OptionDelta(
+                        artifact=file,
+                        option=option.display_option_id,
+                        location=str(option.location),
+                        new_values=NetworkDiff._get_values(option),
+                    )
+                )
+
+    @staticmethod
+    def _get_artifacts(
+        network: Optional["Network"],
+    ) -> Dict[str, ArtifactNode]:
+        if network is None:
+            return {}
+        return {
+            artifact.rel_file_path: artifact
+            for artifact in network.root.children
+            if isinstance(artifact, ArtifactNode)
+        }
+
+    @staticmethod
+    def _get_options(
+        artifact: Optional[ArtifactNode],
+    ) -> Dict[str, List[OptionNode]]:
+        """Collect the options of an artifact that hold values by IDs."""
+        options: DefaultDict[str, List[OptionNode]] = defaultdict(list)
+        if artifact is None:
+            return options
+        stack: List[Any] = list(reversed(artifact.children))
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, OptionNode):
+                continue
+            if node.prevalue_node:
+                options[node.id].append(node)
+            stack.extend(reversed(node.children))
+        return options
+
+    @staticmethod
+    def _get_values(option: OptionNode) -> List[str]:
+        return [
+            child.name
+            for child in option.children
+            if isinstance(child, ValueNode)
+        ]
+
+    @staticmethod
+    def _match_options(
+        options_a: List[OptionNode], options_b: List[OptionNode]
+    ) -> Tuple[
+        List[Tuple[OptionNode, OptionNode]], List[OptionNode], List[OptionNode]
+    ]:
+        """
+        Match options with the same ID.
+
+        A single option on both sides is matched even if it moved, several
+        options are matched by their locations.
+
+        :return: matched options, unmatched old and unmatched new options
+        """
+        if len(options_a) == 1 and len(options_b) == 1:
+            return [(options_a[0], options_b[0])], [], []
+
+        # several options may share a location, e.g. options in one line
+        by_location: DefaultDict[str, List[OptionNode]] = defaultdict(list)
+        for option in options_b:
+            by_location[str(option.location)].append(option)
+
+        matches = []
+        removed = []
+        matched: Set[int] = set()
+        for option_a in options_a:
+            candidates = by_location.get(str(option_a.location))
+            if not candidates:
+                removed.append(option_a)
+                continue
+            option_b = candidates.pop(0)
+            matched.add(id(option_b))
+            matches.append((option_a, option_b))
+
+        added = [option for option in options_b if id(option) not in matched]
+        return matches, removed, added
@@ -0,0 +1,427 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import io
+import os
+import pickle
+import sqlite3
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+from cfgnet.constraints.constraint_template import ConstraintTemplate
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
+from cfgnet.linker.link import Link
+from cfgnet.network.nodes import Node, ProjectNode
+
+if TYPE_CHECKING:
+    from cfgnet.network.network import Network
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value BLOB
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    position INTEGER PRIMARY KEY,
+    artifact_id TEXT NOT NULL,
+    rel_file_path TEXT NOT NULL,
+    concept_name TEXT,
+    tree BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    node_a INTEGER NOT NULL,
+    node_b INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS conflicts (
+    attribute TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    conflict_id TEXT,
+    type TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (attribute, position)
+);
+CREATE TABLE IF NOT EXISTS templates (
+    file_path TEXT NOT NULL,
+    option_id TEXT NOT NULL,
+    constraint_type TEXT NOT NULL,
+    artifact INTEGER NOT NULL,
+    option INTEGER NOT NULL,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class _NetworkPickler(pickle.Pickler):
+    """Pickler storing references to the network and its nodes."""
+
+    def __init__(
+        self, file: io.BytesIO, network: Network, refs: Dict[int, int]
+    ) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.network = network
+        self.refs = refs
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple]:
+        if obj is self.network:
+            return ("network",)
+        # nodes are alive while pickling, so their IDs cannot be reused
+        ref = self.refs.get(id(obj))
+        if ref is not None:
+            return ("node", ref)
+        return None
+
+
+class _NetworkUnpickler(pickle.Unpickler):
+    """Unpickler resolving the references of `_NetworkPickler`."""
+
+    def __init__(
+        self, file: io.BytesIO, network: Network, nodes: List[Node]
+    ) -> None:
+        super().__init__(file)
+        self.network = network
+        self.nodes = nodes
+
+    def persistent_load(self, pid: Tuple) -> Any:
+        if pid[0] == "network":
+            return self.network
+        if pid[0] == "node":
+            return self.nodes[pid[1]]
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+
+class NetworkStore:
+    """
+    Versioned SQLite store of a configuration network.
+
+    Each artifact is stored as a row of the `nodes` table that holds its
+    pickled sub-network, so loading the nodes costs one query.  Links,
+    conflicts and constraint templates are kept in separate tables and
+    refer to nodes by their position in a pre-order traversal of the
+    network.  Commands can therefore load only the parts they need.
+
+    A network loaded without some of its parts remembers them in
+    `unloaded_parts`.  Saving such a network keeps the stored rows of these
+    parts, which is only correct as long as its nodes are not modified.
+    """
+
+    # bump when the layout of the tables or the pickled nodes changes
+    version: int = 1
+
+    # attributes of a network that can be loaded separately
+    parts: Tuple[str, ...] = (
+        "links",
+        "option_constraints",
+        "conflicts",
+        "constraint_conflicts",
+        "constraint_violations",
+    )
+
+    # parts stored in the conflicts table and their collection type
+    conflict_parts: Dict[str, Callable] = {
+        "conflicts": set,
+        "constraint_conflicts": set,
+        "constraint_violations": list,
+    }
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path: str = db_path
+
+    def exists(self) -> bool:
+        """Check if the store has been written."""
+        return os.path.isfile(self.db_path)
+
+    def save(self, network: Network) -> None:
+        """
+        Write a network into the store.
+
+        :param network: network to be stored
+        """
+        unloaded_parts = getattr(network, "unloaded_parts", set())
+
+        refs: Dict[int, int] = {}
+        network.traverse(
+            network.root, lambda node: refs.setdefault(id(node), len(refs))
+        )
+        root_refs = {id(network.root): 0}
+
+        connection = sqlite3.connect(self.db_path)
+        try:
+            with connection:
+                connection.executescript(SCHEMA)
+                connection.execute("DELETE FROM meta")
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    NetworkStore._get_meta(network, root_refs),
+                )
+
+                connection.execute("DELETE FROM nodes")
+                connection.executemany(
+                    "INSERT INTO nodes VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (
+                            position,
+                            artifact.id,
+                            artifact.rel_file_path,
+                            artifact.concept_name,
+                            NetworkStore._dump(artifact, network, root_refs),
+                        )
+                        for position, artifact in enumerate(
+                            network.root.children
+                        )
+                    ),
+                )
+
+                if "links" not in unloaded_parts:
+                    connection.execute("DELETE FROM links")
+                    connection.executemany(
+                        "INSERT INTO links VALUES (?, ?)",
+                        (
+                            (refs[id(link.node_a)], refs[id(link.node_b)])
+                            for link in network.links
+                        ),
+                    )
+
+                if "option_constraints" not in unloaded_parts:
+                    connection.execute("DELETE FROM templates")
+                    connection.executemany(
+                        "INSERT INTO templates VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            (
+                                template.artifact.file_path,
+                                template.option.display_option_id,
+                                template.constraint_type,
+                                refs[id(template.artifact)],
+                                refs[id(template.option)],
+                                refs[id(template.value)],
+                            )
+                            for template in network.option_constraints
+                        ),
+                    )
+
+                for part in NetworkStore.conflict_parts:
+                    if part not in unloaded_parts:
+                        self._save_conflicts(connection, network, part, refs)
+        finally:
+            connection.close()
+
+    def load(self, parts: Optional[Iterable[str]] = None) -> Network:
+        """
+        Load a network from the store.
+
+        :param parts: parts of the network to be loaded in addition to its
+            nodes, by default all parts
+        :return: Configuration network
+        """
+        # pylint: disable=import-outside-toplevel
+        from cfgnet.network.network import Network
+
+        parts = set(NetworkStore.parts if parts is None else parts)
+        unknown_parts = parts.difference(NetworkStore.parts)
+        if unknown_parts:
+            raise ValueError(f"Unknown network parts: {sorted(unknown_parts)}")
+
+        connection = sqlite3.connect(self.db_path)
+        try:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            if meta.get("version") != NetworkStore.version:
+                raise InvalidNetworkStateException(
+                    f"Network store {self.db_path} has version "
+                    f"{meta.get('version')}, expected {NetworkStore.version}"
+                )
+
+            network = Network.__new__(Network)
+            root = ProjectNode(
+                name=meta["root_name"], root_dir=meta["root_dir"]
+            )
+            root.network = network
+            state = NetworkStore._load(meta["state"], network, [root])
+            network.__dict__.update(state)
+            network.root = root
+            network.unloaded_parts = set(NetworkStore.parts) - parts
+
+            for (tree,) in connection.execute(
+                "SELECT tree FROM nodes ORDER BY position"
+            ):
+                root.children.append(
+                    NetworkStore._load(tree, network, [root])
+                )
+
+            # the pre-order traversal assigns the same positions as when
+            # the network was saved
+            nodes: List[Node] = []
+            network._init_registries()
+
+            def register(node: Node) -> None:
+                nodes.append(node)
+                network.register_node(node)
+
+            network.traverse(root, register)
+
+            network.links = set()
+            if "links" in parts:
+                network.links = {
+                    Link(nodes[node_a], nodes[node_b])
+                    for node_a, node_b in connection.execute(
+                        "SELECT node_a, node_b FROM links"
+                    )
+                }
+
+            network.option_constraints = set()
+            if "option_constraints" in parts:
+                network.option_constraints = {
+                    ConstraintTemplate(
+                        nodes[artifact],
+                        nodes[option],
+                        nodes[value],
+                        constraint_type,
+                    )
+                    for constraint_type, artifact, option, value in (
+                        connection.execute(
+                            "SELECT constraint_type, artifact, option, value "
+                            "FROM templates"
+                        )
+                    )
+                }
+
+            for part, collection in NetworkStore.conflict_parts.items():
+                conflicts = []
+                if part in parts:
+                    conflicts = self._load_conflicts(
+                        connection, network, part, nodes
+                    )
+                setattr(network, part, collection(conflicts))
+        finally:
+            connection.close()
+
+        return network
+
+    @staticmethod
+    def migrate(pickle_path: str, db_path: str) -> Network:
+        """
+        Convert a pickled network into a store.
+
+        The pickle file is kept as backup with the suffix `.bak`.
+
+        :param pickle_path: path to the pickled network
+        :param db_path: path of the store to be written
+        :return: Configuration network
+        """
+        with open(pickle_path, "rb") as pickle_file:
+            network = pickle.load(pickle_file)
+
+        # write the store next to its final location so that an
+        # interrupted migration does not leave an incomplete store
+        tmp_path = f"{db_path}.{os.getpid()}.tmp"
+        NetworkStore(tmp_path).save(network)
+        os.replace(tmp_path, db_path)
+        os.replace(pickle_path, pickle_path + ".bak")
+
+        return network
+
+    @staticmethod
+    def _get_meta(
+        network: Network, root_refs: Dict[int, int]
+    ) -> List[Tuple[str, Any]]:
+        """Collect the attributes of a network that are no parts."""
+        state = network.__getstate__()
+        for key in ("root", "unloaded_parts") + NetworkStore.parts:
+            state.pop(key, None)
+
+        return [
+            ("version", NetworkStore.version),
+            ("root_name", network.root.name),
+            ("root_dir", network.root.root_dir),
+            ("state", NetworkStore._dump(state, network, root_refs)),
+        ]
+
+    @staticmethod
+    def _save_conflicts(
+        connection: sqlite3.Connection,
+        network: Network,
+        part: str,
+        refs: Dict[int, int],
+    ) -> None:
+        """
+        Write conflicts into a row per conflict.
+
+        Conflicts often share nodes of the reference network.  The rows are
+        written by the same pickler, so each shared object is stored once
+        and the rows of a part can only be unpickled together in order.
+        """
+        connection.execute(
+            "DELETE FROM conflicts WHERE attribute = ?", (part,)
+        )
+
+        buffer = io.BytesIO()
+        pickler = _NetworkPickler(buffer, network, refs)
+        rows = []
+        for position, conflict in enumerate(getattr(network, part)):
+            pickler.dump(conflict)
+            conflict_id = getattr(conflict, "id", None)
+            rows.append(
+                (
+                    part,
+                    position,
+                    None if conflict_id is None else str(conflict_id),
+                    type(conflict).__name__,
+                    buffer.getvalue(),
+                )
+            )
+            buffer.seek(0)
+            buffer.truncate()
+
+        connection.executemany(
+            "INSERT INTO conflicts VALUES (?, ?, ?, ?, ?)", rows
+        )
+
+    @staticmethod
+    def _load_conflicts(
+        connection: sqlite3.Connection,
+        network: Network,
+        part: str,
+        nodes: List[Node],
+    ) -> List[Any]:
+        rows = [
+            data
+            for (data,) in connection.execute(
+                "SELECT data FROM conflicts WHERE attribute = ? "
+                "ORDER BY position",
+                (part,),
+            )
+        ]
+        unpickler = _NetworkUnpickler(
+            io.BytesIO(b"".join(rows)), network, nodes
+        )
+        return [unpickler.load() for _ in rows]
+
+    @staticmethod
+    def _dump(obj: Any, network: Network, refs: Dict[int, int]) -> bytes:
+        buffer = io.BytesIO()
+        _NetworkPickler(buffer, network, refs).dump(obj)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _load(data: bytes, network: Network, nodes: List[Node]) -> Any:
+        return _NetworkUnpickler(io.BytesIO(data), network, nodes).load()
@@ -16,7 +16,8 @@
 """Datastructure for nodes of a configuration network."""
 
 from __future__ import annotations
-from typing import List, Any, Optional, Union, TYPE_CHECKING
+import sys
+from typing import Dict, List, Any, Optional, Set, Union, TYPE_CHECKING
 from cfgnet.config_types.config_types import ConfigType
 from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
 from cfgnet.exceptions.exceptions import NetworkConstructionException
@@ -25,10 +26,38 @@ if TYPE_CHECKING:
     from cfgnet.network.network import Network
 
 
+def intern(value: Any) -> Any:
+    """Intern strings so that equal names share a single object."""
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
+
+
+_slots: Dict[type, Set[str]] = {}
+
+
+def _get_slots(cls: type) -> Set[str]:
+    """Return the pickled slots of a node class."""
+    slots = _slots.get(cls)
+    if slots is None:
+        slots = {
+            slot
+            for klass in cls.__mro__
+            for slot in getattr(klass, "__slots__", ())
+            if slot != "_id"
+        }
+        _slots[cls] = slots
+    return slots
+
+
 class Node:
     """
     Base class of a node in the network.
 
+    Nodes use `__slots__` and do not store their full ID.  The ID is
+    derived from the ID of the parent and the name of the node when it is
+    accessed first and cached until the node is attached to another parent.
+
     Parameters
     ----------
     name: str
@@ -44,14 +73,42 @@ class Node:
 
     """
 
+    __slots__ = ("name", "parent", "children", "network", "_id")
+
     def __init__(self, name: str, parent: Node = None):
-        self.name: str = name
+        self.name: str = intern(name)
         self.parent: Optional[Node] = parent
         self.children: List[Any] = []
 
-        self.id: str = name
+        self._id: Optional[str] = None
         self.network: Optional["Network"] = None
 
+    @property
+    def id(self) -> str:
+        """Return the ID of the node, which contains the IDs of all parents."""
+        if self._id is None:
+            if self.parent is None:
+                self._id = str(self.name)
+            else:
+                self._id = self.parent.id + "::::" + str(self.name)
+        return self._id
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # IDs are not pickled, they are derived from the parents again
+        return {
+            slot: getattr(self, slot)
+            for slot in _get_slots(type(self))
+            if hasattr(self, slot)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._id = None
+        slots = _get_slots(type(self))
+        for key, value in state.items():
+            # networks pickled before nodes had slots contain their IDs
+            if key in slots:
+                setattr(self, key, intern(value))
+
     def __str__(self):
         return self.id
 
@@ -68,13 +125,51 @@ class Node:
         :parameter node: The node that should be added to this node.
         """
         node.parent = self
-        node.id = self.id + "::::" + str(node.id)
+        node._id = None
         node.network = self.network
 
         self.children.append(node)
 
         if self.network is not None:
-            self.network.nodes[node.id].append(node)
+            self.network.register_node(node)
+
+        # sub-networks parsed without a project node (e.g. in a worker
+        # process) already have children whose IDs have to be re-rooted
+        node._reroot_children()
+
+    def remove_child(self, node: Node) -> None:
+        """
+        Remove a child and its descendants from this node and the network.
+
+        :parameter node: The node that should be removed from this node.
+        """
+        for index, child in enumerate(self.children):
+            if child is node:
+                del self.children[index]
+                break
+        else:
+            raise ValueError(f"{node.id} is not a child of {self.id}")
+
+        if self.network is not None:
+            node._unregister(self.network)
+
+    def _reroot_children(self) -> None:
+        """Reset the IDs of all descendants and register them in the network."""
+        for child in self.children:
+            child._id = None
+            child.network = self.network
+
+            if self.network is not None:
+                self.network.register_node(child)
+
+            child._reroot_children()
+
+    def _unregister(self, network: "Network") -> None:
+        """Remove this node and its descendants from the registries."""
+        for child in self.children:
+            child._unregister(network)
+
+        network.unregister_node(self)
 
 
 class ProjectNode(Node):
@@ -88,6 +183,8 @@ class ProjectNode(Node):
 
     """
 
+    __slots__ = ("root_dir",)
+
     def __init__(self, name: str, root_dir: str):
         super().__init__(name)
         self.root_dir: str = root_dir
@@ -118,6 +215,8 @@ class ArtifactNode(Node):
 
     """
 
+    __slots__ = ("file_path", "rel_file_path", "concept_name")
+
     def __init__(
         self,
         file_path: str,
@@ -127,8 +226,8 @@ class ArtifactNode(Node):
     ):
         super().__init__(rel_file_path)
         self.file_path: str = file_path
-        self.rel_file_path: str = rel_file_path
-        self.concept_name: str = concept_name
+        self.rel_file_path: str = self.name
+        self.concept_name: str = intern(concept_name)
 
         if project_root is not None:
             project_root.add_child(self)
@@ -203,6 +302,13 @@ class OptionNode(Node):
 
     """
 
+    __slots__ = (
+        "display_option_id",
+        "location",
+        "prevalue_node",
+        "config_type",
+    )
+
     def __init__(
         self,
         name: str,
@@ -210,7 +316,7 @@ class OptionNode(Node):
         config_type: ConfigType = ConfigType.UNKNOWN,
     ):
         super().__init__(name)
-        self.display_option_id: str = name
+        self.display_option_id: str = self.name
         self.location: str = location
         self.prevalue_node: bool = False
         self.config_type = config_type
@@ -231,14 +337,14 @@ class OptionNode(Node):
             node.config_type = self.config_type
 
         if isinstance(node, OptionNode):
-            node.display_option_id = (
+            node.display_option_id = intern(
                 self.display_option_id + "::" + node.display_option_id
             )
 
         if isinstance(node, ValueNode):
             self.prevalue_node = True
             if node.config_type == ConfigType.UNKNOWN:
-                node.config_type = ConfigTypeInferer().get_config_type(
+                node.config_type = ConfigTypeInferer.get_config_type(
                     option_name=self.name, value=node.name
                 )
 
@@ -259,8 +365,12 @@ class ValueNode(Node):
 
     """
 
+    __slots__ = ("config_type",)
+
     def __init__(self, name: str):
         super().__init__(str(name))
+        # value nodes are leaves, an empty tuple saves a list per node
+        self.children: Any = ()
         self.config_type = ConfigType.UNKNOWN
 
     def __eq__(self, other):
@@ -0,0 +1,189 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import logging
+import hashlib
+import pickle
+import shutil
+
+from typing import Dict, List, Optional, Tuple
+from cfgnet.network.nodes import ArtifactNode
+from cfgnet.plugins.plugin import Plugin
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed artifact sub-networks.
+
+    Each entry stores the detached `ArtifactNode` of a file.  Entries are
+    content-addressed: the key consists of the git blob hash of the file,
+    the name and version of the responsible plugin and the path of the
+    file relative to the project, so a changed file or a changed plugin
+    never hits a stale entry.  The absolute path a file is read from is
+    not part of the key, so files of commits that are written to
+    temporary directories share the entries of the working tree.
+
+    The cache is bounded in size.  Whenever entries are written, the least
+    recently used entries are evicted until the cache fits its size limit.
+    """
+
+    # bump when the pickled layout of nodes changes
+    version: int = 3
+
+    def __init__(self, cache_dir: str, max_size: int) -> None:
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.writes: int = 0
+
+    def key(
+        self,
+        plugin: Plugin,
+        blob_hash: str,
+        rel_file_path: str,
+    ) -> str:
+        """
+        Create the cache key of a file.
+
+        :param plugin: plugin responsible for the file
+        :param blob_hash: git blob hash of the file content
+        :param rel_file_path: relative path to the file
+        :return: hex digest identifying the cache entry
+        """
+        key_parts = [
+            str(ParseCache.version),
+            blob_hash,
+            plugin.__class__.__name__,
+            str(plugin.version),
+            rel_file_path,
+        ]
+        return hashlib.sha1("\0".join(key_parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[ArtifactNode]:
+        """
+        Load a cached artifact.
+
+        :param key: cache key of the file
+        :return: Cached artifact node or None if there is no valid entry
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, "rb") as entry_file:
+                artifact = pickle.load(entry_file)
+            # the modification time tracks when an entry was used last
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            logging.debug("Discard corrupt cache entry %s", entry_path)
+            self._remove(entry_path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return artifact
+
+    def put(self, key: str, artifact: ArtifactNode) -> None:
+        """
+        Store an artifact in the cache.
+
+        :param key: cache key of the file
+        :param artifact: detached artifact node of the file
+        """
+        entry_path = self._entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(tmp_path, "wb") as entry_file:
+                pickle.dump(artifact, entry_file)
+            os.replace(tmp_path, entry_path)
+            self.writes += 1
+        except OSError as error:
+            logging.debug("Could not write cache entry %s: %s", key, error)
+            self._remove(tmp_path)
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its limit.
+
+        :return: Number of evicted entries
+        """
+        entries = self._entries()
+        total_size = sum(size for _, size, _ in entries)
+
+        evicted = 0
+        for entry_path, size, _ in sorted(entries, key=lambda x: x[2]):
+            if total_size <= self.max_size:
+                break
+            self._remove(entry_path)
+            total_size -= size
+            evicted += 1
+
+        if evicted:
+            logging.debug("Evicted %s entries from parse cache", evicted)
+
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all entries of the cache."""
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+
+    def stats(self) -> Dict:
+        """
+        Collect statistics about the stored entries.
+
+        :return: Dict with number of entries, their size and the size limit
+        """
+        entries = self._entries()
+        return {
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_size,
+        }
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".pickle")
+
+    def _entries(self) -> List[Tuple[str, int, float]]:
+        """Return path, size and last use of all cache entries."""
+        entries: List[Tuple[str, int, float]] = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+
+        for directory, _, files in os.walk(self.cache_dir):
+            for file in files:
+                if not file.endswith(".pickle"):
+                    continue
+                entry_path = os.path.join(directory, file)
+                try:
+                    stat = os.stat(entry_path)
+                except OSError:
+                    continue
+                entries.append((entry_path, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -17,22 +17,12 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class AnsiblePlaybookPlugin(YAMLPlugin):
+    file_suffixes = ("site.yml", "playbook.yml", "site.yaml", "playbook.yaml")
+    file_patterns = (r"playbooks/.*\.(yml|yaml)$",)
+
     def __init__(self):
         super().__init__("ansible-playbook")
 
-    def is_responsible(self, abs_file_path) -> bool:
-        if abs_file_path.endswith(
-            ("site.yml", "playbook.yml", "site.yaml", "playbook.yaml")
-        ):
-            return True
-
-        if "playbooks/" in abs_file_path and abs_file_path.endswith(
-            (".yml", ".yaml")
-        ):
-            return True
-
-        return False
-
     # pylint: disable=too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:
         """
@@ -16,14 +16,11 @@ from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 from cfgnet.errors.error import Error
 
 class AnsiblePlugin(ConfigParserPlugin):
+    file_suffixes = ("ansible.cfg",)
+
     def __init__(self):
         super().__init__("ansible")
 
-    def is_responsible(self, abs_file_path):
-        if abs_file_path.endswith("ansible.cfg"):
-            return True
-        return False
-
     @staticmethod
     def correct_error(error: Error) -> None:
         _file = open(error.file_path, 'r')
@@ -13,7 +13,6 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 from typing import Optional
 import apacheconfig
 
@@ -28,15 +27,11 @@ from cfgnet.network.nodes import (
 from cfgnet.errors.error import Error
 
 class ApacheWebserverPlugin(Plugin):
+    file_names = ("httpd.conf",)
+
     def __init__(self):
         super().__init__("apache")
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        file_name = os.path.basename(abs_file_path)
-        if file_name == "httpd.conf":
-            return True
-        return False
-
     def _parse_config_file(
         self,
         abs_file_path: str,
@@ -18,15 +18,12 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class CypressPlugin(JsonPlugin):
+    file_suffixes = ("cypress.json",)
+
     def __init__(self):
         super().__init__("cypress")
         self.excluded_keys: List[str] = []
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        if abs_file_path.endswith("cypress.json"):
-            return True
-        return False
-
     # pylint: disable=too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:
         """
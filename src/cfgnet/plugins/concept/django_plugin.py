@@ -26,14 +26,11 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class DjangoPlugin(Plugin):
+    file_suffixes = ("settings.py",)
+
     def __init__(self):
         super().__init__("django")
 
-    def is_responsible(self, abs_file_path):
-        if abs_file_path.endswith("settings.py"):
-            return True
-        return False
-
     # pylint: disable=W0640
     def _parse_config_file(
         self,
@@ -21,17 +21,13 @@ from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
 from cfgnet.errors.error import Error
 
 class DockerComposePlugin(YAMLPlugin):
-    file_name = re.compile(r"docker-compose(.\w+)?.yml")
+    file_suffixes = ()
+    file_patterns = (r"docker-compose(.\w+)?.yml",)
     ports = re.compile(r"(?P<in>[0-9]{4}):(?P<out>[0-9]{4})")
 
     def __init__(self):
         super().__init__("docker-compose")
 
-    def is_responsible(self, abs_file_path):
-        if self.file_name.search(abs_file_path):
-            return True
-        return False
-
     def _parse_scalar_node(self, node, parent):
         if node.value != "":
             match = DockerComposePlugin.ports.match(node.value)
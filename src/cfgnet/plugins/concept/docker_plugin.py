@@ -13,7 +13,6 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import re
 
 from typing import List, Optional
@@ -46,6 +45,7 @@ def parse_env(line: str) -> List[str]:
 
 
 class DockerPlugin(Plugin):
+    file_names = ("Dockerfile",)
     expose_command = re.compile(
         r"(?P<port>[0-9]{2,4})(\/)(?P<protocol>(tcp|udp))"
     )
@@ -165,18 +165,10 @@ class DockerPlugin(Plugin):
                 option.add_child(ValueNode(name=value_name))
 
             if not option.children:
-                artifact.children.remove(option)
+                artifact.remove_child(option)
 
         return artifact
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        file_name = os.path.basename(abs_file_path)
-
-        if file_name == "Dockerfile":
-            return True
-
-        return False
-
     def _parse_expose(self, option: OptionNode, value: str) -> None:
         """Parse EXPOSE option."""
         match = self.expose_command.fullmatch(value)
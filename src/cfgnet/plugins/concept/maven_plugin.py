@@ -14,7 +14,6 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-import os
 
 from typing import Optional, Tuple, List
 from lxml import etree as ET
@@ -44,6 +43,8 @@ TAGS_CONTAINING_LISTS = {
 
 
 class MavenPlugin(Plugin):
+    file_names = ("pom.xml",)
+
     def __init__(self):
         super().__init__("maven")
 
@@ -90,14 +91,6 @@ class MavenPlugin(Plugin):
 
         return artifact
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        file_name = os.path.basename(abs_file_path)
-
-        if file_name == "pom.xml":
-            return True
-
-        return False
-
     def parse_tree(self, subtree_root: _Element, parent_node: Node):
         name = self._get_option_name(subtree_root)
         if name:
@@ -124,7 +117,7 @@ class MavenPlugin(Plugin):
 
             # remove option nodes without children
             if not option.children:
-                parent_node.children.remove(option)
+                parent_node.remove_child(option)
 
     @staticmethod
     def correct_error(error: Error) -> None:
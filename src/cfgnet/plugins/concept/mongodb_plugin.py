@@ -17,14 +17,11 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class MongoDBPlugin(YAMLPlugin):
+    file_suffixes = ("mongod.conf",)
+
     def __init__(self):
         super().__init__("mongodb")
 
-    def is_responsible(self, abs_file_path) -> bool:
-        if abs_file_path.endswith("mongod.conf"):
-            return True
-        return False
-
     # pylint: disable=unused-argument,too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:  # noqa: C901
         """
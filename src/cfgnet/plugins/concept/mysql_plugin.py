@@ -18,14 +18,11 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class MysqlPlugin(ConfigParserPlugin):
+    file_suffixes = ("my.cnf", "my.ini")
+
     def __init__(self):
         super().__init__("mysql")
 
-    def is_responsible(self, abs_file_path) -> bool:
-        if abs_file_path.endswith(("my.cnf", "my.ini")):
-            return True
-        return False
-
     # pylint: disable=unused-argument,too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:  # noqa: C901
         """
@@ -17,6 +17,8 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class NodejsPlugin(JsonPlugin):
+    file_suffixes = ("package.json",)
+
     def __init__(self):
         super().__init__("nodejs")
         self.excluded_keys = [
@@ -26,11 +28,6 @@ class NodejsPlugin(JsonPlugin):
             "contributors",
         ]
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        if abs_file_path.endswith("package.json"):
-            return True
-        return False
-
     # pylint: disable=too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:
         """
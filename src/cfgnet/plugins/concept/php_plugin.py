@@ -18,15 +18,12 @@ from cfgnet.plugins.file_type.configparser_plugin import ConfigParserPlugin
 from cfgnet.errors.error import Error
 
 class PhpPlugin(ConfigParserPlugin):
+    file_suffixes = ("php.ini",)
+
     def __init__(self):
         super().__init__("php")
         self.excluded_keys: List[str] = ["extension"]
 
-    def is_responsible(self, abs_file_path) -> bool:
-        if abs_file_path.endswith("php.ini"):
-            return True
-        return False
-
     # pylint: disable=unused-argument,too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:  # noqa: C901
         """
@@ -17,6 +17,8 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class PoetryPlugin(TomlPlugin):
+    file_suffixes = ("pyproject.toml",)
+
     def __init__(self):
         super().__init__("poetry")
         self.excluded_keys = [
@@ -28,11 +30,6 @@ class PoetryPlugin(TomlPlugin):
             "classifiers",
         ]
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        if abs_file_path.endswith("pyproject.toml"):
-            return True
-        return False
-
     # pylint: disable=too-many-return-statements
     @staticmethod
     def get_config_type(option_name: str) -> ConfigType:
@@ -29,9 +29,9 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class SpringPlugin(Plugin):
-    application_yaml_regex = re.compile(r"application(.(dev|prod)+)?.yml")
-    application_properties_regex = re.compile(
-        r"application(.(dev|prod)+)?.properties"
+    file_patterns = (
+        r"application(.(dev|prod)+)?.yml",
+        r"application(.(dev|prod)+)?.properties",
     )
     # bootstrap_yaml_regex = re.compile(r"bootstrap(.(dev|prod)+)?.yml")
     # bootstrap_properties_regex = re.compile(r"bootstrap(.(dev|prod)+)?.properties")
@@ -39,13 +39,6 @@ class SpringPlugin(Plugin):
     def __init__(self):
         super().__init__("spring")
 
-    def is_responsible(self, abs_file_path):
-        if self.application_yaml_regex.search(abs_file_path):
-            return True
-        if self.application_properties_regex.search(abs_file_path):
-            return True
-        return False
-
     def _parse_config_file(
         self,
         abs_file_path: str,
@@ -152,7 +145,7 @@ class SpringPlugin(Plugin):
 
                 else:
                     logging.warning('Empty value in file "%s"', rel_file_path)
-                    parent.children.remove(option_node)
+                    parent.remove_child(option_node)
 
     def get_line_number(self, option_name: str, line_dict: Dict) -> str:
         """
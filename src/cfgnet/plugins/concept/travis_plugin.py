@@ -21,14 +21,11 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class TravisPlugin(YAMLPlugin):
+    file_suffixes = (".travis.yml",)
+
     def __init__(self):
         super().__init__("travis")
 
-    def is_responsible(self, abs_file_path):
-        if abs_file_path.endswith(".travis.yml"):
-            return True
-        return False
-
     def _parse_sequence_node(self, node, parent):
         for child in node.value:
             if isinstance(child, MappingNode):
@@ -17,15 +17,12 @@ from cfgnet.config_types.config_types import ConfigType
 from cfgnet.errors.error import Error
 
 class TsconfigPlugin(JsonPlugin):
+    file_suffixes = ("tsconfig.json",)
+
     def __init__(self):
         super().__init__("tsconfig")
         self.excluded_keys = []
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        if abs_file_path.endswith("tsconfig.json"):
-            return True
-        return False
-
     # pylint: disable=too-many-return-statements
     def get_config_type(self, option_name: str) -> ConfigType:
         """
@@ -32,6 +32,8 @@ class MultiOrderedDict(OrderedDict):
 
 
 class ConfigParserPlugin(Plugin):
+    file_suffixes = (".ini", ".properties")
+
     def __init__(self, name=None):
         if name is None:
             super().__init__("configparser")
@@ -144,13 +146,10 @@ class ConfigParserPlugin(Plugin):
 
                 else:
                     logging.warning('Empty value in file "%s"', rel_file_path)
-                    parent.children.remove(option_node)
+                    parent.remove_child(option_node)
 
         return artifact
 
-    def is_responsible(self, abs_file_path):
-        return re.match(r".*\.(ini|properties)$", abs_file_path)
-
     def get_line_number(self, option_name: str, line_dict: Dict) -> str:
         """
         Get line number from line dictionary.
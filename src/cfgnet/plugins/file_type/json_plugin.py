@@ -28,6 +28,8 @@ from cfgnet.config_types.config_types import ConfigType
 
 
 class JsonPlugin(Plugin):
+    file_suffixes = (".json",)
+
     def __init__(self, name=None):
         if name is None:
             super().__init__("json")
@@ -35,11 +37,6 @@ class JsonPlugin(Plugin):
             super().__init__(name)
         self.excluded_keys: List[str] = []
 
-    def is_responsible(self, abs_file_path: str) -> bool:
-        if abs_file_path.endswith(".json"):
-            return True
-        return False
-
     def _parse_config_file(
         self,
         abs_file_path: str,
@@ -102,7 +99,7 @@ class JsonPlugin(Plugin):
 
                     self._parse_json_object(child, option, line_number_dict)
                     if not option.children:
-                        parent.children.remove(option)
+                        parent.remove_child(option)
             return
 
         if isinstance(json_object, list):
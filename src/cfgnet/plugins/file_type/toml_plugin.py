@@ -23,6 +23,8 @@ from cfgnet.config_types.config_types import ConfigType
 
 
 class TomlPlugin(Plugin):
+    file_suffixes = (".toml",)
+
     def __init__(self, name=None):
         if name is None:
             super().__init__("toml")
@@ -59,12 +61,6 @@ class TomlPlugin(Plugin):
 
         return artifact
 
-    def is_responsible(self, abs_file_path):
-        if abs_file_path.endswith(".toml"):
-            return True
-
-        return False
-
     def _iter_data(self, data, line_number_dict, parent):
         for argument, value in data.items():
             lineno = None
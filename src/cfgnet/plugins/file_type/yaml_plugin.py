@@ -29,6 +29,8 @@ from cfgnet.config_types.config_types import ConfigType
 
 
 class YAMLPlugin(Plugin):
+    file_suffixes = (".yaml", ".yml")
+
     def __init__(self, name=None):
         if name is None:
             super().__init__("yaml")
@@ -56,12 +58,6 @@ class YAMLPlugin(Plugin):
             logging.warning("Invalid YAML file %s: %s", abs_file_path, error)
         return artifact
 
-    def is_responsible(self, abs_file_path):
-        if abs_file_path.endswith(".yaml") or abs_file_path.endswith(".yml"):
-            return True
-
-        return False
-
     def _iter_tree(self, node, parent):
         if isinstance(node, MappingNode):
             self._parse_mapping_node(node, parent)
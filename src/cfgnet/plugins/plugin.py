@@ -16,14 +16,27 @@
 import abc
 import logging
 import os
+import re
 
-from typing import Optional
+from typing import Optional, Tuple
 from cfgnet.network.nodes import ProjectNode, ArtifactNode
 
 
 class Plugin(abc.ABC):
     """Plugin for parsing a specific configuration concept."""
 
+    # increase when the sub-networks created by the plugin change, this
+    # invalidates artifacts of the plugin stored in the parse cache
+    version: int = 1
+
+    # the plugin is responsible for files with one of these base names, for
+    # paths ending with one of these suffixes and for paths that contain a
+    # match of one of these regular expressions, which the plugin manager
+    # compiles into a routing index
+    file_names: Tuple[str, ...] = ()
+    file_suffixes: Tuple[str, ...] = ()
+    file_patterns: Tuple[str, ...] = ()
+
     def __init__(self, concept_name: str, threshold: Optional[int] = None):
         """
         Initialize plugin.
@@ -50,13 +63,21 @@ class Plugin(abc.ABC):
         :return: ArtifactNode that will be added to the configuration network
         """
 
-    @abc.abstractmethod
     def is_responsible(self, abs_file_path: str) -> bool:
         """
         Return true if the plugin is responsible for the file.
 
         :param abs_file_path: Absolute path to the file.
         """
+        if os.path.basename(abs_file_path) in self.file_names:
+            return True
+
+        if abs_file_path.endswith(self.file_suffixes):
+            return True
+
+        return any(
+            re.search(pattern, abs_file_path) for pattern in self.file_patterns
+        )
 
     def parse_file(
         self,
@@ -13,9 +13,10 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.plugin_router import PluginRouter
 from cfgnet.plugins.concept.docker_plugin import DockerPlugin
 from cfgnet.plugins.concept.maven_plugin import MavenPlugin
 from cfgnet.plugins.concept.nodejs_plugin import NodejsPlugin
@@ -69,6 +70,8 @@ class PluginManager:
         TomlPlugin(),
     ]
 
+    routers: Dict[int, PluginRouter] = {}
+
     @staticmethod
     def get_plugins() -> List:
         """Return all plugins except vcs plugins."""
@@ -81,11 +84,22 @@ class PluginManager:
         """
         Identify plugin that is responsible for an artifact.
 
+        :param plugins: Plugins in the order of their priority
         :param artifact_path: Absolute path to the artifact
         :return: Responsible plugin or None if there is no such plugin
         """
-        for plugin in plugins:
-            if plugin.is_responsible(artifact_path):
-                return plugin
+        return PluginManager.get_router(plugins).route(artifact_path)
 
-        return None
+    @staticmethod
+    def get_router(plugins: List[Plugin]) -> PluginRouter:
+        """
+        Return the routing index for a list of plugins.
+
+        :param plugins: Plugins in the order of their priority
+        :return: Routing index, built once per list of plugins
+        """
+        router = PluginManager.routers.get(id(plugins))
+        if router is None or router.plugins != plugins:
+            router = PluginRouter(plugins)
+            PluginManager.routers[id(plugins)] = router
+        return router
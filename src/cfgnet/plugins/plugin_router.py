@@ -0,0 +1,158 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import re
+
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from cfgnet.plugins.plugin import Plugin
+
+
+class PluginRouter:
+    """
+    Routing index that resolves the responsible plugin of a file.
+
+    The file names, suffixes and path patterns declared by the plugins are
+    compiled into a dict of base names, a trie of reversed path suffixes and
+    a single regular expression.  Like a linear scan over the plugins, the
+    first responsible plugin in the given order is returned.  Plugins that
+    override `is_responsible` cannot be indexed and are asked directly.
+    """
+
+    def __init__(self, plugins: List[Plugin]) -> None:
+        self.plugins: List[Plugin] = list(plugins)
+        self.file_names: Dict[str, List[int]] = {}
+        self.suffix_trie: Dict[str, Any] = {}
+        self.pattern: Optional[Pattern] = None
+        self.patterns: List[Tuple[int, str, Pattern]] = []
+        self.custom_plugins: List[int] = []
+
+        for index, plugin in enumerate(self.plugins):
+            if type(plugin).is_responsible is not Plugin.is_responsible:
+                self.custom_plugins.append(index)
+                continue
+
+            for file_name in plugin.file_names:
+                self.file_names.setdefault(file_name, []).append(index)
+
+            for suffix in plugin.file_suffixes:
+                self._insert_suffix(suffix, index)
+
+            for pattern in plugin.file_patterns:
+                self.patterns.append((index, pattern, re.compile(pattern)))
+
+        if self.patterns:
+            # most files match none of the patterns, which a single search
+            # of the combined expression rules out
+            self.pattern = re.compile(
+                "|".join(f"(?:{pattern})" for _, pattern, _ in self.patterns)
+            )
+
+    def route(self, abs_file_path: str) -> Optional[Plugin]:
+        """
+        Find the responsible plugin of a file.
+
+        :param abs_file_path: Absolute path to the file
+        :return: Responsible plugin or None if there is no such plugin
+        """
+        best = self._find_best_candidate(abs_file_path)
+
+        for index in self.custom_plugins:
+            if index > best:
+                break
+            if self.plugins[index].is_responsible(abs_file_path):
+                return self.plugins[index]
+
+        if best < len(self.plugins):
+            return self.plugins[best]
+
+        return None
+
+    def explain(self, abs_file_path: str) -> List[Tuple[Plugin, str]]:
+        """
+        Collect all plugins claiming a file together with the matched rule.
+
+        :param abs_file_path: Absolute path to the file
+        :return: Plugins and rules ordered by priority, the first one wins
+        """
+        rules: List[Tuple[int, str]] = []
+
+        file_name = os.path.basename(abs_file_path)
+        for index in self.file_names.get(file_name, []):
+            rules.append((index, f"file name '{file_name}'"))
+
+        for index, suffix in self._match_suffixes(abs_file_path):
+            rules.append((index, f"suffix '{suffix}'"))
+
+        for index, pattern in self._match_patterns(abs_file_path):
+            rules.append((index, f"pattern '{pattern}'"))
+
+        for index in self.custom_plugins:
+            if self.plugins[index].is_responsible(abs_file_path):
+                rules.append((index, "is_responsible"))
+
+        return [
+            (self.plugins[index], rule)
+            for index, rule in sorted(rules, key=lambda x: x[0])
+        ]
+
+    def _find_best_candidate(self, abs_file_path: str) -> int:
+        """Return the first indexed plugin that claims the file."""
+        best = len(self.plugins)
+
+        # indices are inserted in ascending order
+        file_name_matches = self.file_names.get(
+            os.path.basename(abs_file_path)
+        )
+        if file_name_matches:
+            best = file_name_matches[0]
+
+        for index, _ in self._match_suffixes(abs_file_path):
+            if index < best:
+                best = index
+
+        for index, _ in self._match_patterns(abs_file_path):
+            if index < best:
+                best = index
+
+        return best
+
+    def _insert_suffix(self, suffix: str, index: int) -> None:
+        node = self.suffix_trie
+        for char in reversed(suffix):
+            node = node.setdefault(char, {})
+        node.setdefault("", []).append((index, suffix))
+
+    def _match_suffixes(self, abs_file_path: str) -> List[Tuple[int, str]]:
+        """Walk the suffix trie along the path from its end."""
+        matches = []
+        node = self.suffix_trie
+        for char in reversed(abs_file_path):
+            node = node.get(char)
+            if node is None:
+                break
+            matches.extend(node.get("", []))
+
+        return matches
+
+    def _match_patterns(self, abs_file_path: str) -> List[Tuple[int, str]]:
+        if self.pattern is None or not self.pattern.search(abs_file_path):
+            return []
+
+        return [
+            (index, pattern)
+            for index, pattern, regex in self.patterns
+            if regex.search(abs_file_path)
+        ]
@@ -0,0 +1,289 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import time
+import cProfile
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass()
+class PhaseStats:
+    """Resources used by a phase, summed over all of its runs."""
+
+    calls: int = 0
+    # time spent in nested phases is not included
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    # peak of traced memory while the phase was running, in bytes
+    peak_memory: int = 0
+
+
+@dataclass()
+class PluginStats:
+    """Files parsed by a plugin."""
+
+    files: int = 0
+    bytes_read: int = 0
+    nodes: int = 0
+
+
+@dataclass()
+class _Frame:
+    name: str
+    wall_start: float
+    cpu_start: float
+    # time of nested phases, subtracted from the time of this phase
+    nested_wall: float = 0.0
+    nested_cpu: float = 0.0
+    peak_memory: int = 0
+    profile: Optional[cProfile.Profile] = None
+
+
+class Profiler:
+    """
+    Static class recording the resources used by the phases of a command.
+
+    Phases can be nested, a phase only accounts for the time that is not
+    spent in its nested phases.  Profiling is disabled by default, so
+    phases only cost a function call unless a command runs with
+    `--profile`.  Work done by worker processes is accounted to the phase
+    that waits for the workers.
+    """
+
+    enabled: bool = False
+    cprofile: bool = False
+    phases: Dict[str, PhaseStats] = {}
+    plugins: Dict[str, PluginStats] = {}
+    _stack: List[_Frame] = []
+    _profiles: Dict[str, cProfile.Profile] = {}
+    _started_tracemalloc: bool = False
+
+    @staticmethod
+    def enable(cprofile: bool = False) -> None:
+        """
+        Start recording.
+
+        :param cprofile: Also run cProfile for each phase
+        """
+        Profiler.reset()
+        Profiler.enabled = True
+        Profiler.cprofile = cprofile
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            Profiler._started_tracemalloc = True
+
+    @staticmethod
+    def disable() -> None:
+        """Stop recording, recorded results are kept until reset."""
+        Profiler.enabled = False
+        if Profiler._started_tracemalloc:
+            tracemalloc.stop()
+            Profiler._started_tracemalloc = False
+
+    @staticmethod
+    def reset() -> None:
+        Profiler.phases = {}
+        Profiler.plugins = {}
+        Profiler._stack = []
+        Profiler._profiles = {}
+
+    @staticmethod
+    @contextmanager
+    def phase(name: str) -> Iterator[None]:
+        """
+        Record the resources used by a phase.
+
+        :param name: name of the phase, runs of the same phase are summed
+        """
+        if not Profiler.enabled:
+            yield
+            return
+
+        Profiler._enter(name)
+        try:
+            yield
+        finally:
+            Profiler._exit()
+
+    @staticmethod
+    def iterate(name: str, iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Record the resources used to produce the items of an iterable.
+
+        Lazy iterables such as the files streamed from git are consumed
+        by other phases, so only the time spent in `next` is accounted to
+        the phase of the iterable.
+
+        :param name: name of the phase
+        :param iterable: iterable to be wrapped
+        :return: iterator over the items of the iterable
+        """
+        if not Profiler.enabled:
+            yield from iterable
+            return
+
+        iterator = iter(iterable)
+        while True:
+            Profiler._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                Profiler._exit()
+            yield item
+
+    @staticmethod
+    def record_artifact(plugin: str, bytes_read: int, nodes: int) -> None:
+        """
+        Record a file parsed by a plugin.
+
+        :param plugin: concept name of the plugin
+        :param bytes_read: size of the parsed file
+        :param nodes: number of nodes of the artifact
+        """
+        stats = Profiler.plugins.setdefault(plugin, PluginStats())
+        stats.files += 1
+        stats.bytes_read += bytes_read
+        stats.nodes += nodes
+
+    @staticmethod
+    def to_dict() -> Dict[str, Any]:
+        return {
+            "phases": {
+                name: asdict(stats) for name, stats in Profiler.phases.items()
+            },
+            "plugins": {
+                name: asdict(stats)
+                for name, stats in sorted(Profiler.plugins.items())
+            },
+        }
+
+    @staticmethod
+    def write(data_dir: str) -> str:
+        """
+        Write the recorded results and cProfile dumps.
+
+        Dumps are written to `profile/<phase>.prof` and can be inspected
+        with `pstats` or `snakeviz`.
+
+        :param data_dir: data directory of the project
+        :return: path of the written JSON file
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        profile_path = os.path.join(data_dir, "profile.json")
+        with open(profile_path, "w", encoding="utf-8") as profile_file:
+            json.dump(Profiler.to_dict(), profile_file, indent=2)
+
+        if Profiler._profiles:
+            cprofile_dir = os.path.join(data_dir, "profile")
+            os.makedirs(cprofile_dir, exist_ok=True)
+            for name, profile in Profiler._profiles.items():
+                profile.dump_stats(os.path.join(cprofile_dir, f"{name}.prof"))
+
+        return profile_path
+
+    @staticmethod
+    def summary() -> str:
+        """Return a table of the recorded phases and plugins."""
+        lines = [
+            f"{'Phase':<24} {'Calls':>7} {'Wall [s]':>10} {'CPU [s]':>10} "
+            f"{'Peak [MiB]':>11}"
+        ]
+        for name, stats in Profiler.phases.items():
+            lines.append(
+                f"{name:<24} {stats.calls:>7} {stats.wall_time:>10.3f} "
+                f"{stats.cpu_time:>10.3f} "
+                f"{stats.peak_memory / 2**20:>11.2f}"
+            )
+
+        if Profiler.plugins:
+            lines.append("")
+            lines.append(
+                f"{'Plugin':<24} {'Files':>7} {'Bytes':>12} {'Nodes':>10}"
+            )
+            for name, plugin in sorted(Profiler.plugins.items()):
+                lines.append(
+                    f"{name:<24} {plugin.files:>7} "
+                    f"{plugin.bytes_read:>12} {plugin.nodes:>10}"
+                )
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _enter(name: str) -> None:
+        if Profiler._stack:
+            parent = Profiler._stack[-1]
+            if parent.profile is not None:
+                parent.profile.disable()
+            # the peak of the parent phase is kept before the peak is reset
+            parent.peak_memory = max(
+                parent.peak_memory, tracemalloc.get_traced_memory()[1]
+            )
+        Profiler._reset_peak_memory()
+
+        frame = _Frame(
+            name=name,
+            wall_start=time.perf_counter(),
+            cpu_start=time.process_time(),
+        )
+        if Profiler.cprofile:
+            frame.profile = Profiler._profiles.setdefault(
+                name, cProfile.Profile()
+            )
+            frame.profile.enable()
+        Profiler._stack.append(frame)
+
+    @staticmethod
+    def _reset_peak_memory() -> None:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            # Python 3.8 cannot reset the peak alone, clearing the traces
+            # resets it but only accounts for memory allocated afterwards
+            tracemalloc.clear_traces()
+
+    @staticmethod
+    def _exit() -> None:
+        frame = Profiler._stack.pop()
+        if frame.profile is not None:
+            frame.profile.disable()
+
+        wall_time = time.perf_counter() - frame.wall_start
+        cpu_time = time.process_time() - frame.cpu_start
+        peak_memory = max(
+            frame.peak_memory, tracemalloc.get_traced_memory()[1]
+        )
+
+        stats = Profiler.phases.setdefault(frame.name, PhaseStats())
+        stats.calls += 1
+        stats.wall_time += wall_time - frame.nested_wall
+        stats.cpu_time += cpu_time - frame.nested_cpu
+        stats.peak_memory = max(stats.peak_memory, peak_memory)
+
+        if Profiler._stack:
+            parent = Profiler._stack[-1]
+            parent.nested_wall += wall_time
+            parent.nested_cpu += cpu_time
+            # memory allocated in a nested phase counts for the parent, too
+            parent.peak_memory = max(parent.peak_memory, peak_memory)
+            if parent.profile is not None:
+                parent.profile.enable()
@@ -0,0 +1,83 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import shutil
+
+from typing import Dict
+from cfgnet.vcs.git import Git
+
+
+class BlobReader:
+    """
+    Provide the files of commits without checking them out.
+
+    Blobs are read from the object database and written below the
+    untracked `.cfgnet/blobs` directory, so that plugins parse them like
+    any other file and the tracked files are never touched.  A file is only
+    written again when its blob changes between commits.
+    """
+
+    def __init__(self, git: Git, blob_dir: str) -> None:
+        self.git: Git = git
+        self.blob_dir: str = blob_dir
+        # blob hashes of the files currently written to the blob directory
+        self.written: Dict[str, str] = {}
+
+    def get_files(self, commit: str) -> Dict[str, str]:
+        """
+        List the files of a commit.
+
+        :param commit: hash of the commit
+        :return: blob hashes by relative paths of the files
+        """
+        return self.git.get_commit_files(commit)
+
+    def materialize(self, files: Dict[str, str]) -> Dict[str, str]:
+        """
+        Write files into the blob directory.
+
+        Files written for a previous call that are not part of the given
+        files are removed.
+
+        :param files: blob hashes by relative paths of the files
+        :return: paths in the blob directory by relative paths of the files
+        """
+        for file in set(self.written).difference(files):
+            self._remove(file)
+
+        paths: Dict[str, str] = {}
+        for file, blob_hash in files.items():
+            path = os.path.join(self.blob_dir, file)
+            if self.written.get(file) != blob_hash:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as blob_file:
+                    blob_file.write(self.git.read_blob(blob_hash))
+                self.written[file] = blob_hash
+            paths[file] = path
+
+        return paths
+
+    def close(self) -> None:
+        """Remove the blob directory."""
+        self.written.clear()
+        shutil.rmtree(self.blob_dir, ignore_errors=True)
+
+    def _remove(self, file: str) -> None:
+        del self.written[file]
+        try:
+            os.remove(os.path.join(self.blob_dir, file))
+        except OSError:
+            pass
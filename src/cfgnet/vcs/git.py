@@ -13,12 +13,15 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
 import logging
+import hashlib
 
-from typing import Optional, Any, List, Union
+from typing import Optional, Any, Dict, Iterator, List, Union
 
 from git.repo import Repo
-from git.exc import InvalidGitRepositoryError
+from gitdb.exc import BadName
+from git.exc import GitCommandError, InvalidGitRepositoryError
 from git.refs.symbolic import SymbolicReference
 from git.objects.commit import Commit
 from git.objects.tree import Tree
@@ -26,6 +29,8 @@ from git.objects.tree import Tree
 
 class Git:
     repo: Repo
+    # data directory of CfgNet, which also holds materialized blobs
+    data_dir: str = ".cfgnet"
 
     def __init__(self, project_root: str) -> None:
         """Initialize the git repository."""
@@ -51,16 +56,153 @@ class Git:
         """Return current commit hash."""
         return self.repo.head.object.hexsha
 
+    def get_commit_hash(self, revision: str) -> str:
+        """
+        Resolve a revision, e.g. a branch name or `HEAD~1`.
+
+        :param revision: revision understood by git
+        :return: hash of the commit
+        :raises ValueError: if the revision does not name a commit
+        """
+        try:
+            return self.repo.commit(revision).hexsha
+        except (BadName, ValueError) as error:
+            raise ValueError(f"Unknown revision {revision}") from error
+
     def get_tracked_files(self) -> List:
         """Return tracked files."""
+        return list(self.iter_tracked_files())
+
+    def iter_tracked_files(self) -> Iterator[str]:
+        """
+        Stream the paths of tracked files.
+
+        Paths are read from the git index, which also contains staged files
+        that have not been committed yet.  If git cannot list the index,
+        the tree of HEAD is walked instead.  Files in the data directory
+        of CfgNet are skipped, even if they have been committed.
+
+        :return: relative paths of tracked files
+        """
+        streamed = False
+        try:
+            for file in self.iter_index_files():
+                streamed = True
+                if not Git._is_data_file(file):
+                    yield file
+        except (GitCommandError, OSError) as error:
+            if streamed:
+                raise
+            logging.debug("Cannot list git index, walk HEAD: %s", error)
+            for file in self.iter_tree_files():
+                if not Git._is_data_file(file):
+                    yield file
+
+    @staticmethod
+    def _is_data_file(file: str) -> bool:
+        return file.split("/", 1)[0] == Git.data_dir
+
+    def iter_index_files(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """
+        Stream the paths of files in the git index using `git ls-files`.
+
+        :param chunk_size: number of bytes read from git at once
+        :return: relative paths of files in the index
+        """
+        process = self.repo.git.ls_files("-z", as_process=True)
+
+        rest = b""
+        for chunk in iter(lambda: process.stdout.read(chunk_size), b""):
+            paths = (rest + chunk).split(b"\0")
+            rest = paths.pop()
+            for path in paths:
+                yield os.fsdecode(path)
+
+        process.wait()
+
+    def iter_tree_files(self) -> Iterator[str]:
+        """
+        Walk the tree of HEAD using GitPython objects.
+
+        :return: relative paths of files committed in HEAD
+        """
         tree = self.repo.tree()
 
         files: List[Any] = []
 
         self._iter_tree([tree], files)
 
+        return iter(files)
+
+    def get_changed_files_between(
+        self, commit_a: str, commit_b: str
+    ) -> List[str]:
+        """
+        Return files that differ between the trees of two commits.
+
+        Renamed files are reported with their old and new path.
+
+        :param commit_a: first commit
+        :param commit_b: second commit
+        :return: relative paths of changed files
+        """
+        output = self.repo.git.diff_tree(
+            "-r", "--name-only", "--no-renames", "-z", commit_a, commit_b
+        )
+        return [file for file in output.split("\0") if file]
+
+    def get_commit_files(self, commit: str) -> Dict[str, str]:
+        """
+        List the files committed in a commit without checking it out.
+
+        Submodules are skipped, because their content is not part of the
+        object database of the repository.
+
+        :param commit: commit whose tree is listed
+        :return: blob hashes by relative paths of the files
+        """
+        output = self.repo.git.ls_tree("-r", "-z", "--full-tree", commit)
+
+        files: Dict[str, str] = {}
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            info, path = entry.split("\t", 1)
+            _, object_type, blob_hash = info.split(" ")
+            if object_type == "blob":
+                files[path] = blob_hash
+
         return files
 
+    def read_blob(self, blob_hash: str) -> bytes:
+        """
+        Read the content of a blob from the object database.
+
+        GitPython keeps a single `git cat-file --batch` process for all
+        reads of a repository.
+
+        :param blob_hash: hash of the blob
+        :return: content of the blob
+        """
+        return self.repo.git.get_object_data(blob_hash)[3]
+
+    @staticmethod
+    def get_blob_hash(file_path: str) -> Optional[str]:
+        """
+        Return the git blob hash of a file in the working tree.
+
+        :param file_path: path to the file
+        :return: hash as computed by `git hash-object` or None if unreadable
+        """
+        try:
+            with open(file_path, "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+
+        header = f"blob {len(content)}\0".encode()
+        return hashlib.sha1(header + content).hexdigest()
+
     def checkout(self, commit: Union[Commit, SymbolicReference]) -> None:
         """Go to a specific commit."""
         self.repo.git.checkout(commit)
@@ -13,7 +13,9 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List
+import itertools
+
+from typing import Any, Iterable, Iterator, List, Optional
 
 from git.repo import Repo
 from git.objects.commit import Commit
@@ -21,31 +23,174 @@ from cfgnet.vcs.git import Git
 
 
 class GitHistory:
+    """
+    Commits of the first branch, streamed from the oldest to the newest.
+
+    Commits are read from the output of `git rev-list --reverse` while
+    they are analyzed, so the history is never held in memory.
+    """
+
     repo: Repo
-    commits: List[Commit]
     commit_index: int
+    # check out each commit, otherwise commits are only iterated
+    checkout: bool
+
+    def __init__(
+        self,
+        git: Git,
+        checkout: bool = True,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        max_commits: Optional[int] = None,
+        first_parent: bool = False,
+    ):
+        """
+        Initialize the history.
 
-    def __init__(self, git: Git):
+        :param git: git repository
+        :param checkout: Check out each commit
+        :param since: Only commits more recent than this date
+        :param until: Only commits older than this date
+        :param max_commits: Stop after this number of commits, starting
+            with the oldest one
+        :param first_parent: Only follow the first parent of merge commits
+        """
         self.repo = git.repo
-        self.commits = list(self.repo.iter_commits(rev=self.repo.heads[0]))
-        self.commits.reverse()
-        self.commit_index = len(self.commits) - 1
+        self.checkout = checkout
+        self.since: Optional[str] = since
+        self.until: Optional[str] = until
+        self.max_commits: Optional[int] = max_commits
+        self.first_parent: bool = first_parent
+        self.commit_index = -1
+
+        self._hashes: Optional[Iterator[str]] = None
+        self._next_hash: Optional[str] = None
+
+    def iter_commit_hashes(self) -> Iterator[str]:
+        """
+        Stream the hashes of the commits from the oldest to the newest.
+
+        :return: commit hashes
+        :raises GitCommandError: if a date is invalid or git fails
+        """
+        args: List[str] = ["--reverse"]
+        if self.since:
+            self._check_date(self.since)
+            args.append(f"--since={self.since}")
+        if self.until:
+            self._check_date(self.until)
+            args.append(f"--until={self.until}")
+        if self.first_parent:
+            args.append("--first-parent")
+        args.append(self.repo.heads[0].name)
+
+        process = self.repo.git.rev_list(*args, as_process=True)
+        lines: Iterable[bytes] = process.stdout
+        # `--max-count` would be applied before reversing and keep the
+        # newest commits
+        if self.max_commits is not None:
+            lines = itertools.islice(lines, self.max_commits)
+
+        count = 0
+        finished = False
+        try:
+            for line in lines:
+                count += 1
+                yield line.strip().decode()
+            # git is still running if the history has more commits
+            finished = self.max_commits is None or count < self.max_commits
+        finally:
+            if finished:
+                # raises if git failed, e.g. for an unknown branch
+                process.wait()
+            else:
+                GitHistory._kill(process)
+
+    def _check_date(self, date: str) -> None:
+        """
+        Check that git can parse a date.
+
+        `rev-list` treats dates it cannot parse as the current time, so
+        an invalid date would silently select no commits.
+
+        :param date: value of `since` or `until`
+        :raises GitCommandError: if the date is invalid
+        """
+        self.repo.git.execute(
+            [
+                "git",
+                "-c",
+                f"cfgnet.date={date}",
+                "config",
+                "--type=expiry-date",
+                "cfgnet.date",
+            ]
+        )
+
+    @staticmethod
+    def _kill(process: Any) -> None:
+        """Stop a git process whose output is no longer read."""
+        proc = process.proc
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        for stream in (proc.stdout, proc.stderr):
+            if stream is not None:
+                stream.close()
 
     def restore_initial_commit(self) -> Commit:
-        initial_commit = self.commits[0]
-        if len(self.commits) > 0:
+        initial_commit = self._advance()
+        if self.checkout:
             self.repo.git.checkout(initial_commit)
-            self.commit_index = 0
 
         return initial_commit
 
+    def restore_commit(self, commit_hash: str) -> Commit:
+        """
+        Continue the history at a commit without visiting earlier commits.
+
+        :param commit_hash: hash of the commit
+        :return: the commit
+        """
+        self._start()
+        while self._next_hash is not None and self._next_hash != commit_hash:
+            self._next_hash = next(self._hashes, None)  # type: ignore
+            self.commit_index += 1
+
+        if self._next_hash is None:
+            raise IndexError(f"Commit {commit_hash} is not in the history")
+
+        commit = self._advance()
+        if self.checkout:
+            self.repo.git.checkout(commit, force=True)
+
+        return commit
+
     def has_next_commit(self) -> bool:
-        return self.commit_index < len(self.commits) - 1
+        self._start()
+        return self._next_hash is not None
 
     def next_commit(self) -> Commit:
-        self.commit_index += 1
-
-        next_commit: Commit = self.commits[self.commit_index]
-        self.repo.git.checkout(next_commit, force=True)
+        next_commit = self._advance()
+        if self.checkout:
+            self.repo.git.checkout(next_commit, force=True)
 
         return next_commit
+
+    def _start(self) -> None:
+        if self._hashes is None:
+            self._hashes = self.iter_commit_hashes()
+            self._next_hash = next(self._hashes, None)
+
+    def _advance(self) -> Commit:
+        self._start()
+        if self._next_hash is None:
+            raise IndexError("No more commits in the history")
+
+        commit = self.repo.commit(self._next_hash)
+        self._next_hash = next(self._hashes, None)  # type: ignore
+        self.commit_index += 1
+
+        return commit
@@ -15,10 +15,12 @@
 
 import os
 import csv
+import json
 import pytest
 
 from cfgnet.network.network_configuration import NetworkConfiguration
-from cfgnet.analyze.analyzer import Analyzer
+from cfgnet.analyze.analyzer import Analyzer, split_commits, validate_commit
+from cfgnet.analyze.checkpoint import Checkpoint, CheckpointState
 
 
 from tests.utility.temporary_repository import TemporaryRepository
@@ -98,3 +100,282 @@ def test_analyze_all_conflicts(get_config_all_conflicts):
         rows = list(reader)
 
         assert len(rows) == 4
+
+
+def test_analyze_without_checkout(get_repo, get_config):
+    project_name = get_config.project_name()
+    conflicts_csv_path = os.path.join(
+        get_config.project_root_abs,
+        get_config.cfgnet_path_rel,
+        "analysis",
+        f"conflicts_{project_name}.csv",
+    )
+    head = get_repo.repo.head.commit.hexsha
+
+    Analyzer(get_config, checkout=False).analyze_commit_history()
+
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        rows = list(csv.DictReader(csv_stats_file))
+
+    assert get_repo.repo.head.commit.hexsha == head
+    assert not get_repo.repo.is_dirty()
+    assert not os.path.exists(get_config.blob_dir_path())
+
+    Analyzer(get_config).analyze_commit_history()
+
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        checkout_rows = list(csv.DictReader(csv_stats_file))
+
+    def key(row):
+        return row["conflict_id"], row["occurred_at"]
+
+    assert len(rows) == 3
+    assert sorted(rows, key=key) == sorted(checkout_rows, key=key)
+
+
+@pytest.mark.parametrize("workers", [2, 5])
+def test_analyze_with_workers(get_repo, get_config, workers):
+    project_name = get_config.project_name()
+    conflicts_csv_path = os.path.join(
+        get_config.project_root_abs,
+        get_config.cfgnet_path_rel,
+        "analysis",
+        f"conflicts_{project_name}.csv",
+    )
+    head = get_repo.repo.head.commit.hexsha
+
+    Analyzer(get_config).analyze_commit_history()
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        serial_csv = csv_stats_file.read()
+
+    Analyzer(get_config, workers=workers).analyze_commit_history()
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        sharded_csv = csv_stats_file.read()
+
+    assert get_repo.repo.head.commit.hexsha == head
+    assert not os.path.exists(get_config.blob_dir_path())
+    assert len(serial_csv.splitlines()) == 4
+    assert sharded_csv == serial_csv
+
+
+@pytest.mark.parametrize(
+    "num_commits,workers,expected",
+    [
+        (0, 4, []),
+        (1, 4, []),
+        (3, 4, [(1, 2), (2, 3)]),
+        (8, 3, [(1, 4), (4, 6), (6, 8)]),
+    ],
+)
+def test_split_commits(num_commits, workers, expected):
+    assert split_commits(num_commits, workers) == expected
+
+
+def commit_readme(repo: TemporaryRepository, text: str) -> None:
+    with open(
+        os.path.join(repo.root, "README.md"), "w", encoding="utf-8"
+    ) as readme:
+        readme.write(text)
+    repo.repo.git.add("README.md")
+    repo.repo.git.commit("-m", text)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_skip_commits_without_config_changes(workers):
+    repo = TemporaryRepository(
+        "tests/test_repos/port_db_repo/0001-Init-port-database-repo.patch"
+    )
+    commit_readme(repo, "Add readme")
+    repo.apply_patch(
+        "tests/test_repos/port_db_repo/0002-Change-port-and-db-credentials.patch"
+    )
+    repo.apply_patch(
+        "tests/test_repos/port_db_repo/0003-Remove-port-in-Dockerfile.patch"
+    )
+    commit_readme(repo, "Update readme")
+
+    config = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    analyzer = Analyzer(config, workers=workers)
+    analyzer.analyze_commit_history()
+
+    conflicts_csv_path = os.path.join(
+        config.project_root_abs,
+        config.cfgnet_path_rel,
+        "analysis",
+        f"conflicts_{config.project_name()}.csv",
+    )
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        rows = list(csv.DictReader(csv_stats_file))
+
+    assert analyzer.visited_commits == 5
+    assert analyzer.skipped_commits == 2
+    assert len(rows) == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_resume_analysis(monkeypatch, get_repo, get_config, workers):
+    conflicts_csv_path = os.path.join(
+        get_config.project_root_abs,
+        get_config.cfgnet_path_rel,
+        "analysis",
+        f"conflicts_{get_config.project_name()}.csv",
+    )
+    head = get_repo.repo.head.commit.hexsha
+
+    analyzer = Analyzer(get_config)
+    analyzer.analyze_commit_history()
+    expected_changes = analyzer.deltas.query()
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        expected_csv = csv_stats_file.read()
+
+    calls = []
+
+    def crash_at_second_commit(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("Killed")
+        return validate_commit(*args)
+
+    monkeypatch.setattr(
+        "cfgnet.analyze.analyzer.validate_commit", crash_at_second_commit
+    )
+    analyzer = Analyzer(get_config, checkpoint_interval=1)
+    with pytest.raises(RuntimeError):
+        analyzer.analyze_commit_history()
+    monkeypatch.undo()
+
+    assert analyzer.checkpoint.exists()
+    assert analyzer.checkpoint.load().commit_index == 1
+
+    analyzer = Analyzer(get_config, workers=workers, resume=True)
+    analyzer.analyze_commit_history()
+    with open(conflicts_csv_path, "r", encoding="utf-8") as csv_stats_file:
+        resumed_csv = csv_stats_file.read()
+
+    assert get_repo.repo.head.commit.hexsha == head
+    assert analyzer.visited_commits == 3
+    assert not analyzer.checkpoint.exists()
+    assert resumed_csv == expected_csv
+    assert analyzer.deltas.query() == expected_changes
+
+
+def test_resume_checkpoint_of_workers(monkeypatch, get_repo, get_config):
+    branch = get_repo.repo.active_branch.name
+    head = get_repo.repo.head.commit.hexsha
+
+    # keep the checkpoint of the last range
+    monkeypatch.setattr(Checkpoint, "remove", lambda self: None)
+    analyzer = Analyzer(get_config, workers=2, checkpoint_interval=1)
+    analyzer.analyze_commit_history()
+    monkeypatch.undo()
+
+    analyzer = Analyzer(get_config, resume=True)
+    analyzer.analyze_commit_history()
+
+    assert not get_repo.repo.head.is_detached
+    assert get_repo.repo.active_branch.name == branch
+    assert get_repo.repo.head.commit.hexsha == head
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_analyze_empty_date_window(get_repo, get_config, workers):
+    head = get_repo.repo.head.commit.hexsha
+    analyzer = Analyzer(
+        get_config, checkout=False, workers=workers, since="2090-01-01"
+    )
+
+    analyzer.analyze_commit_history()
+
+    assert analyzer.visited_commits == 0
+    assert get_repo.repo.head.commit.hexsha == head
+    assert not os.path.exists(get_config.blob_dir_path())
+
+
+def test_resume_with_other_options(get_config):
+    analyzer = Analyzer(get_config, max_commits=2)
+    analyzer.checkpoint.save(
+        CheckpointState(
+            commit="0" * 40,
+            commit_index=1,
+            skipped_commits=0,
+            options=analyzer._resume_options(),
+        )
+    )
+
+    with pytest.raises(SystemExit):
+        Analyzer(get_config, resume=True).analyze_commit_history()
+
+
+def test_analyze_json_lines(get_config):
+    analyzer = Analyzer(get_config, output_format="jsonl")
+
+    analyzer.analyze_commit_history()
+
+    with open(analyzer.conflicts_path, "r", encoding="utf-8") as jsonl_file:
+        rows = [json.loads(line) for line in jsonl_file]
+
+    assert analyzer.conflicts_path.endswith(".jsonl")
+    assert len(rows) == 3
+    assert len({row["conflict_id"] for row in rows}) == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_delta_store(get_config, workers):
+    analyzer = Analyzer(get_config, workers=workers)
+
+    analyzer.analyze_commit_history()
+    changes = analyzer.deltas.query(option="server.port")
+
+    assert [(x.commit_index, x.change) for x in changes] == [
+        (1, "modified"),
+        (0, "added"),
+    ]
+    assert changes[0].old_values == ["8888"]
+    assert changes[0].new_values == ["8000"]
+    assert changes[0].artifact == "application.properties"
+    assert len(analyzer.deltas.query(artifact="docker-compose.yml")) > 1
+    assert analyzer.deltas.query(option="server.*", limit=1) == changes[:1]
+
+
+def test_delta_store_dotted_option(get_config):
+    analyzer = Analyzer(get_config)
+
+    analyzer.analyze_commit_history()
+    option = "services::docker-mysql::environment::MYSQL_USER"
+    changes = analyzer.deltas.query(option=option)
+
+    assert [(x.commit_index, x.change) for x in changes] == [
+        (1, "modified"),
+        (0, "added"),
+    ]
+    assert analyzer.deltas.query(option=option.replace("::", ".")) == changes
+    assert analyzer.deltas.query(option="services.docker-mysql.*USER") == (
+        changes
+    )
+    # options with dots are found as they are
+    assert analyzer.deltas.query(option="server.port")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_delta_store_single_commit(workers):
+    repo = TemporaryRepository(
+        "tests/test_repos/port_db_repo/0001-Init-port-database-repo.patch"
+    )
+    config = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    analyzer = Analyzer(config, workers=workers)
+
+    analyzer.analyze_commit_history()
+    changes = analyzer.deltas.query(option="server.port")
+
+    assert analyzer.visited_commits == 1
+    assert [(x.commit_index, x.change) for x in changes] == [(0, "added")]
@@ -0,0 +1,75 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import os
+import pickle
+import pytest
+
+from cfgnet.analyze.checkpoint import Checkpoint, CheckpointState
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
+
+
+@pytest.fixture(name="get_checkpoint")
+def get_checkpoint_(tmp_path):
+    return Checkpoint(os.path.join(tmp_path, "checkpoint.pickle"))
+
+
+def create_state(commit: str) -> CheckpointState:
+    return CheckpointState(
+        commit=commit,
+        commit_index=1,
+        skipped_commits=0,
+        conflict_ids={"id"},
+        output_offset=42,
+    )
+
+
+def test_save_and_load(get_checkpoint):
+    assert get_checkpoint.load() is None
+
+    get_checkpoint.save(create_state("a"))
+    state = get_checkpoint.load()
+
+    assert state.commit == "a"
+    assert state.conflict_ids == {"id"}
+    assert state.output_offset == 42
+
+    get_checkpoint.remove()
+
+    assert not get_checkpoint.exists()
+
+
+def test_crash_while_saving(monkeypatch, get_checkpoint):
+    get_checkpoint.save(create_state("a"))
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pickle, "dump", crash)
+    with pytest.raises(KeyboardInterrupt):
+        get_checkpoint.save(create_state("b"))
+    monkeypatch.undo()
+
+    assert get_checkpoint.load().commit == "a"
+    assert os.listdir(os.path.dirname(get_checkpoint.path)) == [
+        "checkpoint.pickle"
+    ]
+
+
+def test_other_version(monkeypatch, get_checkpoint):
+    get_checkpoint.save(create_state("a"))
+    monkeypatch.setattr(Checkpoint, "version", Checkpoint.version + 1)
+
+    with pytest.raises(InvalidNetworkStateException):
+        get_checkpoint.load()
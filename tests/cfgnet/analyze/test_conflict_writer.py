@@ -0,0 +1,90 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import csv
+import json
+import os
+import pytest
+
+from cfgnet.analyze.conflict_writer import ConflictWriter
+
+
+def create_row(conflict_id: str):
+    return {
+        "occurred_at": "abc",
+        "conflict_type": "ModifiedOptionConflict",
+        "conflict_id": conflict_id,
+        "link": "a <-> b",
+        "config_types": "UNKNOWN<->UNKNOWN",
+    }
+
+
+@pytest.mark.parametrize("output_format", ["csv", "jsonl"])
+def test_skip_written_conflicts(tmp_path, output_format):
+    path = os.path.join(tmp_path, f"conflicts.{output_format}")
+    writer = ConflictWriter(path, output_format)
+    writer.open()
+
+    assert writer.write_rows([("a", create_row("a"))]) == 1
+    rows = [("a", create_row("a")), ("b", create_row("b"))]
+    assert writer.write_rows(rows) == 1
+
+    writer.close()
+
+    with open(path, "r", encoding="utf-8") as output_file:
+        if output_format == "csv":
+            rows = list(csv.DictReader(output_file))
+        else:
+            rows = [json.loads(line) for line in output_file]
+
+    assert rows == [create_row("a"), create_row("b")]
+
+
+def test_flush_interval(tmp_path):
+    path = os.path.join(tmp_path, "conflicts.jsonl")
+    writer = ConflictWriter(path, "jsonl", flush_interval=3600)
+    writer.open()
+
+    writer.write_rows([("a", create_row("a"))])
+    buffered_size = os.path.getsize(path)
+    writer.flush()
+
+    assert buffered_size == 0
+    assert os.path.getsize(path) > 0
+
+    writer.close()
+
+
+def test_continue_at_offset(tmp_path):
+    path = os.path.join(tmp_path, "conflicts.csv")
+    writer = ConflictWriter(path)
+    writer.open()
+    writer.write_rows([("a", create_row("a"))])
+    offset = writer.tell()
+    writer.write_rows([("b", create_row("b"))])
+    writer.close()
+
+    writer.open(offset, {"a"})
+    writer.write_rows([("a", create_row("a")), ("c", create_row("c"))])
+    writer.close()
+
+    with open(path, "r", encoding="utf-8") as output_file:
+        rows = list(csv.DictReader(output_file))
+
+    assert rows == [create_row("a"), create_row("c")]
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        ConflictWriter(os.path.join(tmp_path, "conflicts.xml"), "xml")
@@ -64,3 +64,44 @@ def test_version_number():
 
     assert ConfigTypeInferer.get_config_type("version", version) == ConfigType.VERSION_NUMBER
     assert ConfigTypeInferer.get_config_type("version_snapshot", version_snapshot) == ConfigType.VERSION_NUMBER
+
+
+def test_get_config_types():
+    pairs = [
+        ("port", "8080"),
+        ("usr", "test"),
+        ("", "-200"),
+        ("port", "8080"),
+        ("test", "true"),
+        ("server_name", "MainServer15"),
+    ]
+
+    config_types = ConfigTypeInferer.get_config_types(pairs)
+
+    assert config_types == [
+        ConfigTypeInferer.get_config_type(option_name, value)
+        for option_name, value in pairs
+    ]
+    assert config_types[:3] == [
+        ConfigType.PORT,
+        ConfigType.USERNAME,
+        ConfigType.UNKNOWN,
+    ]
+
+
+def test_cache():
+    cache_size = ConfigTypeInferer.cache_size
+    ConfigTypeInferer.set_cache_size(2)
+    try:
+        ConfigTypeInferer.get_config_type("port", "8080")
+        ConfigTypeInferer.get_config_type("port", "8080")
+        ConfigTypeInferer.get_config_type("usr", "test")
+        ConfigTypeInferer.get_config_type("password", "test1234")
+
+        info = ConfigTypeInferer.cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 3
+        assert info["entries"] == 2
+        assert info["max_entries"] == 2
+    finally:
+        ConfigTypeInferer.set_cache_size(cache_size)
@@ -22,8 +22,15 @@ from cfgnet.conflicts.conflict import (
     ModifiedOptionConflict,
 )
 from cfgnet.conflicts.conflict_detector import ConflictDetector
+from cfgnet.linker.link import Link
 from cfgnet.network.network import Network
 from cfgnet.network.network import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
 from tests.utility.temporary_repository import TemporaryRepository
 
 
@@ -215,3 +222,58 @@ def test_equally_changed_values(get_networks_equally_changed):
     )
 
     assert len(conflicts) == 0
+
+
+def create_linked_network(values, links, root_dir="/tmp/project"):
+    """Create a network with one option per artifact and link the values."""
+    cfg = NetworkConfiguration(
+        project_root_abs=root_dir,
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    root = ProjectNode(name="project", root_dir=root_dir)
+    network = Network(project_name="project", root=root, cfg=cfg)
+
+    value_nodes = []
+    for index, value in enumerate(values):
+        artifact = ArtifactNode(
+            file_path=f"{root_dir}/config{index}.properties",
+            rel_file_path=f"config{index}.properties",
+            concept_name="test",
+        )
+        option = OptionNode("port", "1")
+        value_node = ValueNode(name=value)
+        artifact.add_child(option)
+        option.add_child(value_node)
+        root.add_child(artifact)
+        value_nodes.append(value_node)
+
+    for index_a, index_b in links:
+        network.links.add(Link(value_nodes[index_a], value_nodes[index_b]))
+
+    return network
+
+
+def test_merge_dependents_of_modified_option():
+    ref_network = create_linked_network(
+        ["8080", "8080", "8080", "9090", "9090"], [(0, 1), (0, 2), (3, 4)]
+    )
+    new_network = create_linked_network(
+        ["8081", "8080", "8080", "9091", "9090"], [(1, 2)]
+    )
+
+    conflicts = ConflictDetector.detect(
+        ref_network=ref_network,
+        new_network=new_network,
+        enable_all_conflicts=False,
+        commit_hash="abc",
+    )
+    conflicts_by_value = {
+        conflict.value.name: conflict for conflict in conflicts
+    }
+
+    assert len(conflicts) == 2
+    assert len(conflicts_by_value["8081"].dependents) == 2
+    assert len(conflicts_by_value["9091"].dependents) == 1
+    assert {conflict.occurred_at for conflict in conflicts} == {"abc"}
@@ -0,0 +1,82 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from cfgnet.constraints.constraint import (
+    BooleanConstraint,
+    FractionConstraint,
+    IpAddressConstraint,
+    NumberConstraint,
+    PortConstraint,
+    TimeConstraint,
+    UserDefConstraint,
+    VersionNumberConstraint,
+)
+
+
+def test_constraints_are_immutable():
+    constraint = PortConstraint()
+
+    with pytest.raises(AttributeError):
+        constraint.value_range = [0, 1024]
+
+
+def test_with_values():
+    constraint = PortConstraint()
+    privileged = constraint.with_values(
+        {"value_range": [0, 1023], "unknown": True}
+    )
+
+    assert constraint.validate_value("8080")
+    assert not privileged.validate_value("8080")
+    assert privileged.validate_value("80")
+    assert isinstance(privileged, PortConstraint)
+
+
+def test_validate_many():
+    constraints_values = [
+        (PortConstraint(), ["80", "8080", "70000", "-1", "http", "80"]),
+        (NumberConstraint(), ["1", "-1", "1.5", "one"]),
+        (BooleanConstraint(), ["true", "False", "yes", "on"]),
+        (TimeConstraint(), ["10s", "10", "1.5h", "soon"]),
+        (VersionNumberConstraint(), ["1.2.3", "^2.0", "latest"]),
+        (IpAddressConstraint(), ["127.0.0.1", "localhost"]),
+        (FractionConstraint(), ["0.5", "1", "half"]),
+    ]
+
+    for constraint, values in constraints_values:
+        assert constraint.validate_many(values) == [
+            constraint.validate_value(value) for value in values
+        ]
+
+
+def test_validate_range():
+    assert PortConstraint().validate_many(["0", "65535", "65536"]) == [
+        True,
+        True,
+        False,
+    ]
+    # decimal numbers are checked against open ranges
+    assert TimeConstraint().validate_value("1.5h")
+    assert FractionConstraint().validate_value("0.5")
+
+
+def test_user_defined_constraint():
+    constraint = UserDefConstraint().with_values(
+        {"sufix": "python", "value_syntax": "^(python)(:)([\\d.]+)$"}
+    )
+
+    assert constraint.validate_many(["python:3.8", "python"]) == [True, False]
@@ -0,0 +1,113 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint_cache import ConstraintCache
+from cfgnet.constraints.constraint_registry import ConstraintRegistry
+
+ROWS = [(ConfigType.PORT, "", "8080"), (ConfigType.PORT, "", "70000")]
+
+
+def test_key():
+    key = ConstraintCache.key("maven", ROWS)
+
+    assert key == ConstraintCache.key("maven", list(ROWS))
+    assert key != ConstraintCache.key("docker", ROWS)
+    assert key != ConstraintCache.key("maven", ROWS[:1])
+    assert key != ConstraintCache.key(
+        "maven", [(ConfigType.COUNT, "", "8080"), ROWS[1]]
+    )
+
+
+def test_save_and_load(tmp_path):
+    cache_path = str(tmp_path / "cache" / "constraints.json")
+    key = ConstraintCache.key("maven", ROWS)
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    assert cache.get(key) is None
+    cache.put(key, [(1, "port")])
+    cache.save()
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    assert cache.get(key) == [(1, "port")]
+    assert cache.get(ConstraintCache.key("docker", ROWS)) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_unused_entries_are_dropped(tmp_path):
+    cache_path = str(tmp_path / "constraints.json")
+    cache = ConstraintCache(cache_path)
+    cache.put("used", [])
+    cache.put("unused", [(0, "port")])
+    cache.save()
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    cache.get("used")
+    cache.save()
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    assert cache.get("used") == []
+    assert cache.get("unused") is None
+
+
+def test_changed_dictionaries_invalidate_cache(tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "constraints.json")
+    cache = ConstraintCache(cache_path)
+    cache.put("key", [(0, "port")])
+    cache.save()
+
+    monkeypatch.setattr(ConstraintRegistry, "version", -1)
+    ConstraintRegistry.reset()
+    try:
+        cache = ConstraintCache(cache_path)
+        cache.load()
+        assert cache.get("key") is None
+    finally:
+        monkeypatch.undo()
+        ConstraintRegistry.reset()
+
+
+def test_corrupt_cache(tmp_path):
+    cache_path = tmp_path / "constraints.json"
+    cache_path.write_text("{", encoding="utf-8")
+
+    cache = ConstraintCache(str(cache_path))
+    cache.load()
+    assert cache.get("key") is None
+
+    cache.put("key", [])
+    cache.save()
+    with open(cache_path, "r", encoding="utf-8") as cache_file:
+        assert json.load(cache_file)["entries"] == {"key": []}
+
+
+def test_clear(tmp_path):
+    cache_path = tmp_path / "constraints.json"
+    cache = ConstraintCache(str(cache_path))
+    cache.put("key", [])
+    cache.save()
+
+    cache.clear()
+    cache.clear()
+
+    assert not cache_path.exists()
+    assert cache.get("key") is None
@@ -0,0 +1,100 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint_detector import ConstraintDetector
+from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
+
+
+@pytest.fixture(name="get_artifact")
+def get_artifact_():
+    def create(concept_name, values):
+        artifact = ArtifactNode(
+            file_path="/project/config",
+            rel_file_path="config",
+            concept_name=concept_name,
+        )
+        for i, (config_type, value) in enumerate(values):
+            option = OptionNode(f"option{i}", f"{i}", config_type)
+            artifact.add_child(option)
+            option.add_child(ValueNode(name=value))
+        return artifact
+
+    return create
+
+
+def test_find_constraint_types(get_artifact):
+    artifact = get_artifact(
+        "maven",
+        [
+            (ConfigType.PORT, "8080"),
+            (ConfigType.PORT, "70000"),
+            (ConfigType.SIZE, "512MB"),
+            (ConfigType.SIZE, "512"),
+            (ConfigType.SIZE, "large"),
+            (ConfigType.BOOLEAN, "on"),
+            (ConfigType.ID, "abc"),
+        ],
+    )
+
+    templates = ConstraintDetector().find_constraint_types(artifact)
+
+    assert sorted(
+        (template.option.name, template.constraint_type)
+        for template in templates
+    ) == [
+        ("file", "path"),
+        ("option0", "port"),
+        ("option1", "UNKNOWN"),
+        ("option2", "size"),
+        ("option3", "number"),
+        ("option5", "boolean"),
+    ]
+
+
+def test_check_constraints(get_artifact):
+    artifact = get_artifact(
+        "maven",
+        [
+            (ConfigType.PORT, "8080"),
+            (ConfigType.PORT, "70000"),
+            (ConfigType.TIME, "10"),
+            (ConfigType.TIME, "soon"),
+            (ConfigType.VERSION_NUMBER, "pytest:*"),
+        ],
+    )
+
+    conflicts = ConstraintDetector().check_constraints(artifact)
+
+    assert sorted(
+        (conflict.option.name, conflict.new_constraint)
+        for conflict in conflicts
+    ) == [
+        ("option1", "port"),
+        ("option2", "number"),
+        ("option4", "versionnumber"),
+    ]
+
+
+def test_concept_overwrites_constraints(get_artifact):
+    values = [(ConfigType.VERSION_NUMBER, "pytest:*")]
+
+    maven = get_artifact("maven", values)
+    poetry = get_artifact("poetry", values)
+
+    assert ConstraintDetector().check_constraints(maven)
+    assert not ConstraintDetector().check_constraints(poetry)
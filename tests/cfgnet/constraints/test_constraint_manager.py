@@ -0,0 +1,185 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import logging
+import pytest
+
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint_cache import ConstraintCache
+from cfgnet.constraints.constraint_manager import ConstraintManager
+from cfgnet.constraints.constraint_template import ConstraintTemplate
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import ArtifactNode, OptionNode, ValueNode
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_network")
+def get_network_():
+    repo = TemporaryRepository("tests/test_repos/maven_docker")
+    network_configuration = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    network = Network.init_network(cfg=network_configuration)
+
+    # add violations to every artifact
+    for artifact in network.get_nodes(ArtifactNode):
+        option = OptionNode("invalid_port", "0", ConfigType.PORT)
+        artifact.add_child(option)
+        option.add_child(ValueNode(name="70000"))
+
+    return network
+
+
+def get_violations(conflicts):
+    return [
+        (
+            conflict.artifact.rel_file_path,
+            conflict.option.display_option_id,
+            conflict.new_value.name,
+            conflict.new_constraint,
+        )
+        for conflict in conflicts
+    ]
+
+
+def test_check_network_constraints(get_network):
+    manager = ConstraintManager()
+    expected = []
+    for artifact in get_network.get_nodes(ArtifactNode):
+        expected += manager.check_constraints(artifact)
+
+    conflicts = manager.check_network_constraints(get_network)
+
+    assert get_violations(conflicts) == get_violations(expected)
+    assert ("pom.xml", "invalid_port", "70000", "port") in (
+        get_violations(conflicts)
+    )
+
+
+def test_check_network_constraints_jobs(get_network):
+    manager = ConstraintManager()
+
+    serial = manager.check_network_constraints(get_network)
+    parallel = manager.check_network_constraints(get_network, jobs=2)
+
+    assert get_violations(parallel) == get_violations(serial)
+
+
+def test_check_network_constraints_cache(get_network, tmp_path):
+    manager = ConstraintManager()
+    cache_path = str(tmp_path / "constraints.json")
+    artifacts = list(get_network.get_nodes(ArtifactNode))
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    expected = manager.check_network_constraints(get_network, cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, len(artifacts))
+
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    conflicts = manager.check_network_constraints(get_network, cache=cache)
+    assert (cache.hits, cache.misses) == (len(artifacts), 0)
+    assert get_violations(conflicts) == get_violations(expected)
+
+    # only the edited artifact is checked again
+    edited = artifacts[0].get_nodes()[-1]
+    edited.name = "80"
+    cache = ConstraintCache(cache_path)
+    cache.load()
+    conflicts = manager.check_network_constraints(get_network, cache=cache)
+    assert (cache.hits, cache.misses) == (len(artifacts) - 1, 1)
+    assert edited not in [conflict.new_value for conflict in conflicts]
+
+
+def create_templates(file_path, options):
+    artifact = ArtifactNode(
+        file_path=file_path,
+        rel_file_path=os.path.basename(file_path),
+        concept_name="maven",
+    )
+    templates = []
+    for name, value, constraint_type in options:
+        option = OptionNode(name, "0", ConfigType.PORT)
+        artifact.add_child(option)
+        value_node = ValueNode(name=value)
+        option.add_child(value_node)
+        templates.append(
+            ConstraintTemplate(artifact, option, value_node, constraint_type)
+        )
+    return templates
+
+
+def test_convert_templates_to_conflicts():
+    old_templates = create_templates(
+        "/project/pom.xml",
+        [("port", "8080", "port"), ("timeout", "10", "port")],
+    ) + create_templates("/project/other.xml", [("port", "8080", "port")])
+    new_templates = create_templates(
+        "/project/pom.xml",
+        [("port", "70000", "number"), ("timeout", "10", "port")],
+    ) + create_templates("/project/other.xml", [("port", "8080", "port")])
+
+    conflicts = ConstraintManager().convert_templates_to_conflicts(
+        set(old_templates), set(new_templates)
+    )
+
+    assert len(conflicts) == 1
+    conflict = conflicts.pop()
+    assert conflict.conflict_from_difference
+    assert conflict.artifact is old_templates[0].artifact
+    assert conflict.option is new_templates[0].option
+    assert conflict.old_value is old_templates[0].value
+    assert conflict.new_value is new_templates[0].value
+    assert conflict.old_constraint == "PORT"
+    assert conflict.new_constraint == "number"
+
+
+def test_convert_templates_of_same_option_in_other_file():
+    old_templates = create_templates(
+        "/project/pom.xml", [("port", "8080", "port")]
+    )
+    new_templates = create_templates(
+        "/project/pom.xml", [("port", "8080", "port")]
+    ) + create_templates("/project/other.xml", [("port", "70000", "number")])
+
+    conflicts = ConstraintManager().convert_templates_to_conflicts(
+        set(old_templates), set(new_templates)
+    )
+
+    assert not conflicts
+
+
+def test_convert_templates_of_removed_option(caplog):
+    old_templates = create_templates(
+        "/project/pom.xml", [("port", "8080", "port")]
+    )
+    new_templates = create_templates(
+        "/project/pom.xml", [("timeout", "10", "number")]
+    )
+
+    with caplog.at_level(logging.ERROR):
+        conflicts = ConstraintManager().convert_templates_to_conflicts(
+            set(old_templates), set(new_templates)
+        )
+
+    assert not conflicts
+    assert "Error while creating ConstraintViolationConflict" in caplog.text
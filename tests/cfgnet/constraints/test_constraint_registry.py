@@ -0,0 +1,96 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import pytest
+
+from tempfile import TemporaryDirectory
+from cfgnet.config_types.config_types import ConfigType
+from cfgnet.constraints.constraint import PortConstraint
+from cfgnet.constraints.constraint_registry import (
+    CONSTRAINT_DICTS_DIR,
+    ConstraintRegistry,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    ConstraintRegistry.reset()
+    yield
+    ConstraintRegistry.reset()
+
+
+def test_load_concept_dicts():
+    concept_dicts = ConstraintRegistry.load_concept_dicts(CONSTRAINT_DICTS_DIR)
+
+    assert {"poetry", "travis", "nodejs"} <= set(concept_dicts)
+
+
+def test_invalid_concept_dict():
+    with TemporaryDirectory() as dict_dir:
+        with open(
+            os.path.join(dict_dir, "broken.json"), "w", encoding="utf-8"
+        ) as dict_file:
+            json.dump(
+                {
+                    "concept": "broken",
+                    "constraint_types": {"port": {"value_syntax": "("}},
+                },
+                dict_file,
+            )
+
+        with pytest.raises(ValueError, match="invalid value_syntax"):
+            ConstraintRegistry.load_concept_dicts(dict_dir)
+
+
+def test_get_constraint():
+    constraint = ConstraintRegistry.get_constraint(ConfigType.PORT)
+
+    assert isinstance(constraint, PortConstraint)
+    assert ConstraintRegistry.get_constraint(ConfigType.PORT) is constraint
+    assert ConstraintRegistry.get_constraint(ConfigType.ID) is None
+    assert ConstraintRegistry.get_constraint(ConfigType.UNKNOWN) is None
+
+
+def test_concept_overwrites_constraint():
+    default = ConstraintRegistry.get_constraint(ConfigType.VERSION_NUMBER)
+    poetry = ConstraintRegistry.get_constraint(
+        ConfigType.VERSION_NUMBER, "poetry"
+    )
+
+    assert poetry is not default
+    assert poetry.value_syntax != default.value_syntax
+    assert poetry.validate_value("pytest:*")
+    assert not default.validate_value("pytest:*")
+
+
+def test_get_special_constraints():
+    special_constraints = ConstraintRegistry.get_special_constraints("poetry")
+
+    assert len(special_constraints) == 4
+    assert ConstraintRegistry.get_special_constraints("poetry") is (
+        special_constraints
+    )
+    assert ConstraintRegistry.get_special_constraints("maven") == []
+
+
+def test_get_dict_version(monkeypatch):
+    dict_version = ConstraintRegistry.get_dict_version()
+    assert dict_version == ConstraintRegistry.get_dict_version()
+
+    monkeypatch.setattr(ConstraintRegistry, "version", -1)
+    ConstraintRegistry.reset()
+    assert ConstraintRegistry.get_dict_version() != dict_version
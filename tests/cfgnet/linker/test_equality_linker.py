@@ -13,34 +13,131 @@
 # You should have received a copy of the GNU General Public License along with
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+
+import pytest
+
 from cfgnet.linker.equality_linker import EqualityLinker
+from cfgnet.linker.link import Link
+from cfgnet.linker.static_blacklist import StaticBlackList
 from cfgnet.config_types.config_types import ConfigType
-from cfgnet.network.nodes import OptionNode, ValueNode
+from cfgnet.config_types.config_type_inferer import ConfigTypeInferer
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+from tests.utility.temporary_repository import TemporaryRepository
+
 
+def get_all_pairs_links(network):
+    """
+    Compute links by comparing all pairs of value nodes.
 
-def test_check_config_types():
+    Mirrors the linker before the hash index was introduced, which
+    already skipped empty and blacklisted values.
+    """
+    cfg = network.cfg
+    blacklist = StaticBlackList().values
+    nodes = [
+        node
+        for node in network.get_nodes(ValueNode)
+        if not ConfigTypeInferer.is_boolean(node.name)
+    ]
+    links = set()
+    for node in nodes:
+        if not node.name:
+            continue
+        if cfg.enable_static_blacklist and node.name in blacklist:
+            continue
+        for other in nodes:
+            if node is other or node.name != other.name:
+                continue
+            if node.config_type != other.config_type:
+                continue
+            artifact_name = node.id.split("::::")[1]
+            if (
+                not cfg.enable_internal_links
+                and artifact_name in other.id.split("::::")[1]
+            ):
+                continue
+            links.add(str(Link(node, other)))
+    return links
+
+
+def test_find_matches_of_equal_config_types():
     linker = EqualityLinker()
+    root = ProjectNode(name="project", root_dir="/project")
+
+    def add_value(file, config_type, name):
+        artifact = ArtifactNode(f"/project/{file}", file, "docker", root)
+        option = OptionNode(f"option_{file}", "1", config_type)
+        artifact.add_child(option)
+        value = ValueNode(name=name)
+        option.add_child(value)
+        return value
 
-    option_port_a = OptionNode("port_a", "1", ConfigType.PORT)
-    port_a = ValueNode(name="8000")
-    option_port_a.add_child(port_a)
+    port_a = add_value("a", ConfigType.PORT, "8000")
+    port_b = add_value("b", ConfigType.PORT, "8000")
+    unknown = add_value("c", ConfigType.UNKNOWN, "8000")
+    path = add_value("d", ConfigType.PATH, "8000")
+    linker.index = linker._create_index([port_a, port_b, unknown, path])
 
-    option_port_b = OptionNode("port_b", "2", ConfigType.PORT)
-    port_b = ValueNode(name="8000")
-    option_port_b.add_child(port_b)
+    assert linker._find_matches(port_a) == [port_b]
+    assert linker._find_matches(unknown) == []
+    assert linker._find_matches(path) == []
 
-    option_unknown_a = OptionNode("unknown_a", "3", ConfigType.UNKNOWN)
-    unknown_a = ValueNode(name="unknown")
-    option_unknown_a.add_child(unknown_a)
 
-    option_path = OptionNode("path", "4", ConfigType.PATH)
-    path = ValueNode(name="path")
-    option_path.add_child(path)
+@pytest.mark.parametrize("enable_static_blacklist", [False, True])
+@pytest.mark.parametrize("enable_internal_links", [False, True])
+def test_link_set_unchanged(enable_internal_links, enable_static_blacklist):
+    repo = TemporaryRepository(
+        "tests/test_repos/maven_docker/0001-Add-Docker-and-maven-file.patch"
+    )
+    cfg = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=enable_static_blacklist,
+        enable_internal_links=enable_internal_links,
+        enable_all_conflicts=False,
+        enable_parse_cache=False,
+    )
+    network = Network.init_network(cfg=cfg)
 
-    same_type = linker._check_config_types(port_a, port_b)
-    only_one_unknown = linker._check_config_types(port_a, unknown_a)
-    different_types = linker._check_config_types(port_a, path)
+    expected_links = get_all_pairs_links(network)
+
+    assert expected_links
+    assert {str(link) for link in network.links} == expected_links
+
+
+@pytest.mark.parametrize("first_value", ["DEBUG", ""])
+def test_skip_blacklisted_and_empty_values(first_value):
+    cfg = NetworkConfiguration(
+        project_root_abs="/project",
+        enable_static_blacklist=True,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+        enable_parse_cache=False,
+    )
+    root = ProjectNode(name="project", root_dir="/project")
+    network = Network(project_name="project", root=root, cfg=cfg)
+    for file in ("a/package.json", "b/package.json"):
+        artifact = ArtifactNode(f"/project/{file}", file, "nodejs", root)
+        for name, value in (("name", first_value), ("port", "8000")):
+            option = OptionNode(name, "1", ConfigType.PORT)
+            artifact.add_child(option)
+            option.add_child(ValueNode(name=value))
+        root.add_child(artifact)
+
+    linker = EqualityLinker()
+    linker.network = network
+    linker.enable_internal_links = False
+    linker.create_links()
 
-    assert same_type
-    assert not only_one_unknown
-    assert not different_types
+    # the skipped value comes before the ports, which are still linked
+    names = [node.name for node in network.get_nodes(ValueNode)]
+    assert names[:3] == ["a/package.json", first_value, "8000"]
+    assert {link.node_a.name for link in network.links} == {"8000"}
+    assert len(network.links) == 1
@@ -22,6 +22,7 @@ import pytest
 from cfgnet.network.nodes import ValueNode
 from cfgnet.network.network_configuration import NetworkConfiguration
 from cfgnet.network.network import Network
+from cfgnet.network.ignorefile import IgnoreFile
 from tests.utility.temporary_repository import TemporaryRepository
 
 
@@ -54,3 +55,99 @@ def test_ignorefile(repo):
     network = Network.init_network(cfg)
 
     assert len(network.get_nodes(ValueNode)) == 2
+
+
+IGNORE_PATTERNS = [
+    "# comment",
+    "",
+    "*.log",
+    "!keep.log",
+    "node_modules/",
+    "/build",
+    "docs/**/*.md",
+    "**/tmp",
+    "config/*.json",
+    "secret?.txt",
+    "data/[ab]*.csv",
+    "vendor/**",
+    "!vendor/keep.txt",
+]
+
+IGNORE_CASES = [
+    ("app.log", True),
+    ("src/app.log", True),
+    ("keep.log", False),
+    ("src/keep.log", False),
+    ("node_modules/lib/package.json", True),
+    ("src/node_modules/package.json", True),
+    ("build/pom.xml", True),
+    ("src/build/pom.xml", False),
+    ("docs/README.md", True),
+    ("docs/a/b/c.md", True),
+    ("src/docs/README.md", False),
+    ("tmp/file", True),
+    ("a/b/tmp/file", True),
+    ("config/app.json", True),
+    ("config/sub/app.json", False),
+    ("src/config/app.json", False),
+    ("secret1.txt", True),
+    ("secret12.txt", False),
+    ("data/a1.csv", True),
+    ("data/c1.csv", False),
+    ("vendor/keep.txt", False),
+    ("vendor/lib/keep.txt", True),
+    ("Dockerfile", False),
+]
+
+
+def test_ignore_patterns():
+    IgnoreFile.compile(IGNORE_PATTERNS)
+    try:
+        for file, ignored in IGNORE_CASES:
+            assert IgnoreFile.ignored(file) == ignored, file
+    finally:
+        IgnoreFile.compile([])
+
+
+def test_ignore_patterns_like_git():
+    repo = TemporaryRepository()
+    with open(
+        os.path.join(repo.root, ".gitignore"), "w", encoding="utf-8"
+    ) as gitignore:
+        gitignore.write("\n".join(IGNORE_PATTERNS))
+
+    files = [file for file, _ in IGNORE_CASES]
+    output = repo.repo.git.check_ignore(
+        "--no-index", "--verbose", "--non-matching", *files
+    )
+    git_ignored = {}
+    for line in output.splitlines():
+        source, file = line.split("\t")
+        git_ignored[file] = source != "::" and ":!" not in source
+
+    IgnoreFile.compile(IGNORE_PATTERNS)
+    try:
+        for file in files:
+            assert IgnoreFile.ignored(file) == git_ignored[file], file
+    finally:
+        IgnoreFile.compile([])
+
+
+def test_prune_ignored_directories():
+    IgnoreFile.compile(["node_modules/", "!node_modules/keep.json", "*.xml"])
+    files = [
+        "node_modules/a/package.json",
+        "node_modules/b/package.json",
+        "node_modules/keep.json",
+        "package.json",
+        "pom.xml",
+        "src/package.json",
+    ]
+    try:
+        assert list(IgnoreFile.prune(files)) == [
+            "package.json",
+            "src/package.json",
+        ]
+        assert IgnoreFile.filter(files) == {"package.json", "src/package.json"}
+    finally:
+        IgnoreFile.compile([])
@@ -21,6 +21,7 @@ from cfgnet.network.network import Network
 from cfgnet.network.network_configuration import NetworkConfiguration
 from cfgnet.network.nodes import (
     ArtifactNode,
+    Node,
     OptionNode,
     ProjectNode,
     ValueNode,
@@ -105,6 +106,26 @@ def test_enable_internal_links(get_config):
     assert expected_links == link_targets
 
 
+def test_init_network_with_jobs(get_config):
+    config = get_config
+    config.enable_internal_links = True
+    config.enable_parse_cache = False
+    serial_network = Network.init_network(cfg=config)
+
+    config.jobs = 2
+    parallel_network = Network.init_network(cfg=config)
+
+    assert list(parallel_network.nodes) == list(serial_network.nodes)
+    assert {str(link) for link in parallel_network.links} == {
+        str(link) for link in serial_network.links
+    }
+    assert all(
+        node.network is parallel_network
+        for nodes in parallel_network.nodes.values()
+        for node in nodes
+    )
+
+
 def test_get_nodes(get_config):
     network = Network.init_network(cfg=get_config)
 
@@ -119,6 +140,69 @@ def test_get_nodes(get_config):
     assert all(isinstance(node, ValueNode) for node in value_nodes)
 
 
+def test_node_registries(get_config):
+    network = Network.init_network(cfg=get_config)
+    all_nodes = []
+    network.traverse(network.root, all_nodes.append)
+
+    for node_type in (ProjectNode, ArtifactNode, OptionNode, ValueNode):
+        expected = [x for x in all_nodes if isinstance(x, node_type)]
+        assert sorted(map(id, network.get_nodes(node_type))) == sorted(
+            map(id, expected)
+        )
+
+    value_nodes = [x for x in all_nodes if isinstance(x, ValueNode)]
+    for config_type in {x.config_type for x in value_nodes}:
+        expected = [x for x in value_nodes if x.config_type == config_type]
+        assert sorted(
+            map(id, network.get_values_by_config_type(config_type))
+        ) == sorted(map(id, expected))
+
+    docker_values = network.get_values_by_concept("docker")
+    assert docker_values
+    assert all("Dockerfile" in x.id for x in docker_values)
+    assert not network.get_values_by_concept("unknown")
+
+
+def test_remove_child_unregisters_nodes(get_config):
+    network = Network.init_network(cfg=get_config)
+    artifact = next(
+        filter(
+            lambda x: x.concept_name == "docker",
+            network.get_nodes(ArtifactNode),
+        )
+    )
+    removed = {id(node) for node in artifact.get_nodes(node_type=Node)}
+
+    network.root.remove_child(artifact)
+
+    assert artifact not in network.root.children
+    assert artifact.id not in network.nodes
+    assert not network.get_values_by_concept("docker")
+    assert not any(
+        id(node) in removed
+        for node_type in (ArtifactNode, OptionNode, ValueNode)
+        for node in network.get_nodes(node_type)
+    )
+
+
+def test_registries_after_loading(get_config):
+    network = Network.init_network(cfg=get_config)
+
+    network.save()
+    loaded_network = Network.load_network(
+        project_root=network.cfg.project_root_abs
+    )
+
+    for node_type in (ProjectNode, ArtifactNode, OptionNode, ValueNode):
+        assert sorted(
+            node.id for node in loaded_network.get_nodes(node_type)
+        ) == sorted(node.id for node in network.get_nodes(node_type))
+    assert len(loaded_network.get_values_by_concept("maven")) == len(
+        network.get_values_by_concept("maven")
+    )
+
+
 def test_find_node(get_config):
     network = Network.init_network(cfg=get_config)
     artifact_nodes = network.get_nodes(ArtifactNode)
@@ -145,7 +229,7 @@ def test_save_network(get_config):
 
     file_name = hashlib.md5(network.project_root.encode()).hexdigest()
     network_file = os.path.join(
-        network.cfg.network_dir_path(), file_name + ".pickle"
+        network.cfg.network_dir_path(), file_name + ".sqlite"
     )
 
     network.save()
@@ -162,6 +246,8 @@ def test_load_network(get_config):
     )
 
     assert loaded_network
+    assert sorted(loaded_network.nodes) == sorted(network.nodes)
+    assert len(loaded_network.links) == len(network.links)
 
 
 def test_validate_network(get_repo, get_config):
@@ -183,6 +269,68 @@ def test_validate_network(get_repo, get_config):
     assert len(modified_option_conflicts) == 2
 
 
+def test_validate_network_incremental(get_repo, get_config):
+    repo = get_repo
+    ref_network = Network.init_network(cfg=get_config)
+    ref_network.save()
+
+    repo.apply_patch(
+        "tests/test_repos/maven_docker/0002-Provoke-two-conflicts.patch"
+    )
+
+    conflicts, new_network = ref_network.validate()
+    incremental_conflicts, incremental_network = ref_network.validate(
+        incremental=True
+    )
+
+    assert {conflict.id for conflict in incremental_conflicts} == {
+        conflict.id for conflict in conflicts
+    }
+    assert incremental_network.commit_hash == new_network.commit_hash
+    assert sorted(map(str, incremental_network.links)) == sorted(
+        map(str, new_network.links)
+    )
+    assert sorted(incremental_network.nodes) == sorted(new_network.nodes)
+    assert all(
+        node.network is incremental_network
+        for node in incremental_network.get_nodes(ValueNode)
+    )
+
+
+def test_validate_network_incremental_reverted_file(get_repo, get_config):
+    dockerfile = os.path.join(get_repo.root, "Dockerfile")
+    with open(dockerfile, "r", encoding="utf-8") as file:
+        content = file.read()
+
+    ref_network = Network.init_network(cfg=get_config)
+
+    # the edit is never committed, so a diff against the commit of the
+    # network does not report the file once it is reverted
+    with open(dockerfile, "w", encoding="utf-8") as file:
+        file.write(content.replace("EXPOSE 8761", "EXPOSE 9000"))
+    _, dirty_network = ref_network.validate(incremental=True)
+
+    with open(dockerfile, "w", encoding="utf-8") as file:
+        file.write(content)
+    _, reverted_network = dirty_network.validate(incremental=True)
+
+    new_network = Network.init_network(cfg=get_config)
+
+    assert "9000" in [
+        node.name for node in dirty_network.get_nodes(ValueNode)
+    ]
+    assert sorted(
+        node.id for node in reverted_network.get_nodes(ValueNode)
+    ) == sorted(node.id for node in new_network.get_nodes(ValueNode))
+    assert sorted(map(str, reverted_network.links)) == sorted(
+        map(str, new_network.links)
+    )
+    assert sorted(map(str, reverted_network.option_constraints)) == sorted(
+        map(str, new_network.option_constraints)
+    )
+    assert reverted_network.artifact_hashes == new_network.artifact_hashes
+
+
 def test_export_network(get_config):
     network = Network.init_network(cfg=get_config)
     export_file = os.path.join(network.cfg.export_dir_path(), "dot_file")
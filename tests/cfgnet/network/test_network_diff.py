@@ -0,0 +1,209 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+import os
+
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.network_diff import NetworkDiff, OptionDelta
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.vcs.git import Git
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+ROOT_DIR = "/tmp/project"
+
+
+def create_network(artifacts):
+    """Create a network from options with locations and values by files."""
+    cfg = NetworkConfiguration(
+        project_root_abs=ROOT_DIR,
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    root = ProjectNode(name="project", root_dir=ROOT_DIR)
+    network = Network(project_name="project", root=root, cfg=cfg)
+
+    for file, options in artifacts.items():
+        artifact = ArtifactNode(
+            file_path=f"{ROOT_DIR}/{file}",
+            rel_file_path=file,
+            concept_name="test",
+        )
+        for name, location, values in options:
+            option = OptionNode(name, location)
+            artifact.add_child(option)
+            for value in values:
+                option.add_child(ValueNode(value))
+        root.add_child(artifact)
+
+    return network
+
+
+def test_no_changes():
+    artifacts = {"a.properties": [("port", "1", ["8080"])]}
+
+    delta = NetworkDiff.diff(
+        create_network(artifacts), create_network(artifacts)
+    )
+
+    assert delta.is_empty()
+    assert str(delta) == ""
+
+
+def test_artifacts():
+    network_a = create_network({"a.properties": [], "b.properties": []})
+    network_b = create_network({"b.properties": [], "c.properties": []})
+
+    delta = NetworkDiff.diff(network_a, network_b)
+
+    assert delta.added_artifacts == ["c.properties"]
+    assert delta.removed_artifacts == ["a.properties"]
+    assert not delta.added_options and not delta.modified_options
+    assert delta.changed_artifacts() == ["a.properties", "c.properties"]
+
+
+def test_options():
+    network_a = create_network(
+        {
+            "a.properties": [
+                ("port", "1", ["8080"]),
+                ("host", "2", ["localhost"]),
+                ("user", "3", ["admin"]),
+            ]
+        }
+    )
+    network_b = create_network(
+        {
+            "a.properties": [
+                ("port", "1", ["8000"]),
+                # moved options are not changed
+                ("user", "2", ["admin"]),
+                ("password", "3", ["secret"]),
+            ]
+        }
+    )
+
+    delta = NetworkDiff.diff(network_a, network_b)
+
+    assert delta.modified_options == [
+        OptionDelta("a.properties", "port", "1", ["8080"], ["8000"])
+    ]
+    assert delta.removed_options == [
+        OptionDelta("a.properties", "host", "2", old_values=["localhost"])
+    ]
+    assert delta.added_options == [
+        OptionDelta("a.properties", "password", "3", new_values=["secret"])
+    ]
+    assert str(delta).splitlines() == [
+        "+ a.properties: password = secret",
+        "- a.properties: host = localhost",
+        "~ a.properties: port = 8080 -> 8000",
+    ]
+
+
+def test_options_with_same_id():
+    network_a = create_network(
+        {"Dockerfile": [("RUN", "1", ["make"]), ("RUN", "2", ["test"])]}
+    )
+    network_b = create_network(
+        {"Dockerfile": [("RUN", "1", ["make"]), ("RUN", "3", ["test"])]}
+    )
+
+    delta = NetworkDiff.diff(network_a, network_b)
+
+    assert delta.removed_options == [
+        OptionDelta("Dockerfile", "RUN", "2", old_values=["test"])
+    ]
+    assert delta.added_options == [
+        OptionDelta("Dockerfile", "RUN", "3", new_values=["test"])
+    ]
+    assert not delta.modified_options
+
+
+def test_new_options_with_same_location():
+    network_a = create_network(
+        {"Dockerfile": [("RUN", "1", ["make"]), ("RUN", "2", ["test"])]}
+    )
+    network_b = create_network(
+        {
+            "Dockerfile": [
+                ("RUN", "1", ["make"]),
+                ("RUN", "3", ["lint"]),
+                ("RUN", "3", ["test"]),
+            ]
+        }
+    )
+
+    delta = NetworkDiff.diff(network_a, network_b)
+
+    assert delta.removed_options == [
+        OptionDelta("Dockerfile", "RUN", "2", old_values=["test"])
+    ]
+    assert delta.added_options == [
+        OptionDelta("Dockerfile", "RUN", "3", new_values=["lint"]),
+        OptionDelta("Dockerfile", "RUN", "3", new_values=["test"]),
+    ]
+    assert not delta.modified_options
+
+
+def test_diff_commits():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+    commits = [commit.hexsha for commit in repo.get_commit_history()]
+    cfg = NetworkConfiguration(
+        project_root_abs=os.path.abspath(repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    blob_reader = BlobReader(Git(cfg.project_root_abs), cfg.blob_dir_path())
+
+    network_a = Network.init_network(cfg, blob_reader, commits[0])
+    network_b = Network.init_network(cfg, blob_reader, commits[1])
+    blob_reader.close()
+
+    delta = NetworkDiff.diff(network_a, network_b)
+    changes = {
+        (x.artifact, x.option): (x.old_values, x.new_values)
+        for x in delta.modified_options
+    }
+
+    assert delta.changed_artifacts() == [
+        "application.properties",
+        "docker-compose.yml",
+    ]
+    assert changes[("application.properties", "server.port")] == (
+        ["8888"],
+        ["8000"],
+    )
+    assert len(changes) == 3
+
+
+def test_artifact_options():
+    network = create_network({"a.properties": [("port", "1", ["8080"])]})
+
+    delta = NetworkDiff.diff(None, network, artifact_options=True)
+
+    assert delta.added_artifacts == ["a.properties"]
+    assert OptionDelta(
+        "a.properties", "port", "1", new_values=["8080"]
+    ) in delta.added_options
+    assert not NetworkDiff.diff(None, network).added_options
@@ -0,0 +1,170 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import pickle
+import sqlite3
+import pytest
+
+from cfgnet.exceptions.exceptions import InvalidNetworkStateException
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.network_store import NetworkStore
+from cfgnet.network.nodes import ValueNode
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository(
+        "tests/test_repos/maven_docker/0001-Add-Docker-and-maven-file.patch"
+    )
+    return repo
+
+
+@pytest.fixture(name="get_network")
+def get_network_(get_repo):
+    network_configuration = NetworkConfiguration(
+        project_root_abs=os.path.abspath(get_repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+    network = Network.init_network(cfg=network_configuration)
+
+    get_repo.apply_patch(
+        "tests/test_repos/maven_docker/0002-Provoke-two-conflicts.patch"
+    )
+    conflicts, new_network = network.validate()
+    new_network.conflicts = conflicts
+
+    return new_network
+
+
+def test_save_and_load(get_network):
+    network = get_network
+    network.save()
+
+    loaded_network = Network.load_network(network.cfg.project_root_abs)
+
+    assert loaded_network.project_name == network.project_name
+    assert loaded_network.commit_hash == network.commit_hash
+    assert not loaded_network.unloaded_parts
+    assert [node.id for node in loaded_network.root.children] == [
+        node.id for node in network.root.children
+    ]
+    assert sorted(loaded_network.nodes) == sorted(network.nodes)
+    assert all(
+        node.network is loaded_network
+        for node in loaded_network.get_nodes(ValueNode)
+    )
+    assert sorted(map(str, loaded_network.links)) == sorted(
+        map(str, network.links)
+    )
+    assert {str(x) for x in loaded_network.option_constraints} == {
+        str(x) for x in network.option_constraints
+    }
+    assert {x.id for x in loaded_network.conflicts} == {
+        x.id for x in network.conflicts
+    }
+    assert sorted(map(str, loaded_network.conflicts)) == sorted(
+        map(str, network.conflicts)
+    )
+
+
+def test_conflicts_refer_to_loaded_nodes(get_network):
+    network = get_network
+    network.save()
+
+    loaded_network = Network.load_network(network.cfg.project_root_abs)
+    loaded_nodes = {
+        id(node) for nodes in loaded_network.nodes.values() for node in nodes
+    }
+
+    for link in loaded_network.links:
+        assert id(link.node_a) in loaded_nodes
+        assert id(link.node_b) in loaded_nodes
+
+    for template in loaded_network.option_constraints:
+        assert id(template.value) in loaded_nodes
+
+
+def test_load_parts(get_network):
+    network = get_network
+    network.save()
+
+    loaded_network = Network.load_network(
+        network.cfg.project_root_abs, parts=["links"]
+    )
+
+    assert len(loaded_network.links) == len(network.links)
+    assert not loaded_network.conflicts
+    assert not loaded_network.option_constraints
+    assert "conflicts" in loaded_network.unloaded_parts
+
+    with pytest.raises(ValueError):
+        NetworkStore(Network._get_network_file(network.project_root)).load(
+            ["nodes"]
+        )
+
+
+def test_save_keeps_unloaded_parts(get_network):
+    network = get_network
+    network.save()
+
+    loaded_network = Network.load_network(
+        network.cfg.project_root_abs, parts=["constraint_violations"]
+    )
+    loaded_network.constraint_violations = ["violation"]
+    loaded_network.save()
+
+    reloaded_network = Network.load_network(network.cfg.project_root_abs)
+
+    assert reloaded_network.constraint_violations == ["violation"]
+    assert len(reloaded_network.links) == len(network.links)
+    assert len(reloaded_network.conflicts) == len(network.conflicts)
+
+
+def test_migrate_pickle(get_network):
+    network = get_network
+    network_file = Network._get_network_file(network.project_root)
+    pickle_file = os.path.splitext(network_file)[0] + ".pickle"
+
+    os.makedirs(network.cfg.network_dir_path(), exist_ok=True)
+    with open(pickle_file, "wb") as file:
+        pickle.dump(network, file)
+
+    loaded_network = Network.load_network(network.cfg.project_root_abs)
+
+    assert os.path.exists(network_file)
+    assert os.path.exists(pickle_file + ".bak")
+    assert not os.path.exists(pickle_file)
+    assert sorted(loaded_network.nodes) == sorted(network.nodes)
+    assert len(loaded_network.links) == len(network.links)
+    assert len(loaded_network.conflicts) == len(network.conflicts)
+
+
+def test_reject_other_version(get_network):
+    network = get_network
+    network.save()
+    network_file = Network._get_network_file(network.project_root)
+
+    connection = sqlite3.connect(network_file)
+    with connection:
+        connection.execute("UPDATE meta SET value = 0 WHERE key = 'version'")
+    connection.close()
+
+    with pytest.raises(InvalidNetworkStateException):
+        NetworkStore(network_file).load()
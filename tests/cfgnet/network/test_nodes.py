@@ -0,0 +1,85 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+
+import pytest
+
+from cfgnet.network.nodes import (
+    ArtifactNode,
+    OptionNode,
+    ProjectNode,
+    ValueNode,
+)
+
+
+@pytest.fixture(name="get_artifact")
+def get_artifact_():
+    artifact = ArtifactNode(
+        file_path="/root/app/config.yml",
+        rel_file_path="app/config.yml",
+        concept_name="yaml",
+    )
+    server = OptionNode("server", "1")
+    artifact.add_child(server)
+    port = OptionNode("port", "2")
+    server.add_child(port)
+    port.add_child(ValueNode(name="8080"))
+    return artifact
+
+
+def test_nodes_have_slots(get_artifact):
+    for node in get_artifact.get_nodes(node_type=object):
+        assert not hasattr(node, "__dict__")
+
+    with pytest.raises(AttributeError):
+        get_artifact.unknown_attribute = None
+
+
+def test_ids_follow_parents(get_artifact):
+    value = get_artifact.get_nodes()[-1]
+
+    assert value.id == "app/config.yml::::server::::port::::8080"
+
+    root = ProjectNode(name="project", root_dir="/root")
+    root.add_child(get_artifact)
+
+    assert value.id == "project::::app/config.yml::::server::::port::::8080"
+    assert value.parent.display_option_id == "server::port"
+
+
+def test_names_are_interned():
+    option_a = OptionNode("".join(["ser", "ver"]), "1")
+    option_b = OptionNode("".join(["serv", "er"]), "2")
+    value_a = ValueNode(name="".join(["local", "host"]))
+    value_b = ValueNode(name="".join(["loc", "alhost"]))
+
+    assert option_a.name is option_b.name
+    assert value_a.name is value_b.name
+
+
+def test_pickled_nodes_omit_ids(get_artifact):
+    root = ProjectNode(name="project", root_dir="/root")
+    root.add_child(get_artifact)
+    value = get_artifact.get_nodes()[-1]
+
+    data = pickle.dumps(root)
+    loaded_root = pickle.loads(data)
+    loaded_value = loaded_root.children[0].get_nodes()[-1]
+
+    assert value.id.encode() not in data
+    assert loaded_value.id == value.id
+    assert loaded_value.parent.display_option_id == "server::port"
+    assert loaded_value.config_type == value.config_type
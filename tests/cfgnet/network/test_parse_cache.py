@@ -0,0 +1,133 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from cfgnet.network.network import Network
+from cfgnet.network.network_configuration import NetworkConfiguration
+from cfgnet.network.nodes import ArtifactNode, ValueNode
+from cfgnet.network.parse_cache import ParseCache
+from cfgnet.plugins.concept.docker_plugin import DockerPlugin
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.vcs.git import Git
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository(
+        "tests/test_repos/maven_docker/0001-Add-Docker-and-maven-file.patch"
+    )
+    return repo
+
+
+@pytest.fixture(name="get_config")
+def get_config_(get_repo):
+    network_configuration = NetworkConfiguration(
+        project_root_abs=os.path.abspath(get_repo.root),
+        enable_static_blacklist=False,
+        enable_internal_links=False,
+        enable_all_conflicts=False,
+    )
+
+    return network_configuration
+
+
+def test_cached_network_is_equal(get_config):
+    network = Network.init_network(cfg=get_config)
+    cached_network = Network.init_network(cfg=get_config)
+
+    cache = ParseCache(get_config.cache_dir_path(), 1024 * 1024)
+
+    assert cache.stats()["entries"] == 2
+    assert list(cached_network.nodes) == list(network.nodes)
+    assert {str(link) for link in cached_network.links} == {
+        str(link) for link in network.links
+    }
+
+
+def test_changed_file_is_parsed_again(get_repo, get_config):
+    Network.init_network(cfg=get_config)
+
+    with open(
+        os.path.join(get_repo.root, "Dockerfile"), "a", encoding="utf-8"
+    ) as dockerfile:
+        dockerfile.write("\nEXPOSE 9000\n")
+
+    network = Network.init_network(cfg=get_config)
+    cache = ParseCache(get_config.cache_dir_path(), 1024 * 1024)
+    value_names = {node.name for node in network.get_nodes(ValueNode)}
+
+    assert cache.stats()["entries"] == 3
+    assert "9000" in value_names
+
+
+def test_key_depends_on_plugin_version():
+    cache = ParseCache("cache", 1024)
+    plugin = DockerPlugin()
+
+    key = cache.key(plugin, "hash", "Dockerfile")
+    plugin.version += 1
+    new_key = cache.key(plugin, "hash", "Dockerfile")
+
+    assert key != new_key
+
+
+def test_blobs_share_entries(get_repo, get_config):
+    network = Network.init_network(cfg=get_config)
+    git = Git(project_root=get_repo.root)
+    commit = git.get_current_commit_hash()
+
+    # workers read the blobs of a commit into their own directories
+    for index in range(2):
+        blob_dir = os.path.join(get_config.blob_dir_path(), f"worker{index}")
+        blob_reader = BlobReader(git, blob_dir)
+        try:
+            blob_network = Network.init_network(
+                cfg=get_config, blob_reader=blob_reader, commit=commit
+            )
+        finally:
+            blob_reader.close()
+
+        assert list(blob_network.nodes) == list(network.nodes)
+        assert sorted(
+            artifact.file_path
+            for artifact in blob_network.get_nodes(ArtifactNode)
+        ) == sorted(
+            artifact.file_path for artifact in network.get_nodes(ArtifactNode)
+        )
+
+    cache = ParseCache(get_config.cache_dir_path(), 1024 * 1024)
+    assert cache.stats()["entries"] == 2
+
+
+def test_evict_least_recently_used(get_config):
+    Network.init_network(cfg=get_config)
+    cache = ParseCache(get_config.cache_dir_path(), 0)
+
+    evicted = cache.evict()
+
+    assert evicted == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_clear_cache(get_config):
+    Network.init_network(cfg=get_config)
+    cache = ParseCache(get_config.cache_dir_path(), 1024 * 1024)
+
+    cache.clear()
+
+    assert cache.stats()["entries"] == 0
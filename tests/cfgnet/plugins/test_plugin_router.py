@@ -0,0 +1,119 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from cfgnet.plugins.plugin import Plugin
+from cfgnet.plugins.plugin_manager import PluginManager
+from cfgnet.plugins.plugin_router import PluginRouter
+from cfgnet.plugins.concept.docker_plugin import DockerPlugin
+from cfgnet.plugins.file_type.yaml_plugin import YAMLPlugin
+
+PATHS = [
+    "/path/to/Dockerfile",
+    "/path/to/Dockerfile.dev",
+    "/path/to/pom.xml",
+    "/path/to/notpom.xml",
+    "/path/to/package.json",
+    "/path/to/mypackage.json",
+    "/path/to/docker-compose.yml",
+    "/path/to/docker-compose.dev.yml",
+    "/path/to/docker-compose.yml.bak",
+    "/path/to/.travis.yml",
+    "/path/to/cypress.json",
+    "/path/to/tsconfig.json",
+    "/path/to/pyproject.toml",
+    "/path/to/application.yml",
+    "/path/to/application.prod.properties",
+    "/path/to/httpd.conf",
+    "/path/to/my.cnf",
+    "/path/to/my.ini",
+    "/path/to/ansible.cfg",
+    "/path/to/site.yml",
+    "/path/to/playbooks/test.yaml",
+    "/path/to/playbooks/test.json",
+    "/path/to/postgresql.conf",
+    "/path/to/mongod.conf",
+    "/path/to/settings.py",
+    "/path/to/php.ini",
+    "/path/to/file.ini",
+    "/path/to/file.yml",
+    "/path/to/README.md",
+    "",
+]
+
+
+class CustomPlugin(YAMLPlugin):
+    def __init__(self):
+        super().__init__("custom")
+
+    def is_responsible(self, abs_file_path):
+        return "custom" in abs_file_path
+
+
+def linear_scan(plugins, path):
+    for plugin in plugins:
+        if plugin.is_responsible(path):
+            return plugin
+    return None
+
+
+def test_route_equals_linear_scan():
+    plugins = PluginManager.get_plugins() + PluginManager.file_type_plugins
+    router = PluginRouter(plugins)
+
+    for path in PATHS:
+        assert router.route(path) is linear_scan(plugins, path), path
+
+
+def test_route_respects_plugin_order():
+    yaml_plugin = YAMLPlugin()
+    custom_plugin = CustomPlugin()
+    docker_plugin = DockerPlugin()
+
+    router = PluginRouter([yaml_plugin, custom_plugin, docker_plugin])
+
+    assert router.custom_plugins == [1]
+    assert router.route("/custom/file.yml") is yaml_plugin
+    assert router.route("/custom/Dockerfile") is custom_plugin
+    assert router.route("/path/to/Dockerfile") is docker_plugin
+    assert router.route("/path/to/file.txt") is None
+
+
+def test_explain():
+    plugins = PluginManager.get_plugins() + PluginManager.file_type_plugins
+    router = PluginRouter(plugins)
+
+    claims = router.explain("/path/to/docker-compose.yml")
+    concepts = [plugin.concept_name for plugin, _ in claims]
+
+    assert concepts == ["docker-compose", "yaml"]
+    assert claims[0][1] == "pattern 'docker-compose(.\\w+)?.yml'"
+    assert claims[1][1] == "suffix '.yml'"
+    assert not router.explain("/path/to/README.md")
+
+
+def test_is_responsible_from_declarations():
+    class DeclaredPlugin(YAMLPlugin):
+        file_names = ("config",)
+        file_suffixes = (".conf",)
+        file_patterns = (r"/etc/.*\.cfg$",)
+
+    plugin = DeclaredPlugin()
+
+    assert isinstance(plugin, Plugin)
+    assert plugin.is_responsible("/path/to/config")
+    assert plugin.is_responsible("/path/to/app.conf")
+    assert plugin.is_responsible("/etc/app/main.cfg")
+    assert not plugin.is_responsible("/path/to/main.cfg")
+    assert not plugin.is_responsible("/path/to/file.yml")
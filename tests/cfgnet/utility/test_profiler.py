@@ -0,0 +1,106 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import json
+import time
+import tracemalloc
+import pytest
+
+from tempfile import TemporaryDirectory
+from cfgnet.utility.profiler import Profiler
+
+
+@pytest.fixture(name="profiler")
+def profiler_():
+    Profiler.enable()
+    yield Profiler
+    Profiler.disable()
+    Profiler.reset()
+
+
+def test_disabled():
+    with Profiler.phase("parse"):
+        pass
+
+    assert list(Profiler.iterate("git", [1, 2])) == [1, 2]
+    assert not Profiler.phases
+
+
+def test_nested_phases(profiler):
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            data = [0] * 2**20
+            time.sleep(0.05)
+        del data
+
+    outer = profiler.phases["outer"]
+    inner = profiler.phases["inner"]
+
+    assert inner.wall_time >= 0.05
+    assert outer.wall_time < 0.05
+    assert inner.peak_memory >= 8 * 2**20
+    assert outer.peak_memory >= inner.peak_memory
+
+
+def test_nested_phases_without_reset_peak(profiler, monkeypatch):
+    # tracemalloc.reset_peak does not exist before Python 3.9
+    monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            data = [0] * 2**20
+        del data
+
+    assert profiler.phases["inner"].peak_memory >= 8 * 2**20
+    assert profiler.phases["outer"].peak_memory >= 8 * 2**20
+
+
+def test_iterate(profiler):
+    def files():
+        for file in ("a", "b"):
+            time.sleep(0.02)
+            yield file
+
+    with profiler.phase("consumer"):
+        for _ in profiler.iterate("producer", files()):
+            time.sleep(0.02)
+
+    assert profiler.phases["producer"].calls == 3
+    assert profiler.phases["producer"].wall_time >= 0.04
+    assert profiler.phases["consumer"].wall_time >= 0.04
+
+
+def test_write(profiler):
+    profiler.cprofile = True
+    with profiler.phase("parse"):
+        pass
+    profiler.record_artifact("docker", 100, 5)
+    profiler.record_artifact("docker", 50, 3)
+
+    with TemporaryDirectory() as data_dir:
+        profile_path = profiler.write(data_dir)
+        with open(profile_path, "r", encoding="utf-8") as profile_file:
+            profile = json.load(profile_file)
+
+        assert os.path.isfile(os.path.join(data_dir, "profile", "parse.prof"))
+
+    assert profile["phases"]["parse"]["calls"] == 1
+    assert profile["plugins"]["docker"] == {
+        "files": 2,
+        "bytes_read": 150,
+        "nodes": 8,
+    }
+    assert "docker" in profiler.summary()
@@ -0,0 +1,70 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from cfgnet.vcs.blob_reader import BlobReader
+from cfgnet.vcs.git import Git
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+    return repo
+
+
+def read(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def test_materialize_commits(get_repo, tmp_path):
+    git = Git(project_root=get_repo.root)
+    reader = BlobReader(git, str(tmp_path / "blobs"))
+    first, second, third = get_repo.get_commit_history()
+
+    paths = reader.materialize(reader.get_files(first.hexsha))
+    assert paths
+    for file, path in paths.items():
+        assert read(path) == (first.tree / file).data_stream.read()
+
+    files = reader.get_files(second.hexsha)
+    paths = reader.materialize(files)
+    for file, path in paths.items():
+        assert read(path) == (second.tree / file).data_stream.read()
+    assert reader.written == files
+
+    # only the files of the last commit remain in the blob directory
+    paths = reader.materialize({})
+    assert not paths
+    assert not any(files for _, _, files in os.walk(reader.blob_dir))
+
+    reader.materialize(reader.get_files(third.hexsha))
+    reader.close()
+    assert not os.path.exists(reader.blob_dir)
+
+
+def test_working_tree_is_untouched(get_repo, tmp_path):
+    git = Git(project_root=get_repo.root)
+    reader = BlobReader(git, str(tmp_path / "blobs"))
+    head = git.get_current_commit_hash()
+
+    for commit in get_repo.get_commit_history():
+        reader.materialize(reader.get_files(commit.hexsha))
+
+    assert git.get_current_commit_hash() == head
+    assert not get_repo.repo.is_dirty(untracked_files=True)
@@ -0,0 +1,105 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from cfgnet.vcs.git import Git
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository(
+        "tests/test_repos/maven_docker/0001-Add-Docker-and-maven-file.patch"
+    )
+    return repo
+
+
+def test_index_and_tree_files_are_equal(get_repo):
+    git = Git(project_root=get_repo.root)
+
+    index_files = list(git.iter_index_files(chunk_size=7))
+    tree_files = list(git.iter_tree_files())
+
+    assert index_files
+    assert sorted(index_files) == sorted(tree_files)
+    assert git.get_tracked_files() == index_files
+
+
+def test_staged_files_are_tracked(get_repo):
+    staged_file = os.path.join("sub dir", "staged file.json")
+    os.makedirs(os.path.join(get_repo.root, "sub dir"))
+    with open(
+        os.path.join(get_repo.root, staged_file), "w", encoding="utf-8"
+    ) as file:
+        file.write("{}")
+    get_repo.repo.git.add(staged_file)
+
+    git = Git(project_root=get_repo.root)
+
+    assert staged_file in git.get_tracked_files()
+    assert staged_file not in git.iter_tree_files()
+
+
+def test_tracked_files_of_empty_repository():
+    repo = TemporaryRepository()
+    with open(os.path.join(repo.root, "pom.xml"), "w", encoding="utf-8"):
+        pass
+    repo.repo.git.add("pom.xml")
+
+    git = Git(project_root=repo.root)
+
+    assert git.get_tracked_files() == ["pom.xml"]
+
+
+def test_commit_files(get_repo):
+    git = Git(project_root=get_repo.root)
+    commit = git.get_current_commit_hash()
+
+    files = git.get_commit_files(commit)
+
+    assert sorted(files) == sorted(git.iter_tree_files())
+    for file, blob_hash in files.items():
+        content = git.read_blob(blob_hash)
+        with open(os.path.join(get_repo.root, file), "rb") as blob_file:
+            assert content == blob_file.read()
+        assert Git.get_blob_hash(os.path.join(get_repo.root, file)) == (
+            blob_hash
+        )
+
+
+@pytest.mark.parametrize("walk_tree", [False, True])
+def test_data_dir_is_not_tracked(monkeypatch, get_repo, walk_tree):
+    blob_file = os.path.join(".cfgnet", "blobs", "pom.xml")
+    os.makedirs(os.path.join(get_repo.root, ".cfgnet", "blobs"))
+    with open(
+        os.path.join(get_repo.root, blob_file), "w", encoding="utf-8"
+    ) as file:
+        file.write("<project/>")
+    get_repo.repo.git.add("--force", blob_file)
+    get_repo.repo.git.commit("-m", "Commit data directory")
+
+    git = Git(project_root=get_repo.root)
+    if walk_tree:
+
+        def fail(*args, **kwargs):
+            raise OSError("index is not readable")
+
+        monkeypatch.setattr(git, "iter_index_files", fail)
+
+    assert blob_file in git.iter_tree_files()
+    assert blob_file not in git.get_tracked_files()
+    assert "pom.xml" in git.get_tracked_files()
@@ -0,0 +1,144 @@
+# This file is part of the CfgNet module.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import pytest
+
+from git.exc import GitCommandError
+from cfgnet.vcs.git import Git
+from cfgnet.vcs.git_history import GitHistory
+from tests.utility.temporary_repository import TemporaryRepository
+
+
+@pytest.fixture(name="get_repo")
+def get_repo_():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+    return repo
+
+
+def iterate(history: GitHistory):
+    commits = [history.restore_initial_commit()]
+    while history.has_next_commit():
+        commits.append(history.next_commit())
+    return [commit.hexsha for commit in commits]
+
+
+def test_commits_oldest_first(get_repo):
+    expected = [commit.hexsha for commit in get_repo.get_commit_history()]
+    git = Git(project_root=get_repo.root)
+
+    assert list(GitHistory(git).iter_commit_hashes()) == expected
+    assert iterate(GitHistory(git, checkout=False)) == expected
+
+
+def test_checkout(get_repo):
+    git = Git(project_root=get_repo.root)
+    first = get_repo.get_commit_history()[0].hexsha
+    history = GitHistory(git)
+
+    history.restore_initial_commit()
+
+    assert git.get_current_commit_hash() == first
+    assert history.commit_index == 0
+
+
+def test_without_checkout(get_repo):
+    git = Git(project_root=get_repo.root)
+    head = git.get_current_commit_hash()
+
+    iterate(GitHistory(git, checkout=False))
+
+    assert git.get_current_commit_hash() == head
+
+
+def test_max_commits(get_repo):
+    expected = [commit.hexsha for commit in get_repo.get_commit_history()]
+    git = Git(project_root=get_repo.root)
+
+    history = GitHistory(git, checkout=False, max_commits=2)
+
+    assert iterate(history) == expected[:2]
+    assert not history.has_next_commit()
+
+
+def test_since_and_until(get_repo):
+    git = Git(project_root=get_repo.root)
+
+    assert not list(GitHistory(git, since="2090-01-01").iter_commit_hashes())
+    assert not list(GitHistory(git, until="1971-01-01").iter_commit_hashes())
+    assert len(list(GitHistory(git, since="1971-01-01").iter_commit_hashes()))
+
+
+def test_empty_date_window(get_repo):
+    git = Git(project_root=get_repo.root)
+    head = git.get_current_commit_hash()
+    history = GitHistory(git, since="2090-01-01")
+
+    assert not history.has_next_commit()
+    with pytest.raises(IndexError):
+        history.restore_initial_commit()
+    assert git.get_current_commit_hash() == head
+
+
+def test_invalid_date(get_repo):
+    git = Git(project_root=get_repo.root)
+
+    with pytest.raises(GitCommandError, match="not a valid timestamp"):
+        list(GitHistory(git, since="not a date").iter_commit_hashes())
+    with pytest.raises(GitCommandError, match="not a valid timestamp"):
+        list(GitHistory(git, until="not a date").iter_commit_hashes())
+
+
+def test_git_failure(get_repo):
+    # a missing commit object makes `rev-list` fail after it started
+    first = get_repo.get_commit_history()[0].hexsha
+    os.remove(
+        os.path.join(get_repo.root, ".git", "objects", first[:2], first[2:])
+    )
+    git = Git(project_root=get_repo.root)
+
+    with pytest.raises(GitCommandError):
+        list(GitHistory(git).iter_commit_hashes())
+
+
+def test_stop_early(get_repo):
+    git = Git(project_root=get_repo.root)
+    hashes = GitHistory(git).iter_commit_hashes()
+
+    next(hashes)
+    hashes.close()
+
+    assert len(list(GitHistory(git, max_commits=1).iter_commit_hashes())) == 1
+
+
+def test_first_parent(get_repo):
+    repo = get_repo.repo
+    base = repo.head.commit.hexsha
+    branch = repo.active_branch.name
+
+    repo.git.checkout("-b", "topic")
+    repo.git.commit("--allow-empty", "-m", "Feature")
+    repo.git.checkout(branch)
+    repo.git.commit("--allow-empty", "-m", "Main")
+    repo.git.merge("--no-ff", "-m", "Merge feature", "topic")
+
+    git = Git(project_root=get_repo.root)
+    all_commits = list(GitHistory(git).iter_commit_hashes())
+    mainline = list(GitHistory(git, first_parent=True).iter_commit_hashes())
+
+    assert len(all_commits) == len(mainline) + 1
+    assert repo.commit("topic").hexsha not in mainline
+    assert base in mainline
+    assert mainline[-1] == repo.head.commit.hexsha
@@ -14,6 +14,7 @@
 # this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import json
 from tempfile import TemporaryDirectory
 import pytest
 
@@ -69,9 +70,128 @@ def test_commands(get_repo):
         assert result_export_dot.exit_code == 0
 
 
+def test_cache_commands(get_repo):
+    runner.invoke(main, ["init", get_repo.root])
+
+    result_stats: Result = runner.invoke(main, ["cache", "stats", get_repo.root])
+    assert result_stats.exit_code == 0
+    assert "Entries: 0" not in result_stats.output
+
+    runner.invoke(main, ["checkconstraints", get_repo.root])
+    constraint_cache = os.path.join(
+        get_repo.root, ".cfgnet", "constraints.json"
+    )
+    assert os.path.isfile(constraint_cache)
+
+    result_clear: Result = runner.invoke(main, ["cache", "clear", get_repo.root])
+    assert result_clear.exit_code == 0
+
+    result_stats = runner.invoke(main, ["cache", "stats", get_repo.root])
+    assert "Entries: 0" in result_stats.output
+    assert not os.path.exists(constraint_cache)
+
+
+def test_checkconstraints_command(get_repo):
+    runner.invoke(main, ["init", get_repo.root])
+
+    result: Result = runner.invoke(
+        main, ["checkconstraints", "--jobs", "2", get_repo.root]
+    )
+    assert result.exit_code == 1
+    assert os.path.isfile(
+        os.path.join(get_repo.root, ".cfgnet", "constraints.json")
+    )
+
+    result_serial: Result = runner.invoke(
+        main, ["checkconstraints", get_repo.root]
+    )
+    assert result_serial.output.count("Constraint Violation") == (
+        result.output.count("Constraint Violation")
+    )
+
+
 def test_linker_options():
     result: Result = runner.invoke(
         main, ["init", ROOT_DIR, "--disable-linker", "equality"]
     )
     assert len(LinkerManager.enabled_linkers) == 0
     assert result.exit_code == 0
+
+
+def test_route_command():
+    result: Result = runner.invoke(main, ["route", "path/to/Dockerfile"])
+    assert result.exit_code == 0
+    assert "docker (DockerPlugin, file name 'Dockerfile')" in result.output
+
+    result_none: Result = runner.invoke(main, ["route", "path/to/README.md"])
+    assert result_none.exit_code == 1
+    assert "no responsible plugin" in result_none.output
+
+
+def test_diff_command():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+
+    result: Result = runner.invoke(main, ["diff", "HEAD~2", "HEAD~1", repo.root])
+    assert result.exit_code == 0
+    assert "~ application.properties: server.port = 8888 -> 8000" in result.output
+
+    result_json: Result = runner.invoke(
+        main, ["diff", "--output-format=json", "HEAD", "HEAD", repo.root]
+    )
+    assert result_json.exit_code == 0
+    assert '"modified_options": []' in result_json.output
+
+    result_invalid: Result = runner.invoke(main, ["diff", "HEAD", "unknown", repo.root])
+    assert result_invalid.exit_code == 1
+
+
+def test_history_command():
+    repo = TemporaryRepository("tests/test_repos/port_db_repo")
+
+    result_missing: Result = runner.invoke(main, ["history", "server.port", repo.root])
+    assert result_missing.exit_code == 1
+
+    runner.invoke(main, ["analyze", repo.root])
+    result: Result = runner.invoke(main, ["history", "-n1", "server.port", repo.root])
+    assert result.exit_code == 0
+    assert "modified application.properties: server.port = 8888 -> 8000" in result.output
+    assert len(result.output.splitlines()) == 1
+
+    result_nested: Result = runner.invoke(
+        main,
+        [
+            "history",
+            "-n1",
+            "services.docker-mysql.environment.MYSQL_USER",
+            repo.root,
+        ],
+    )
+    assert result_nested.exit_code == 0
+    assert "MYSQL_USER = dev_user -> user" in result_nested.output
+
+
+def test_profile_option(get_repo):
+    result: Result = runner.invoke(main, ["init", "--profile", get_repo.root])
+    assert result.exit_code == 0
+    assert "plugin_parsing" in result.output
+
+    profile_path = os.path.join(get_repo.root, ".cfgnet", "profile.json")
+    with open(profile_path, "r", encoding="utf-8") as profile_file:
+        profile = json.load(profile_file)
+
+    assert set(profile["phases"]) == {
+        "git_enumeration",
+        "ignore_filter",
+        "file_routing",
+        "plugin_parsing",
+        "linking",
+        "constraint_types",
+        "save",
+    }
+    assert profile["plugins"]["docker"]["files"] == 1
+    assert profile["plugins"]["maven"]["nodes"] > 0
+
+    runner.invoke(main, ["validate", "--cprofile", get_repo.root])
+    assert os.path.isfile(
+        os.path.join(get_repo.root, ".cfgnet", "profile", "linking.prof")
+    )